@@ -18,7 +18,19 @@ GLM_CONFIG = {
     # 请求参数
     'temperature': 0.7,
     'max_tokens': 2000,
-    'timeout': 30
+    'timeout': 30,
+    
+    # 同时进行中的API请求上限（相互独立的摘要、分类等调用并行执行）
+    'max_concurrency': 4
+}
+
+# GLM API重试策略（utils/retry_policy.py）
+RETRY_CONFIG = {
+    'max_attempts': 4,     # 单次调用最大尝试次数（含首次）
+    'base_delay': 2.0,     # 退避基准时间（秒），带随机抖动按指数增长
+    'max_delay': 30.0,     # 单次退避等待上限（秒）
+    'call_budget': 150.0,  # 单次调用（含重试和等待）总时间预算（秒）
+    'run_budget': 600.0    # 整个运行所有GLM调用的总时间预算（秒）
 }
 
 # 新闻源配置 - 全球主流网络安全新闻网站
@@ -99,20 +111,21 @@ SECURITY_KEYWORDS = [
     '防护', '防御', '加密', '解密', '隐私', '数据泄露', '网络安全',
     '信息安全', '网络攻击', '网络防护', '网络威胁', '安全漏洞',
     '安全事件', '安全威胁', '安全防护', '安全检测', '数据安全',
+    '钓鱼', '木马', '后门', '提权',
     
     # 英文关键词
     'security', 'vulnerability', 'attack', 'hacker', 'malware', 'ransomware',
     'penetration', 'exploit', 'breach', 'threat', 'phishing', 'trojan',
     'backdoor', 'privilege', 'escalation', 'injection', 'XSS', 'CSRF',
     'APT', 'DDoS', 'botnet', 'zero-day', 'CVE', 'RCE', 'SSRF',
-    'cybersecurity', 'infosec', 'netsec'
+    'cybersecurity', 'infosec', 'netsec', 'cybercriminal'
 ]
 
 # 新闻分类配置 - 四个维度
 NEWS_CATEGORIES = {
     '安全风险': {
         'icon': 'warning',
-        'keywords': ['漏洞', '威胁', 'CVE', 'RCE', 'vulnerability', 'threat', 'exploit', 'zero-day', '0day', '风险'],
+        'keywords': ['漏洞', '威胁', 'CVE', 'RCE', 'vulnerability', 'threat', 'exploit', 'zero-day', '0day', '风险', 'risk'],
         'description': '安全漏洞、威胁情报、风险评估等'
     },
     '安全事件': {
@@ -122,7 +135,7 @@ NEWS_CATEGORIES = {
     },
     '安全舆情': {
         'icon': 'megaphone',
-        'keywords': ['政策', '法规', '监管', '合规', '标准', 'policy', 'regulation', 'compliance', '舆论', '报告'],
+        'keywords': ['政策', '法规', '监管', '合规', '标准', 'policy', 'regulation', 'compliance', '舆论', '报告', 'report'],
         'description': '政策法规、行业报告、舆论动态等'
     },
     '安全趋势': {
@@ -135,7 +148,7 @@ NEWS_CATEGORIES = {
 # 提示词模板
 PROMPT_TEMPLATES = {
     'select_top_news': """
-请从以下全球网络安全新闻中精选出最重要的10篇新闻，要求覆盖全球视野，不能仅限于中国新闻：
+请从以下全球网络安全新闻中精选出最重要的10篇新闻，要求覆盖全球视野，不能仅限于中国新闻。每条新闻开头方括号内的数字是新闻编号：
 
 {news_text}
 
@@ -155,6 +168,7 @@ PROMPT_TEMPLATES = {
 {{
     "selected_news": [
         {{
+            "id": "新闻编号（与输入中方括号内的数字完全一致）",
             "title": "中文新闻标题（如果原文是英文则翻译）",
             "source": "新闻来源",
             "region": "地区",
@@ -165,7 +179,7 @@ PROMPT_TEMPLATES = {
 }}
 
 要求：
-1. 必须精选10篇新闻
+1. 必须精选10篇新闻，每篇都要给出正确的新闻编号
 2. 确保全球视野，包含国际新闻
 3. 所有输出必须使用中文
 4. 英文新闻标题必须翻译成中文
@@ -273,6 +287,41 @@ PROMPT_TEMPLATES = {
 3. 公司产品名保留英文但加中文说明
 4. 所有分析内容必须用中文表述
 5. 确保专业性和准确性
+""",
+
+    'translate_batch': """
+请将以下英文网络安全新闻逐条翻译成中文并进行专业分析。新闻以JSON数组给出，每条带有唯一的id：
+
+{items}
+
+请按以下格式输出JSON，translations 中每个元素对应一条输入新闻，id 必须与输入中的id完全一致：
+{{
+    "translations": [
+        {{
+            "id": "输入中的id",
+            "chinese_title": "中文标题",
+            "summary": "详细中文内容摘要（200-300字，包含具体技术细节、影响范围、解决方案等完整信息）",
+            "key_points": ["关键点1（中文）", "关键点2（中文）", "关键点3（中文）"],
+            "impact_analysis": "影响分析（中文）",
+            "threat_level": "威胁等级（高危/中危/低危）"
+        }}
+    ]
+}}
+
+翻译要求：
+1. 每条输入新闻都必须输出，不要合并、遗漏或改写id
+2. 标题必须翻译成准确的中文
+3. 技术术语统一翻译：
+   - Zero-Day → 零日漏洞
+   - Vulnerability → 漏洞
+   - Exploit → 利用
+   - Ransomware → 勒索软件
+   - Malware → 恶意软件
+   - Phishing → 钓鱼攻击
+   - APT → 高级持续性威胁
+4. 公司产品名保留英文但加中文说明
+5. 所有分析内容必须用中文表述
+6. 确保JSON格式完全正确，不要有语法错误
 """
 }
 
@@ -281,4 +330,65 @@ LOG_CONFIG = {
     'level': 'INFO',
     'format': '%(asctime)s - %(levelname)s - %(message)s',
     'file': 'glm_news.log'
-}
\ No newline at end of file
+}
+
+# RSS抓取配置
+FETCH_CONFIG = {
+    'max_workers': 8,          # 并发抓取线程数
+    'timeout': 15,             # 单个源请求超时（秒）
+    'deadline': 60,            # 整个抓取阶段截止时间（秒）
+    'per_host_interval': 2.0,  # 同一主机两次请求的最小间隔（秒）
+    'feed_cache_dir': 'output/cache/feeds',  # RSS条件请求缓存目录，设为空禁用
+    'article_workers': 8,                    # 并行抓取文章的最大在途请求数
+    'per_domain_article_rate': 1.0           # 同一域名每秒允许的文章请求数
+}
+
+# 持久化缓存配置
+CACHE_CONFIG = {
+    'article_cache_path': 'output/cache/articles.sqlite3',  # 文章内容缓存，设为空禁用
+    'article_ttl': 7 * 24 * 3600,                           # 文章缓存有效期（秒）
+    'article_max_entries': 5000,                            # 文章缓存最大条目数
+    'llm_cache_path': 'output/cache/llm_responses.sqlite3', # GLM响应缓存，设为空禁用
+    'llm_ttl': 24 * 3600,                                   # GLM响应有效期（秒），覆盖当天重跑
+    'llm_max_entries': 2000,                                # GLM响应缓存最大条目数
+    'llm_max_bytes': 50 * 1024 * 1024                       # GLM响应缓存总大小上限（字节）
+}
+
+# 近似去重配置
+DEDUP_CONFIG = {
+    'enabled': True,
+    'index_path': 'output/cache/near_dup_index.json',  # 已报道新闻指纹，设为空则不抑制往日旧闻
+    'max_distance': 10,                                # SimHash判定重复的最大汉明距离（64位）
+    'history_days': 3                                  # 往日指纹保留天数
+}
+
+# 预排序配置
+PRE_RANK_CONFIG = {
+    'top_n': 30,                   # 进入全文抓取和GLM精选的候选数
+    'recency_half_life_days': 2.0  # 时效性得分半衰期（天）
+}
+
+# 提示词token预算配置（src/core/prompt_builder.py），正文按预排序得分成比例分配预算
+PROMPT_BUDGET_CONFIG = {
+    'select_token_budget': 6000,       # 新闻精选提示词（含模板）估算token上限
+    'select_max_item_tokens': 200,     # 精选时每条新闻正文最多token数
+    'analysis_token_budget': 8000,     # 摘要与分类提示词估算token上限
+    'analysis_max_item_tokens': 600,   # 摘要与分类时每条新闻正文最多token数
+    'min_item_tokens': 30,             # 每条新闻正文至少保留的token数
+    'analysis_max_tokens': 4000,       # 分类要素总结的最大输出token数
+    'output_tokens_per_item': 400      # 分类要素总结中每条新闻预留的输出token数
+}
+
+# 英文新闻批量翻译配置
+TRANSLATION_CONFIG = {
+    'content_chars': 800,            # 每条新闻参与翻译的正文最大字符数
+    'input_token_budget': 6000,      # 每批提示词（含模板）的估算token上限
+    'output_tokens_per_item': 450,   # 每条翻译结果预留的输出token数
+    'max_tokens': 4000               # 每批请求的最大输出token数，决定每批最多容纳的条数
+}
+
+# 流水线检查点配置（src/core/checkpoint.py），各阶段结果保存在 runs_dir/<run_id>/ 下，配合 --resume 使用
+CHECKPOINT_CONFIG = {
+    'enabled': True,
+    'runs_dir': 'output/runs'
+}
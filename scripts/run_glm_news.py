@@ -35,7 +35,8 @@ def run_with_glm():
             api_key = GLM_CONFIG.get('api_key')
         
         generator = GLMNewsGenerator(api_key)
-        result = generator.generate_daily_report(days_back=1)
+        # --resume：从上次失败运行的检查点继续（output/runs）
+        result = generator.generate_daily_report(days_back=1, resume='--resume' in sys.argv[1:])
         
         if result:
             print(f"🎉 AI智能新闻快报生成成功: {result}")
@@ -7,12 +7,30 @@
 
 import os
 import re
+import sys
 import glob
 from datetime import datetime
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.report_metadata import load_report_metadata, report_date
+
 def extract_news_info(filepath):
-    """从新闻文件中提取信息"""
+    """从新闻文件中提取信息（优先读取快报元数据JSON，旧快报解析HTML）"""
+    metadata = load_report_metadata(filepath)
+    date_obj = report_date(metadata) if metadata else None
+    if date_obj is not None:
+        summary = metadata.get('summary') or ''
+        return {
+            'filepath': filepath,
+            'filename': os.path.basename(filepath),
+            'title': metadata.get('title') or "海之安每日网络安全快报",
+            'date': date_obj.strftime('%Y年%m月%d日'),
+            'date_obj': date_obj,
+            'summary': summary[:200] + "..." if summary else metadata.get('headline', '')
+        }
+    
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+报告生成流水线的阶段检查点
+每次运行在 output/runs/<run_id>/ 下保存各阶段结果（RSS新闻、补全正文后的候选、精选、英文新闻翻译、摘要、分类），
+中途失败后可用 --resume 从最后一个完成的阶段继续，已抓取的新闻和已完成的GLM调用不会丢失
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('feeds', 'articles', 'selection', 'translation', 'summary', 'categories')
+MANIFEST_FILE = 'manifest.json'
+
+
+def _encode(value: Any) -> Any:
+    """JSON无法直接表示的日期类型编码为带标记的字典，其余对象转为字符串"""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    return str(value)
+
+
+def _decode(obj: dict) -> Any:
+    if '__datetime__' in obj and len(obj) == 1:
+        return datetime.fromisoformat(obj['__datetime__'])
+    if '__date__' in obj and len(obj) == 1:
+        return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+class RunCheckpoint:
+    """一次报告生成运行的检查点目录"""
+
+    def __init__(self, run_id: str, root: str = 'output/runs'):
+        """
+        初始化检查点（目录不存在时创建）
+
+        Args:
+            run_id: 运行ID，形如 20251017-083000（报告日期-开始时间）
+            root: 所有运行的检查点根目录
+        """
+        self.run_id = run_id
+        self.root = root
+        self.path = os.path.join(root, run_id)
+        os.makedirs(self.path, exist_ok=True)
+        self.manifest = self._load_manifest()
+        # 摘要和分类阶段并行执行，保存清单时需要加锁
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, target_date: str, root: str = 'output/runs') -> 'RunCheckpoint':
+        """
+        为报告日期创建新的运行
+
+        Args:
+            target_date: 报告日期（YYYYMMDD）
+            root: 检查点根目录
+
+        Returns:
+            新的检查点
+        """
+        return cls(f"{target_date}-{datetime.now().strftime('%H%M%S')}", root)
+
+    @classmethod
+    def find_resumable(cls, target_date: Optional[str] = None, root: str = 'output/runs') -> Optional['RunCheckpoint']:
+        """
+        查找最近一次未完成的运行
+
+        Args:
+            target_date: 只查找该报告日期（YYYYMMDD）的运行，为None时不限日期
+            root: 检查点根目录
+
+        Returns:
+            检查点，没有可恢复的运行时返回None
+        """
+        if not os.path.isdir(root):
+            return None
+        for run_id in sorted(os.listdir(root), reverse=True):
+            if target_date and not run_id.startswith(f"{target_date}-"):
+                continue
+            if not os.path.isfile(os.path.join(root, run_id, MANIFEST_FILE)):
+                continue
+            checkpoint = cls(run_id, root)
+            if not checkpoint.manifest.get('finished'):
+                return checkpoint
+        return None
+
+    def _load_manifest(self) -> dict:
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"检查点清单读取失败，将重新生成: {e}")
+        return {'run_id': self.run_id, 'created': datetime.now().isoformat(timespec='seconds'),
+                'stages': {}, 'finished': None}
+
+    def _write_json(self, filename: str, data: Any):
+        """原子写入，进程中断时不会留下半个文件"""
+        target = os.path.join(self.path, filename)
+        tmp_path = target + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=_encode)
+        os.replace(tmp_path, target)
+
+    def has(self, stage: str) -> bool:
+        """阶段是否已完成"""
+        return stage in self.manifest['stages'] and os.path.exists(os.path.join(self.path, f"{stage}.json"))
+
+    def load(self, stage: str) -> Any:
+        """
+        读取阶段结果
+
+        Args:
+            stage: 阶段名称（见 STAGES）
+
+        Returns:
+            保存时的结果（日期字段还原为 date/datetime）
+        """
+        with open(os.path.join(self.path, f"{stage}.json"), 'r', encoding='utf-8') as f:
+            return json.load(f, object_hook=_decode)
+
+    def save(self, stage: str, data: Any):
+        """
+        保存阶段结果并登记到清单
+
+        Args:
+            stage: 阶段名称（见 STAGES）
+            data: 阶段结果（可JSON序列化，日期类型会自动编码）
+        """
+        self._write_json(f"{stage}.json", data)
+        with self._lock:
+            self.manifest['stages'][stage] = datetime.now().isoformat(timespec='seconds')
+            self._write_json(MANIFEST_FILE, self.manifest)
+
+    def completed_stages(self) -> List[str]:
+        """已完成的阶段，按流水线顺序排列"""
+        return [stage for stage in STAGES if self.has(stage)]
+
+    def finish(self, report_path: str):
+        """
+        标记本次运行已完成
+
+        Args:
+            report_path: 生成的报告文件路径
+        """
+        with self._lock:
+            self.manifest['finished'] = datetime.now().isoformat(timespec='seconds')
+            self.manifest['report'] = report_path
+            self._write_json(MANIFEST_FILE, self.manifest)
@@ -9,18 +9,42 @@ import os
 import glob
 import json
 import re
+import sys
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 import logging
 
+try:
+    from src.core.report_manifest import ReportManifest
+    from src.core.report_metadata import load_report_metadata, report_date
+    from src.utils.static_assets import externalize_inline_style
+except ImportError:
+    from report_manifest import ReportManifest
+    from report_metadata import load_report_metadata, report_date
+    # 在 src/core 目录下直接运行时，从项目根目录导入 src/utils 中的模块
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.utils.static_assets import externalize_inline_style
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 快报元数据清单，提取逻辑变化时递增版本号
+# 清单按HTML文件的变化判断是否重新提取，快报元数据JSON总是先于HTML写入
+MANIFEST_PATH = os.path.join('output', 'cache', 'index_manifest.json')
+MANIFEST_VERSION = '2'
+SUMMARY_LENGTH = 200
+
 class IndexGenerator:
-    def __init__(self):
-        """初始化index生成器"""
+    def __init__(self, manifest_path: str = MANIFEST_PATH):
+        """
+        初始化index生成器
+        
+        Args:
+            manifest_path: 快报元数据清单路径
+        """
         self.news_files = []
         self.latest_news_data = []
+        self.manifest = ReportManifest(manifest_path, self.parse_news_file, version=MANIFEST_VERSION)
         
     def scan_news_files(self):
         """扫描所有新闻文件"""
@@ -34,8 +58,25 @@ class IndexGenerator:
         logger.info(f"发现 {len(files)} 个新闻文件")
         return files
     
-    def extract_news_summary(self, file_path, max_length=200):
-        """从新闻文件中提取摘要信息"""
+    def extract_news_summary(self, file_path, max_length=SUMMARY_LENGTH):
+        """从新闻文件中提取摘要信息（默认长度的摘要读取快报清单，文件变化时才重新解析）"""
+        if max_length == SUMMARY_LENGTH:
+            news_data = self.manifest.lookup(file_path)
+        else:
+            news_data = self.parse_news_file(file_path, max_length)
+        if news_data is None:
+            return None
+        
+        news_data = dict(news_data, file=file_path)
+        news_data['date_obj'] = datetime.fromisoformat(news_data.pop('date_iso')) if news_data.get('date_iso') else datetime.min
+        return news_data
+    
+    def parse_news_file(self, file_path, max_length=SUMMARY_LENGTH):
+        """提取标题、摘要和日期：优先读取快报元数据JSON，旧快报解析HTML（结果可JSON序列化，写入快报清单）"""
+        news_data = self._summary_from_metadata(file_path, max_length)
+        if news_data is not None:
+            return news_data
+        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -63,6 +104,7 @@ class IndexGenerator:
                 summary = summary[:max_length] + "..."
             
             # 提取日期
+            date_obj = None
             date_match = re.search(r'news(\d{8})\.html', file_path)
             if date_match:
                 date_str = date_match.group(1)
@@ -75,17 +117,33 @@ class IndexGenerator:
                 formatted_date = "未知日期"
             
             return {
-                'file': file_path,
                 'title': title,
                 'summary': summary,
                 'date': formatted_date,
-                'date_obj': date_obj if 'date_obj' in locals() else datetime.min
+                'date_iso': date_obj.isoformat() if date_obj else None
             }
             
         except Exception as e:
             logger.error(f"提取新闻摘要失败 {file_path}: {e}")
             return None
     
+    def _summary_from_metadata(self, file_path, max_length):
+        """从快报元数据JSON构建摘要信息，没有元数据时返回None"""
+        metadata = load_report_metadata(file_path)
+        date_obj = report_date(metadata) if metadata else None
+        if date_obj is None:
+            return None
+        
+        summary = metadata.get('summary') or "暂无摘要信息"
+        if len(summary) > max_length:
+            summary = summary[:max_length] + "..."
+        return {
+            'title': metadata.get('title') or "未知标题",
+            'summary': summary,
+            'date': date_obj.strftime('%Y年%m月%d日'),
+            'date_iso': date_obj.isoformat()
+        }
+    
     def get_latest_news(self, count=6):
         """获取最新的新闻数据"""
         self.scan_news_files()
@@ -96,6 +154,10 @@ class IndexGenerator:
             if news_data:
                 latest_news.append(news_data)
         
+        self.manifest.prune(self.news_files)
+        self.manifest.save()
+        self.manifest.log_stats()
+        
         self.latest_news_data = latest_news
         return latest_news
     
@@ -270,6 +332,9 @@ class IndexGenerator:
                 template_content
             )
             
+            # 内联样式发布为带内容哈希的共享样式表（assets/css/index.<哈希>.css），页面改为引用
+            template_content = externalize_inline_style(template_content, 'index')
+            
             # 保存更新后的文件
             with open(template_path, 'w', encoding='utf-8') as f:
                 f.write(template_content)
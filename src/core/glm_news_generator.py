@@ -10,11 +10,23 @@ import json
 from datetime import datetime, timedelta
 import logging
 import os
+import sys
 from typing import List, Dict
 import feedparser
 from bs4 import BeautifulSoup
 import time
 
+try:
+    from src.utils.profiler import get_profiler, span
+    from src.utils.static_assets import publish_stylesheet
+    from src.utils.template_engine import render_template
+except ImportError:
+    # 在 src/core 目录下直接运行时，从项目根目录导入 src/utils 中的模块
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.utils.profiler import get_profiler, span
+    from src.utils.static_assets import publish_stylesheet
+    from src.utils.template_engine import render_template
+
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,
@@ -27,14 +39,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class GLMNewsGenerator:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, bypass_llm_cache: bool = None, inline_css: bool = None):
         """
         初始化GLM新闻生成器
         
         Args:
             api_key: 智谱GLM API密钥
+            bypass_llm_cache: 是否跳过GLM响应缓存强制重新生成，为None时读取环境变量 GLM_CACHE_BYPASS
+            inline_css: 是否把样式内联到快报中（单文件，用于邮件发送），为None时读取环境变量 NEWS_INLINE_CSS；
+                        默认引用 assets/css 下带内容哈希的共享样式表
         """
         self.api_key = api_key or os.getenv('GLM_API_KEY')
+        self.bypass_llm_cache = bypass_llm_cache
+        self.inline_css = inline_css if inline_css is not None else os.getenv('NEWS_INLINE_CSS') == '1'
         self.base_url = "https://open.bigmodel.cn/api/paas/v4/chat/completions"
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -116,11 +133,16 @@ class GLMNewsGenerator:
                 }
             ]
         
-        self.security_keywords = [
-            '安全', '漏洞', '攻击', '黑客', '病毒', '恶意软件', '勒索', '渗透',
-            '防护', '防御', '加密', '解密', '隐私', '数据泄露', '网络安全',
-            'APT', 'DDoS', '钓鱼', '木马', '后门', '提权', 'CVE', 'RCE'
-        ]
+        # 安全关键词和四维度分类关键词（config/glm_config.py）预编译为单次扫描的匹配器
+        from src.utils.keyword_matcher import get_default_matcher
+        self.keyword_matcher = get_default_matcher()
+    
+    def _get_enhanced_client(self):
+        """获取增强版GLM客户端（首次使用时创建，整个运行共享连接池、重试预算和响应缓存）"""
+        if not hasattr(self, '_enhanced_client'):
+            from utils.enhanced_glm_client import create_enhanced_glm_client
+            self._enhanced_client = create_enhanced_glm_client(self.api_key, bypass_cache=self.bypass_llm_cache)
+        return self._enhanced_client
     
     def call_glm_api(self, prompt: str, model: str = "glm-4-flash") -> str:
         """
@@ -133,11 +155,6 @@ class GLMNewsGenerator:
         Returns:
             生成的文本内容
         """
-        # 使用增强版GLM客户端
-        if not hasattr(self, '_enhanced_client'):
-            from utils.enhanced_glm_client import create_enhanced_glm_client
-            self._enhanced_client = create_enhanced_glm_client(self.api_key)
-        
         messages = [
             {
                 "role": "user",
@@ -145,7 +162,7 @@ class GLMNewsGenerator:
             }
         ]
         
-        result = self._enhanced_client.call_api(
+        result = self._get_enhanced_client().call_api(
             messages=messages,
             model=model,
             temperature=0.7,
@@ -166,9 +183,12 @@ class GLMNewsGenerator:
         Returns:
             包含完整文章信息的字典
         """
+        crawler = self._get_crawler()
+        if crawler is None:
+            logger.warning("增强爬虫模块未找到，使用备用方法")
+            return self._fallback_content_extraction(url, max_length)
+        
         try:
-            from src.crawlers.enhanced_crawler import EnhancedNewsCrawler
-            crawler = EnhancedNewsCrawler()
             result = crawler.extract_article_content(url, max_length)
             
             if result['success']:
@@ -178,30 +198,46 @@ class GLMNewsGenerator:
                 logger.warning(f"增强爬虫提取失败，使用备用方法: {url}")
                 return self._fallback_content_extraction(url, max_length)
                 
-        except ImportError:
-            try:
-                from enhanced_crawler import EnhancedNewsCrawler
-                crawler = EnhancedNewsCrawler()
-                result = crawler.extract_article_content(url, max_length)
-                
-                if result['success']:
-                    logger.info(f"成功提取文章内容: {result['title'][:50]}... ({result['char_count']}字符)")
-                    return result
-                else:
-                    logger.warning(f"增强爬虫提取失败，使用备用方法: {url}")
-                    return self._fallback_content_extraction(url, max_length)
-                    
-            except ImportError:
-                logger.warning("增强爬虫模块未找到，使用备用方法")
-                return self._fallback_content_extraction(url, max_length)
-        except Exception as e:
-            logger.warning(f"增强爬虫提取失败: {e}，使用备用方法")
-            return self._fallback_content_extraction(url, max_length)
-            return self._fallback_content_extraction(url, max_length)
         except Exception as e:
             logger.warning(f"增强爬虫提取失败: {e}，使用备用方法")
             return self._fallback_content_extraction(url, max_length)
     
+    def _get_crawler(self):
+        """
+        获取本次运行共享的增强爬虫，复用同一个会话和连接池
+        
+        Returns:
+            EnhancedNewsCrawler实例，模块不可用时返回None
+        """
+        if not hasattr(self, '_crawler'):
+            try:
+                from src.crawlers.enhanced_crawler import EnhancedNewsCrawler
+            except ImportError:
+                try:
+                    from enhanced_crawler import EnhancedNewsCrawler
+                except ImportError:
+                    return None
+            self._crawler = EnhancedNewsCrawler(cache=self._get_article_cache())
+        return self._crawler
+    
+    def close(self):
+        """
+        释放本次运行持有的网络会话和缓存连接
+        """
+        if hasattr(self, '_crawler'):
+            self._crawler.close()
+            del self._crawler
+        if hasattr(self, '_article_cache'):
+            if self._article_cache is not None:
+                self._article_cache.close()
+            del self._article_cache
+        if hasattr(self, '_deduplicator'):
+            del self._deduplicator
+        if hasattr(self, '_enhanced_client'):
+            self._enhanced_client.retry_policy.log_stats()
+            self._enhanced_client.close()
+            del self._enhanced_client
+    
     def _fallback_content_extraction(self, url: str, max_length: int = 3000) -> Dict:
         """
         备用内容提取方法
@@ -287,113 +323,349 @@ class GLMNewsGenerator:
         Returns:
             新闻列表
         """
+        # RSS新闻和补全正文后的候选分别保存检查点，GLM阶段失败时重跑无需重新抓取
+        unique_news = self._run_stage('feeds', lambda: self._fetch_feed_news(days_back), is_complete=bool)
+        ranked_news = self._run_stage('articles', lambda: self._rank_and_crawl(unique_news))
+        
+        logger.info(f"总共获取到 {len(unique_news)} 条不重复的安全新闻，{len(ranked_news)} 条进入精选")
+        return ranked_news
+    
+    def _fetch_feed_news(self, days_back: int) -> List[Dict]:
+        """
+        并发抓取全部RSS源，筛选安全新闻并去重
+        
+        Args:
+            days_back: 抓取几天前的新闻
+            
+        Returns:
+            去重后的新闻列表
+        """
         target_date = (datetime.now() - timedelta(days=days_back)).date()
         all_news = []
         
         logger.info(f"开始抓取 {target_date} 的网络安全新闻...")
         
-        for source in self.news_sources:
-            if not source.get('enabled', True):
+        enabled_sources = [source for source in self.news_sources if source.get('enabled', True)]
+        fetch_config = self._get_fetch_config()
+        
+        # 并发抓取所有RSS源，按主机限速并设置整体截止时间
+        from src.crawlers.feed_fetcher import ConcurrentFeedFetcher
+        from src.crawlers.feed_cache import FeedCache
+        from src.utils.rate_limiter import DomainRateLimiter
+        interval = fetch_config.get('per_host_interval', 2.0)
+        feed_cache = FeedCache(fetch_config['feed_cache_dir']) if fetch_config.get('feed_cache_dir') else None
+        fetcher = ConcurrentFeedFetcher(
+            max_workers=fetch_config.get('max_workers', 8),
+            timeout=fetch_config.get('timeout', 15),
+            deadline=fetch_config.get('deadline', 60),
+            rate_limiter=DomainRateLimiter(rate=1.0 / interval if interval > 0 else 0,
+                                           burst=1, max_concurrent_per_host=1),
+            feed_cache=feed_cache
+        )
+        try:
+            feed_results = fetcher.fetch_all(enabled_sources)
+        finally:
+            fetcher.close()
+        if feed_cache is not None:
+            feed_cache.log_stats()
+        
+        for result in feed_results:
+            if result['feed'] is None:
                 continue
-                
+            source = result['source']
             try:
-                logger.info(f"正在抓取 {source['name']} ({source.get('region', 'Unknown')}) 的RSS源...")
-                
-                # 设置请求头
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                
-                # 获取RSS内容
-                response = requests.get(source['rss_url'], headers=headers, timeout=15)
-                feed = feedparser.parse(response.content)
-                source_news = []
-                
-                for entry in feed.entries:
-                    # 解析发布时间
-                    pub_date = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6]).date()
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        pub_date = datetime(*entry.updated_parsed[:6]).date()
-                    
-                    # 检查是否为目标日期的新闻（允许3天内的新闻）
-                    if pub_date and (datetime.now().date() - pub_date).days <= 3:
-                        # 检查是否为安全相关新闻
-                        title = entry.title.lower()
-                        summary = getattr(entry, 'summary', '').lower()
-                        
-                        # 扩展关键词匹配逻辑
-                        is_security_related = any(keyword.lower() in title or keyword.lower() in summary 
-                                                for keyword in self.security_keywords)
-                        
-                        if is_security_related:
-                            # 获取文章完整内容
-                            article_data = {'content': '', 'title': entry.title, 'summary': ''}
-                            
-                            if hasattr(entry, 'content') and entry.content:
-                                # RSS中包含内容
-                                rss_content = entry.content[0].value if isinstance(entry.content, list) else str(entry.content)
-                                # 清理HTML标签
-                                soup = BeautifulSoup(rss_content, 'html.parser')
-                                article_data['content'] = soup.get_text(strip=True)
-                                article_data['summary'] = article_data['content'][:200] + "..." if len(article_data['content']) > 200 else article_data['content']
-                            elif entry.link:
-                                # 使用增强型爬虫抓取完整文章内容
-                                logger.info(f"正在使用增强爬虫抓取: {entry.title[:50]}...")
-                                article_data = self.fetch_article_content(entry.link)
-                                
-                                # 如果增强爬虫获取的标题更好，使用它
-                                if article_data.get('title') and len(article_data['title']) > len(entry.title):
-                                    entry.title = article_data['title']
-                            
-                            # 使用RSS摘要作为备选
-                            if not article_data.get('summary'):
-                                article_data['summary'] = getattr(entry, 'summary', '')
-                            
-                            news_item = {
-                                'title': entry.title,
-                                'link': entry.link,
-                                'summary': article_data.get('summary', ''),
-                                'content': article_data.get('content', ''),
-                                'enhanced_content': article_data.get('success', False),  # 标记是否使用了增强抓取
-                                'char_count': article_data.get('char_count', 0),
-                                'word_count': article_data.get('word_count', 0),
-                                'metadata': article_data.get('metadata', {}),
-                                'published_date': pub_date,
-                                'source': source['name'],
-                                'weight': source['weight'],
-                                'language': source.get('language', 'en'),
-                                'region': source.get('region', 'Unknown')
-                            }
-                            source_news.append(news_item)
-                
+                with span('feed.filter', source=source['name']):
+                    source_news = self._process_feed_entries(source, result['feed'])
                 logger.info(f"从 {source['name']} 获取到 {len(source_news)} 条安全新闻")
                 all_news.extend(source_news)
-                
-                # 避免请求过于频繁
-                time.sleep(2)
-                
             except Exception as e:
                 logger.error(f"抓取 {source['name']} 失败: {e}")
                 continue
         
-        # 去重和排序
-        unique_news = []
-        seen_titles = set()
+        # 去重（基于RSS中的标题和摘要，在抓取全文之前完成）
+        deduplicator = self._get_deduplicator()
+        if deduplicator:
+            # 近似去重：同一事件的多来源、改写报道只保留权重最高的一条，并抑制往日已报道的新闻
+            with span('dedup', candidates=len(all_news)):
+                unique_news = deduplicator.deduplicate(all_news)
+            deduplicator.log_stats()
+        else:
+            unique_news = []
+            seen_titles = set()
+            
+            for news in all_news:
+                # 使用标题的前50个字符进行去重，避免完全相同的标题
+                title_key = news['title'][:50].lower()
+                if title_key not in seen_titles:
+                    unique_news.append(news)
+                    seen_titles.add(title_key)
         
-        for news in all_news:
-            # 使用标题的前50个字符进行去重，避免完全相同的标题
-            title_key = news['title'][:50].lower()
-            if title_key not in seen_titles:
-                unique_news.append(news)
-                seen_titles.add(title_key)
+        return unique_news
+    
+    def _rank_and_crawl(self, unique_news: List[Dict]) -> List[Dict]:
+        """
+        预排序并补全排名靠前新闻的正文
         
-        # 按权重和时间排序，取前15条（增加数量以获得更好的选择）
-        unique_news.sort(key=lambda x: (x['weight'], x['published_date']), reverse=True)
+        Args:
+            unique_news: 去重后的新闻列表
+            
+        Returns:
+            进入精选的候选新闻
+        """
+        # 预排序：对全部候选低成本打分，只有前N条进入全文抓取和GLM精选
+        rank_config = self._get_pre_rank_config()
+        with span('pre_rank', candidates=len(unique_news)):
+            ranked_news = self._get_pre_ranker().rank(unique_news, top_n=rank_config.get('top_n', 30))
+        
+        # 并行补全RSS中缺少正文的文章
+        self._crawl_articles(ranked_news)
+        
+        if self._get_article_cache() is not None:
+            self._article_cache.log_stats()
+        
+        return ranked_news
+    
+    def _run_stage(self, stage: str, compute, is_complete=None):
+        """
+        执行流水线阶段：有检查点时直接读取已保存的结果，否则执行并保存
         
-        logger.info(f"总共获取到 {len(unique_news)} 条不重复的安全新闻")
-        return unique_news[:15]
+        Args:
+            stage: 阶段名称（见 src/core/checkpoint.py 中的 STAGES）
+            compute: 执行该阶段的无参函数
+            is_complete: 判断结果是否可以保存的函数（例如GLM调用失败、使用了备用结果时不保存，
+                         恢复运行时会重新执行该阶段）
+            
+        Returns:
+            阶段结果
+        """
+        checkpoint = getattr(self, '_checkpoint', None)
+        if checkpoint is not None and checkpoint.has(stage):
+            logger.info(f"⏩ 从检查点 {checkpoint.run_id} 恢复阶段: {stage}")
+            return checkpoint.load(stage)
+        
+        with span(f'stage.{stage}'):
+            result = compute()
+        if checkpoint is not None:
+            if is_complete is None or is_complete(result):
+                checkpoint.save(stage, result)
+            else:
+                logger.warning(f"阶段 {stage} 结果不完整，不保存检查点")
+        return result
+    
+    def _get_article_cache(self):
+        """
+        获取本次运行共享的文章内容缓存，未配置或不可用时返回None
+        """
+        if not hasattr(self, '_article_cache'):
+            self._article_cache = None
+            try:
+                from config.glm_config import CACHE_CONFIG
+                from src.crawlers.article_cache import ArticleCache
+                if CACHE_CONFIG.get('article_cache_path'):
+                    self._article_cache = ArticleCache(
+                        CACHE_CONFIG['article_cache_path'],
+                        ttl=CACHE_CONFIG.get('article_ttl', 7 * 24 * 3600),
+                        max_entries=CACHE_CONFIG.get('article_max_entries', 5000)
+                    )
+            except Exception as e:
+                logger.warning(f"文章缓存初始化失败，将直接抓取: {e}")
+        return self._article_cache
+    
+    def _get_deduplicator(self):
+        """
+        获取近似去重索引，未启用或不可用时返回None（退回标题前缀去重）
+        """
+        if not hasattr(self, '_deduplicator'):
+            self._deduplicator = None
+            try:
+                from config.glm_config import DEDUP_CONFIG
+                from src.utils.near_dedup import NearDuplicateIndex
+                if DEDUP_CONFIG.get('enabled', True):
+                    self._deduplicator = NearDuplicateIndex(
+                        DEDUP_CONFIG.get('index_path'),
+                        max_distance=DEDUP_CONFIG.get('max_distance', 10),
+                        history_days=DEDUP_CONFIG.get('history_days', 3)
+                    )
+            except Exception as e:
+                logger.warning(f"近似去重索引初始化失败，使用标题去重: {e}")
+        return self._deduplicator
+    
+    def _remember_reported_news(self, news_list: List[Dict]):
+        """
+        将已生成报告的新闻指纹写入去重索引，后续几天的同一事件不再重复报道
+        """
+        deduplicator = self._get_deduplicator()
+        if not deduplicator:
+            return
+        try:
+            deduplicator.remember(news_list)
+            deduplicator.save()
+        except Exception as e:
+            logger.warning(f"保存近似去重索引失败: {e}")
+    
+    def _get_pre_rank_config(self) -> Dict:
+        """
+        获取预排序配置
+        """
+        try:
+            from config.glm_config import PRE_RANK_CONFIG
+            return PRE_RANK_CONFIG
+        except ImportError:
+            return {}
+    
+    def _get_prompt_budget_config(self) -> Dict:
+        """
+        获取提示词token预算配置
+        """
+        try:
+            from config.glm_config import PROMPT_BUDGET_CONFIG
+            return PROMPT_BUDGET_CONFIG
+        except ImportError:
+            return {}
+    
+    def _get_pre_ranker(self):
+        """
+        获取预排序器，地区权重和源类别优先级来自新闻源配置文件
+        """
+        if not hasattr(self, '_pre_ranker'):
+            from src.core.pre_ranker import create_default_ranker
+            loader = getattr(self, 'sources_loader', None)
+            self._pre_ranker = create_default_ranker(
+                regional_weights=loader.get_regional_weights() if loader else {},
+                category_priorities=loader.get_category_priorities() if loader else {},
+                recency_half_life_days=self._get_pre_rank_config().get('recency_half_life_days', 2.0)
+            )
+        return self._pre_ranker
+    
+    def _get_fetch_config(self) -> Dict:
+        """
+        获取RSS抓取配置
+        """
+        try:
+            from config.glm_config import FETCH_CONFIG
+            return FETCH_CONFIG
+        except ImportError:
+            return {}
+    
+    def _process_feed_entries(self, source: Dict, feed) -> List[Dict]:
+        """
+        从已解析的RSS中筛选安全新闻并构建新闻条目
+        
+        RSS中不含正文的条目只记录链接，正文由 _crawl_articles 统一并行抓取。
+        
+        Args:
+            source: 新闻源配置
+            feed: feedparser解析结果
+            
+        Returns:
+            该源的新闻列表
+        """
+        source_news = []
+        
+        for entry in feed.entries:
+            # 解析发布时间
+            pub_date = None
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                pub_date = datetime(*entry.published_parsed[:6]).date()
+            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+                pub_date = datetime(*entry.updated_parsed[:6]).date()
+            
+            # 检查是否为目标日期的新闻（允许3天内的新闻）
+            if pub_date and (datetime.now().date() - pub_date).days <= 3:
+                # 检查是否为安全相关新闻（标题和摘要各扫描一次）
+                keyword_match = self.keyword_matcher.match(entry.title, getattr(entry, 'summary', ''))
+                
+                if keyword_match['relevant']:
+                    article_data = {'content': '', 'title': entry.title, 'summary': ''}
+                    needs_crawl = False
+                    
+                    if hasattr(entry, 'content') and entry.content:
+                        # RSS中包含内容
+                        rss_content = entry.content[0].value if isinstance(entry.content, list) else str(entry.content)
+                        # 清理HTML标签
+                        soup = BeautifulSoup(rss_content, 'html.parser')
+                        article_data['content'] = soup.get_text(strip=True)
+                        article_data['summary'] = article_data['content'][:200] + "..." if len(article_data['content']) > 200 else article_data['content']
+                    elif entry.link:
+                        # 稍后使用增强型爬虫抓取完整文章内容
+                        needs_crawl = True
+                    
+                    news_item = {
+                        'title': entry.title,
+                        'link': entry.link,
+                        'rss_summary': getattr(entry, 'summary', ''),
+                        'needs_crawl': needs_crawl,
+                        'published_date': pub_date,
+                        'source': source['name'],
+                        'weight': source['weight'],
+                        'language': source.get('language', 'en'),
+                        'region': source.get('region', 'Unknown'),
+                        'category': source.get('category', ''),
+                        'matched_keywords': keyword_match['keywords'],
+                        'keyword_hits': keyword_match['hits']
+                    }
+                    self._apply_article_data(news_item, article_data)
+                    source_news.append(news_item)
+        
+        return source_news
+    
+    def _apply_article_data(self, news_item: Dict, article_data: Dict):
+        """
+        将文章提取结果合并到新闻条目
+        
+        Args:
+            news_item: 新闻条目（就地更新）
+            article_data: 增强爬虫或RSS正文的提取结果
+        """
+        # 如果增强爬虫获取的标题更好，使用它
+        if article_data.get('title') and len(article_data['title']) > len(news_item['title']):
+            news_item['title'] = article_data['title']
+        
+        # 使用RSS摘要作为备选
+        news_item['summary'] = article_data.get('summary') or news_item.get('rss_summary', '')
+        news_item['content'] = article_data.get('content', '')
+        news_item['enhanced_content'] = article_data.get('success', False)  # 标记是否使用了增强抓取
+        news_item['char_count'] = article_data.get('char_count', 0)
+        news_item['word_count'] = article_data.get('word_count', 0)
+        news_item['metadata'] = article_data.get('metadata', {})
+    
+    def _crawl_articles(self, news_list: List[Dict]):
+        """
+        并行抓取需要补全正文的新闻，按域名限速，结果按完成顺序合并
+        
+        Args:
+            news_list: 新闻列表（就地更新）
+        """
+        pending = [news for news in news_list if news.pop('needs_crawl', False)]
+        by_link = {}
+        for news in pending:
+            by_link.setdefault(news['link'], []).append(news)
+        
+        if by_link:
+            crawler = self._get_crawler()
+            if crawler is None:
+                logger.warning("增强爬虫模块未找到，使用备用方法")
+                results = (self._fallback_content_extraction(link) for link in by_link)
+            else:
+                from src.utils.rate_limiter import DomainRateLimiter
+                fetch_config = self._get_fetch_config()
+                limiter = DomainRateLimiter(rate=fetch_config.get('per_domain_article_rate', 1.0),
+                                            burst=1, max_concurrent_per_host=2)
+                results = crawler.iter_extract_articles(
+                    list(by_link), max_workers=fetch_config.get('article_workers', 8), rate_limiter=limiter
+                )
+            
+            logger.info(f"正在使用增强爬虫并行抓取 {len(by_link)} 篇文章...")
+            for article_data in results:
+                link = article_data['url']
+                if not article_data.get('success'):
+                    logger.warning(f"增强爬虫提取失败，使用备用方法: {link}")
+                    article_data = self._fallback_content_extraction(link)
+                for news in by_link.get(link, []):
+                    self._apply_article_data(news, article_data)
+        
+        for news in news_list:
+            news.pop('rss_summary', None)
     
     def select_top_news(self, news_list: List[Dict]) -> List[Dict]:
         """
@@ -408,22 +680,6 @@ class GLMNewsGenerator:
         if len(news_list) <= 10:
             return news_list
         
-        # 构建新闻信息用于GLM分析
-        news_details = []
-        for i, news in enumerate(news_list):
-            content_preview = ""
-            if news.get('content'):
-                content_preview = news['content'][:200] + "..." if len(news['content']) > 200 else news['content']
-            elif news.get('summary'):
-                content_preview = news['summary'][:200] + "..." if len(news['summary']) > 200 else news['summary']
-            
-            news_detail = f"{i+1}. 【{news['source']} - {news.get('region', 'Unknown')}】{news['title']}\n"
-            if content_preview:
-                news_detail += f"   内容: {content_preview}\n"
-            news_details.append(news_detail)
-        
-        news_text = "\n".join(news_details)
-        
         # 使用GLM精选新闻
         try:
             from config.glm_config import PROMPT_TEMPLATES
@@ -433,30 +689,39 @@ class GLMNewsGenerator:
             import os
             sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
             from config.glm_config import PROMPT_TEMPLATES
-        # 使用增强版GLM客户端进行新闻精选
-        if not hasattr(self, '_enhanced_client'):
-            from utils.enhanced_glm_client import create_enhanced_glm_client
-            self._enhanced_client = create_enhanced_glm_client(self.api_key)
         
-        selected_news_data = self._enhanced_client.select_top_news(news_text)
+        # 构建新闻信息用于GLM分析：候选已按预排序得分降序排列，按token预算收录并分配正文长度
+        from src.core.prompt_builder import PromptBuilder
+        budget = self._get_prompt_budget_config()
+        entries = [
+            {
+                'header': f"[{i+1}] 【{news['source']} - {news.get('region', 'Unknown')}】{news['title']}\n",
+                'body': news.get('content') or news.get('summary') or '',
+                'score': news.get('pre_rank_score', news.get('weight', 1.0))
+            } for i, news in enumerate(news_list)
+        ]
+        builder = PromptBuilder(budget.get('select_token_budget', 6000),
+                                min_item_tokens=budget.get('min_item_tokens', 30),
+                                max_item_tokens=budget.get('select_max_item_tokens', 200))
+        news_text = builder.build(entries, PROMPT_TEMPLATES['select_top_news'], name="新闻精选")['news_text']
+        
+        # 使用增强版GLM客户端进行新闻精选
+        selected_news_data = self._get_enhanced_client().select_top_news(news_text)
         
-        # 解析精选结果
+        # 解析精选结果：按新闻编号对应，编号无效时按标题索引查找
         selected_indices = []
         try:
-            # 根据标题匹配找到对应的新闻索引
-            for selected in selected_news_data:
-                selected_title = selected['title']
-                for i, news in enumerate(news_list):
-                    if selected_title in news['title'] or news['title'] in selected_title:
-                        if i not in selected_indices:
-                            selected_indices.append(i)
-                        break
+            from src.core.title_index import resolve_selection
+            selected_indices = resolve_selection(selected_news_data, [news['title'] for news in news_list])
+            for i in selected_indices:
+                news_list[i]['glm_selected'] = True
             
         except Exception as e:
             logger.warning(f"新闻精选结果解析失败: {e}，使用默认选择")
-            # 默认选择：按权重和时间排序取前10条
+            # 默认选择：按预排序得分（没有时按权重）和时间排序取前10条
             sorted_news = sorted(enumerate(news_list), 
-                               key=lambda x: (x[1].get('weight', 0), x[1].get('published_date', datetime.min.date())), 
+                               key=lambda x: (x[1].get('pre_rank_score', x[1].get('weight', 0)),
+                                              x[1].get('published_date', datetime.min.date())), 
                                reverse=True)
             selected_indices = [i for i, _ in sorted_news[:10]]
         
@@ -483,54 +748,87 @@ class GLMNewsGenerator:
         if not news_list:
             return {"summary": "今日暂无网络安全新闻", "categories": {}}
         
-        # 首先精选10篇最重要的新闻
+        # 首先精选10篇最重要的新闻（GLM精选失败、全部由预排序补齐时不保存检查点）
         logger.info("正在使用GLM精选全球重要安全新闻...")
-        selected_news = self.select_top_news(news_list)
+        selected_news = self._run_stage(
+            'selection', lambda: self.select_top_news(news_list),
+            is_complete=lambda selected: len(news_list) <= 10 or any(news.get('glm_selected') for news in selected)
+        )
+        
+        # 精选出的英文新闻打包批量翻译（通常一次请求），译文标题和摘要随新闻一起提供给摘要与分类；
+        # 只有真实译文才会写回新闻，没有英文新闻、或至少一条得到译文时保存检查点，全部失败时恢复运行会重试
+        def translated(news_items):
+            english = [news for news in news_items if news.get('language') == 'en' and news.get('content')]
+            return not english or any(news.get('chinese_title') for news in english)
+        
+        selected_news = self._run_stage(
+            'translation', lambda: self.translate_english_news_batch(selected_news), is_complete=translated
+        )
         
         # 构建精选新闻的详细信息 - 利用增强爬虫获取的丰富内容
-        news_details = []
+        entries = []
         for i, news in enumerate(selected_news):
-            content_preview = ""
-            
             # 优先使用增强爬虫获取的完整内容
             if news.get('enhanced_content') and news.get('content'):
-                content_preview = news['content'][:500] + "..." if len(news['content']) > 500 else news['content']
+                body = news['content']
                 content_quality = "增强内容"
             elif news.get('summary'):
-                content_preview = news['summary']
+                body = news['summary']
                 content_quality = "RSS摘要"
             else:
-                content_preview = "内容获取失败"
+                body = "内容获取失败"
                 content_quality = "无内容"
             
-            news_detail = f"{i+1}. 【{news['source']} - {news.get('region', 'Unknown')}】{news['title']}\n"
-            news_detail += f"   内容质量: {content_quality} ({news.get('char_count', 0)}字符)\n"
-            if content_preview:
-                news_detail += f"   详细内容: {content_preview}\n"
-            news_detail += f"   语言: {news.get('language', 'unknown')}\n"
+            header = f"{i+1}. 【{news['source']} - {news.get('region', 'Unknown')}】{news['title']}\n"
+            header += f"   内容质量: {content_quality} ({news.get('char_count', 0)}字符)\n"
+            header += f"   语言: {news.get('language', 'unknown')}\n"
+            if news.get('chinese_title'):
+                header += f"   中文标题: {news['chinese_title']}\n"
+            if news.get('translated_summary'):
+                header += f"   中文摘要: {news['translated_summary']}\n"
             
             # 如果有元数据，也包含进来
             if news.get('metadata'):
                 metadata = news['metadata']
                 if metadata.get('author'):
-                    news_detail += f"   作者: {metadata['author']}\n"
+                    header += f"   作者: {metadata['author']}\n"
                 if metadata.get('publish_time'):
-                    news_detail += f"   发布时间: {metadata['publish_time']}\n"
+                    header += f"   发布时间: {metadata['publish_time']}\n"
             
-            news_details.append(news_detail)
+            entries.append({'header': header, 'body': body,
+                            'score': news.get('pre_rank_score', news.get('weight', 1.0))})
         
-        news_text = "\n".join(news_details)
+        # 分类要素总结为每条新闻输出一段详细总结，收录条数受输出token上限约束
+        try:
+            from config.glm_config import PROMPT_TEMPLATES
+        except ImportError:
+            PROMPT_TEMPLATES = {}
+        from src.core.prompt_builder import PromptBuilder
+        budget = self._get_prompt_budget_config()
+        max_tokens = budget.get('analysis_max_tokens', 2000)
+        builder = PromptBuilder(budget.get('analysis_token_budget', 8000),
+                                min_item_tokens=budget.get('min_item_tokens', 30),
+                                max_item_tokens=budget.get('analysis_max_item_tokens', 600),
+                                body_format="   详细内容: {body}\n")
+        # 摘要与分类共用同一段新闻文本，按模板较长的分类提示词计算预算
+        news_text = builder.build(entries, PROMPT_TEMPLATES.get('categorize_and_summarize', ''), name="摘要与分类",
+                                  max_items=max(1, max_tokens // budget.get('output_tokens_per_item', 400)))['news_text']
         
         # 使用增强版GLM客户端生成摘要和分类
-        if not hasattr(self, '_enhanced_client'):
-            from utils.enhanced_glm_client import create_enhanced_glm_client
-            self._enhanced_client = create_enhanced_glm_client(self.api_key)
-        
-        # 生成全球安全态势摘要
-        summary = self._enhanced_client.generate_summary(news_text)
-        
-        # 按四个维度分类并生成完整要素总结
-        categories = self._enhanced_client.categorize_and_summarize(news_text)
+        from utils.enhanced_glm_client import FALLBACK_CATEGORIES, FALLBACK_SUMMARY
+        client = self._get_enhanced_client()
+        # 全球安全态势摘要与四维度分类要素总结输入相同、互不依赖，并行调用；
+        # 各自保存检查点，使用备用结果时不保存
+        results = client.run_parallel({
+            'summary': lambda: self._run_stage(
+                'summary', lambda: client.generate_summary(news_text),
+                is_complete=lambda result: result != FALLBACK_SUMMARY),
+            'categories': lambda: self._run_stage(
+                'categories', lambda: client.categorize_and_summarize(news_text, max_tokens=max_tokens),
+                is_complete=lambda result: any(result.values()) and result != FALLBACK_CATEGORIES)
+        })
+        summary = results['summary']
+        categories = results['categories']
         
         # 如果分类结果为空，使用默认分类
         if not categories or not any(categories.values()):
@@ -552,7 +850,8 @@ class GLMNewsGenerator:
             "total_chars": total_chars,
             "sources": list(set([news['source'] for news in selected_news])),
             "regions": list(set([news.get('region', 'Unknown') for news in selected_news])),
-            "languages": list(set([news.get('language', 'unknown') for news in selected_news]))
+            "languages": list(set([news.get('language', 'unknown') for news in selected_news])),
+            "selected_news": selected_news
         }
     
     def _default_categorize_news_four_dimensions(self, news_list: List[Dict]) -> Dict:
@@ -568,9 +867,6 @@ class GLMNewsGenerator:
         
         # 基于关键词的四维度分类
         for news in news_list:
-            title_lower = news['title'].lower()
-            content_lower = (news.get('content', '') + news.get('summary', '')).lower()
-            
             # 生成包含关键要素的总结
             summary_text = ""
             if news.get('content'):
@@ -583,7 +879,7 @@ class GLMNewsGenerator:
             # 翻译英文标题（简单处理）
             display_title = news['title']
             if news.get('language') == 'en':
-                display_title = f"[国际] {news['title']}"
+                display_title = f"[国际] {news.get('chinese_title') or news['title']}"
             
             item = {
                 "title": display_title,
@@ -598,18 +894,11 @@ class GLMNewsGenerator:
                 "impact_level": "中"
             }
             
-            # 四维度关键词分类
-            if any(keyword in title_lower or keyword in content_lower for keyword in 
-                   ['vulnerability', 'cve', 'exploit', '漏洞', '威胁', 'threat', 'risk', '风险']):
-                categories["安全风险"].append(item)
-            elif any(keyword in title_lower or keyword in content_lower for keyword in 
-                     ['breach', 'attack', 'hack', '攻击', '泄露', '入侵', '勒索', 'incident']):
-                categories["安全事件"].append(item)
-            elif any(keyword in title_lower or keyword in content_lower for keyword in 
-                     ['policy', 'regulation', 'compliance', '政策', '法规', '合规', '报告', 'report']):
-                categories["安全舆情"].append(item)
-            else:
-                categories["安全趋势"].append(item)
+            # 四维度关键词分类：按风险、事件、舆情的顺序取第一个命中的维度，否则归入趋势
+            category = self.keyword_matcher.classify(
+                news['title'], news.get('content', ''), news.get('summary', ''), default="安全趋势"
+            )
+            categories[category].append(item)
         
         return categories
     
@@ -627,29 +916,14 @@ class GLMNewsGenerator:
             return news
         
         try:
-            from config.glm_config import PROMPT_TEMPLATES
-        except ImportError:
-            # 备用导入路径
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-            from config.glm_config import PROMPT_TEMPLATES
-            translate_prompt = PROMPT_TEMPLATES['translate_and_analyze'].format(
+            result_data = self._get_enhanced_client().translate_and_analyze(
                 title=news['title'],
                 content=news.get('content', '')[:1000],  # 限制长度避免超时
                 source=news['source']
             )
-            
-            translate_result = self.call_glm_api(translate_prompt)
-            result_data = json.loads(translate_result)
-            
-            # 更新新闻信息
-            news['chinese_title'] = result_data.get('chinese_title', news['title'])
-            news['translated_summary'] = result_data.get('summary', '')
-            news['key_points'] = result_data.get('key_points', [])
-            news['impact_analysis'] = result_data.get('impact_analysis', '')
-            news['threat_level'] = result_data.get('threat_level', '中危')
-            
+            if result_data is None:
+                return news
+            self._apply_translation(news, result_data)
             logger.info(f"成功翻译英文新闻: {news['title'][:50]}...")
             
         except Exception as e:
@@ -657,13 +931,67 @@ class GLMNewsGenerator:
         
         return news
     
-    def generate_html_report(self, analysis_result: Dict, date_str: str) -> str:
+    def translate_english_news_batch(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        批量翻译英文新闻：多条新闻打包进同一个GLM请求，按序号对应回原新闻，
+        批量失败的条目自动逐条重译，仍未得到译文的新闻保持原样
+        
+        Args:
+            news_list: 新闻列表（只处理有正文的英文新闻，其余原样保留）
+            
+        Returns:
+            原新闻列表（英文新闻已补充翻译和分析字段）
+        """
+        english = {
+            str(i): news for i, news in enumerate(news_list)
+            if news.get('language') == 'en' and news.get('content')
+        }
+        if not english:
+            return news_list
+        
+        try:
+            from config.glm_config import TRANSLATION_CONFIG
+        except ImportError:
+            TRANSLATION_CONFIG = {}
+        
+        try:
+            results = self._get_enhanced_client().translate_batch(
+                [{'id': news_id, 'title': news['title'], 'content': news['content'], 'source': news['source']}
+                 for news_id, news in english.items()],
+                **TRANSLATION_CONFIG
+            )
+        except Exception as e:
+            logger.warning(f"批量翻译英文新闻失败: {e}")
+            return news_list
+        
+        for news_id, news in english.items():
+            if news_id in results:
+                self._apply_translation(news, results[news_id])
+        logger.info(f"✅ 批量翻译英文新闻 {len(results)}/{len(english)} 条")
+        return news_list
+    
+    @staticmethod
+    def _apply_translation(news: Dict, result_data: Dict):
+        """把翻译和分析结果写回新闻字典"""
+        news['chinese_title'] = result_data.get('chinese_title', news['title'])
+        news['translated_summary'] = result_data.get('summary', '')
+        news['key_points'] = result_data.get('key_points', [])
+        news['impact_analysis'] = result_data.get('impact_analysis', '')
+        news['threat_level'] = result_data.get('threat_level', '中危')
+    
+    @staticmethod
+    def _report_title(current_time: str) -> str:
+        """快报HTML标题（同时写入快报元数据）"""
+        return f"海之安网络安全日报 - {current_time}"
+    
+    def generate_html_report(self, analysis_result: Dict, date_str: str, inline_css: bool = None) -> str:
         """
         生成HTML格式的新闻快报
         
         Args:
             analysis_result: 分析结果
             date_str: 日期字符串
+            inline_css: 是否内联样式，为None时使用初始化时的设置
             
         Returns:
             HTML内容
@@ -672,13 +1000,13 @@ class GLMNewsGenerator:
         
         # 导入样式保护模块
         try:
-            from src.utils.style_protection import get_mobile_responsive_css, ensure_mobile_responsive
+            from src.utils.style_protection import get_mobile_responsive_css
             mobile_css = get_mobile_responsive_css()
             logger.info("✅ 成功加载移动端样式保护模块")
         except ImportError:
             try:
                 # 尝试相对导入
-                from utils.style_protection import get_mobile_responsive_css, ensure_mobile_responsive
+                from utils.style_protection import get_mobile_responsive_css
                 mobile_css = get_mobile_responsive_css()
                 logger.info("✅ 成功加载移动端样式保护模块")
             except ImportError:
@@ -686,870 +1014,39 @@ class GLMNewsGenerator:
                 mobile_css = self._get_fallback_mobile_css()
                 logger.warning("⚠️ 样式保护模块未找到，使用内置备用样式")
         
-        html_template = f"""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>海之安网络安全日报 - {current_time}</title>
-  
-  <style>
-    * {{
-      margin: 0;
-      padding: 0;
-      box-sizing: border-box;
-    }}
-    
-    body {{
-      font-family: 'Microsoft YaHei', 'SimHei', 'Arial', sans-serif;
-      background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #334155 100%);
-      color: #f1f5f9;
-      min-height: 100vh;
-      padding: 20px;
-      line-height: 1.6;
-    }}
-    
-    .container {{
-      max-width: 1200px;
-      margin: 0 auto;
-      background: rgba(15, 23, 42, 0.95);
-      border: 1px solid rgba(59, 130, 246, 0.3);
-      border-radius: 16px;
-      box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.8);
-      overflow: hidden;
-    }}
-    
-    .header {{
-      background: linear-gradient(90deg, rgba(59, 130, 246, 0.1) 0%, rgba(147, 51, 234, 0.1) 100%);
-      border-bottom: 1px solid rgba(59, 130, 246, 0.3);
-      padding: 40px;
-      text-align: center;
-      position: relative;
-    }}
-    
-    .header::before {{
-      content: '';
-      position: absolute;
-      top: 0;
-      left: 0;
-      right: 0;
-      height: 2px;
-      background: linear-gradient(90deg, #3b82f6, #8b5cf6, #06b6d4);
-    }}
-    
-    .logo {{
-      width: 200px;
-      height: auto;
-      margin-bottom: 20px;
-    }}
-    
-    .title {{
-      font-size: 36px;
-      font-weight: 700;
-      background: linear-gradient(135deg, #3b82f6, #8b5cf6);
-      -webkit-background-clip: text;
-      -webkit-text-fill-color: transparent;
-      background-clip: text;
-      margin-bottom: 16px;
-    }}
-    
-    .subtitle {{
-      font-size: 18px;
-      color: #94a3b8;
-      margin-bottom: 8px;
-    }}
-    
-    .content {{
-      padding: 40px;
-    }}
-    
-    .summary-section {{
-      background: rgba(30, 41, 59, 0.8);
-      border: 1px solid rgba(59, 130, 246, 0.2);
-      border-radius: 12px;
-      padding: 24px;
-      margin-bottom: 32px;
-    }}
-    
-    .summary-title {{
-      font-size: 20px;
-      font-weight: 600;
-      color: #3b82f6;
-      margin-bottom: 16px;
-      display: flex;
-      align-items: center;
-      gap: 8px;
-    }}
-    
-    .summary-title::before {{
-      content: '📊';
-      font-size: 24px;
-    }}
-    
-    .summary-content {{
-      color: #cbd5e1;
-      line-height: 1.8;
-      font-size: 16px;
-      white-space: pre-line;
-    }}
-    
-    .category-section {{
-      margin-bottom: 40px;
-      background: rgba(30, 41, 59, 0.4);
-      border-radius: 12px;
-      border: 1px solid rgba(59, 130, 246, 0.15);
-      overflow: hidden;
-    }}
-    
-    .category-header {{
-      background: linear-gradient(135deg, rgba(59, 130, 246, 0.2), rgba(147, 51, 234, 0.2));
-      padding: 20px 24px;
-      border-bottom: 1px solid rgba(59, 130, 246, 0.3);
-    }}
-    
-    .category-title {{
-      font-size: 24px;
-      font-weight: 600;
-      color: #e2e8f0;
-      display: flex;
-      align-items: center;
-      gap: 12px;
-    }}
-    
-    .category-news {{
-      padding: 24px;
-    }}
-    
-    .news-item {{
-      background: rgba(51, 65, 85, 0.6);
-      border: 1px solid rgba(59, 130, 246, 0.2);
-      border-radius: 8px;
-      padding: 20px;
-      margin-bottom: 20px;
-      transition: all 0.3s ease;
-      position: relative;
-    }}
-    
-    .news-item::before {{
-      content: '';
-      position: absolute;
-      left: 0;
-      top: 0;
-      bottom: 0;
-      width: 4px;
-      background: linear-gradient(180deg, #3b82f6, #8b5cf6);
-      border-radius: 2px 0 0 2px;
-    }}
-    
-    .news-item:hover {{
-      border-color: rgba(59, 130, 246, 0.4);
-      box-shadow: 0 4px 12px rgba(59, 130, 246, 0.15);
-    }}
-    
-    .news-title {{
-      font-size: 18px;
-      font-weight: 600;
-      color: #f1f5f9;
-      margin-bottom: 12px;
-      line-height: 1.4;
-    }}
-    
-    .news-analysis {{
-      color: #cbd5e1;
-      line-height: 1.7;
-      font-size: 15px;
-    }}
-    
-    .footer {{
-      background: rgba(15, 23, 42, 0.8);
-      border-top: 1px solid rgba(59, 130, 246, 0.3);
-      padding: 24px 40px;
-      text-align: center;
-      color: #64748b;
-      font-size: 14px;
-    }}
-    
-    .stats-section {{
-      margin-bottom: 32px;
-    }}
-    
-    .stats-grid {{
-      display: grid;
-      grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-      gap: 20px;
-      margin-bottom: 20px;
-    }}
-    
-    .stat-card {{
-      background: rgba(30, 41, 59, 0.8);
-      border: 1px solid rgba(59, 130, 246, 0.2);
-      border-radius: 12px;
-      padding: 20px;
-      text-align: center;
-      transition: all 0.3s ease;
-    }}
-    
-    .stat-card:hover {{
-      border-color: rgba(59, 130, 246, 0.4);
-      transform: translateY(-2px);
-    }}
-    
-    .stat-number {{
-      font-size: 32px;
-      font-weight: 700;
-      color: #3b82f6;
-      margin-bottom: 8px;
-    }}
-    
-    .stat-label {{
-      font-size: 14px;
-      color: #94a3b8;
-      margin-bottom: 4px;
-    }}
-    
-    .stat-detail {{
-      font-size: 12px;
-      color: #64748b;
-    }}
-    
-    .source-list {{
-      margin-top: 24px;
-      padding: 20px;
-      background: rgba(30, 41, 59, 0.8);
-      border-radius: 12px;
-      border: 1px solid rgba(59, 130, 246, 0.2);
-    }}
-    
-    .source-list h3 {{
-      color: #3b82f6;
-      font-size: 16px;
-      margin-bottom: 12px;
-    }}
-    
-    .source-tags {{
-      display: flex;
-      flex-wrap: wrap;
-      gap: 8px;
-    }}
-    
-    .source-tag {{
-      background: rgba(59, 130, 246, 0.1);
-      color: #93c5fd;
-      padding: 6px 12px;
-      border-radius: 16px;
-      font-size: 12px;
-      border: 1px solid rgba(59, 130, 246, 0.2);
-    }}
-    
-    .enhancement-info {{
-      margin-top: 24px;
-      padding: 20px;
-      background: rgba(34, 197, 94, 0.1);
-      border-radius: 12px;
-      border: 1px solid rgba(34, 197, 94, 0.2);
-    }}
-    
-    .enhancement-info h3 {{
-      color: #22c55e;
-      font-size: 16px;
-      margin-bottom: 12px;
-    }}
-    
-    .enhancement-stats {{
-      display: flex;
-      flex-direction: column;
-      gap: 8px;
-    }}
-    
-    .enhancement-item {{
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      padding: 8px 0;
-      border-bottom: 1px solid rgba(34, 197, 94, 0.1);
-    }}
-    
-    .enhancement-item:last-child {{
-      border-bottom: none;
-    }}
-    
-    .enhancement-label {{
-      color: #94a3b8;
-      font-size: 14px;
-    }}
-    
-    .enhancement-value {{
-      color: #22c55e;
-      font-weight: 600;
-      font-size: 14px;
-    }}
-    
-    .content-quality-badge {{
-      display: inline-block;
-      padding: 4px 8px;
-      border-radius: 4px;
-      font-size: 11px;
-      font-weight: 600;
-      margin-left: 8px;
-    }}
-    
-    .quality-enhanced {{
-      background: rgba(34, 197, 94, 0.2);
-      color: #86efac;
-      border: 1px solid rgba(34, 197, 94, 0.3);
-    }}
-    
-    .quality-rss {{
-      background: rgba(245, 158, 11, 0.2);
-      color: #fbbf24;
-      border: 1px solid rgba(245, 158, 11, 0.3);
-    }}
-    
-    .quality-failed {{
-      background: rgba(239, 68, 68, 0.2);
-      color: #fca5a5;
-      border: 1px solid rgba(239, 68, 68, 0.3);
-    }}
-    
-    .news-header {{
-      margin-bottom: 12px;
-    }}
-    
-    .news-meta {{
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin-top: 8px;
-      font-size: 12px;
-    }}
-    
-    .news-source {{
-      color: #94a3b8;
-      background: rgba(59, 130, 246, 0.1);
-      padding: 4px 8px;
-      border-radius: 4px;
-    }}
-    
-    .severity-badge {{
-      padding: 4px 8px;
-      border-radius: 4px;
-      font-weight: 600;
-      font-size: 11px;
-    }}
-    
-    .severity-high {{
-      background: rgba(239, 68, 68, 0.2);
-      color: #fca5a5;
-      border: 1px solid rgba(239, 68, 68, 0.3);
-    }}
-    
-    .severity-medium {{
-      background: rgba(245, 158, 11, 0.2);
-      color: #fbbf24;
-      border: 1px solid rgba(245, 158, 11, 0.3);
-    }}
-    
-    .severity-low {{
-      background: rgba(34, 197, 94, 0.2);
-      color: #86efac;
-      border: 1px solid rgba(34, 197, 94, 0.3);
-    }}
-    
-    .severity-info {{
-      background: rgba(59, 130, 246, 0.2);
-      color: #93c5fd;
-      border: 1px solid rgba(59, 130, 246, 0.3);
-    }}
-    
-    .news-summary {{
-      color: #cbd5e1;
-      line-height: 1.7;
-      font-size: 15px;
-      margin-bottom: 12px;
-    }}
-    
-    .key-points {{
-      margin: 12px 0;
-      padding-left: 20px;
-      color: #94a3b8;
-      font-size: 14px;
-    }}
-    
-    .key-points li {{
-      margin-bottom: 4px;
-      line-height: 1.4;
-    }}
-    
-    .region-badge {{
-      background: rgba(34, 197, 94, 0.1);
-      color: #86efac;
-      padding: 4px 8px;
-      border-radius: 4px;
-      font-size: 11px;
-      margin: 0 4px;
-    }}
-    
-    .impact-badge {{
-      padding: 4px 8px;
-      border-radius: 4px;
-      font-weight: 600;
-      font-size: 11px;
-    }}
-    
-    .impact-high {{
-      background: rgba(239, 68, 68, 0.2);
-      color: #fca5a5;
-      border: 1px solid rgba(239, 68, 68, 0.3);
-    }}
-    
-    .impact-medium {{
-      background: rgba(245, 158, 11, 0.2);
-      color: #fbbf24;
-      border: 1px solid rgba(245, 158, 11, 0.3);
-    }}
-    
-    .impact-low {{
-      background: rgba(34, 197, 94, 0.2);
-      color: #86efac;
-      border: 1px solid rgba(34, 197, 94, 0.3);
-    }}
-    
-    .icon-risk::before {{ content: '⚠️'; }}
-    .icon-event::before {{ content: '🚨'; }}
-    .icon-opinion::before {{ content: '📢'; }}
-    .icon-trend::before {{ content: '📈'; }}
-    .icon-focus::before {{ content: '🎯'; }}
-    
-    /* 移动端适配样式 - 重要：请勿删除或覆盖 */
-    @media (max-width: 768px) {{
-      .container {{
-        margin: 0;
-        padding: 10px;
-        border-radius: 0;
-      }}
-      
-      .header {{
-        padding: 20px 15px;
-        border-radius: 0;
-      }}
-      
-      .logo {{
-        width: 150px;
-        margin-bottom: 15px;
-      }}
-      
-      .title {{
-        font-size: 24px;
-        margin-bottom: 12px;
-      }}
-      
-      .subtitle {{
-        font-size: 14px;
-        margin-bottom: 6px;
-      }}
-      
-      .content {{
-        padding: 20px 15px;
-      }}
-      
-      .summary-section {{
-        padding: 15px;
-        margin-bottom: 20px;
-        border-radius: 8px;
-      }}
-      
-      .summary-title {{
-        font-size: 16px;
-        margin-bottom: 12px;
-      }}
-      
-      .summary-content {{
-        font-size: 14px;
-        line-height: 1.6;
-        white-space: pre-line;
-      }}
-      
-      .stats-section {{
-        margin-bottom: 20px;
-      }}
-      
-      .stats-grid {{
-        grid-template-columns: repeat(2, 1fr);
-        gap: 10px;
-      }}
-      
-      .stat-card {{
-        padding: 15px;
-        border-radius: 8px;
-      }}
-      
-      .stat-number {{
-        font-size: 24px;
-        margin-bottom: 6px;
-      }}
-      
-      .stat-label {{
-        font-size: 12px;
-      }}
-      
-      .stat-detail {{
-        font-size: 10px;
-      }}
-      
-      .enhancement-info {{
-        padding: 15px;
-        margin-top: 15px;
-        border-radius: 8px;
-      }}
-      
-      .enhancement-info h3 {{
-        font-size: 14px;
-        margin-bottom: 10px;
-      }}
-      
-      .enhancement-item {{
-        padding: 6px 0;
-      }}
-      
-      .enhancement-label,
-      .enhancement-value {{
-        font-size: 12px;
-      }}
-      
-      .source-list {{
-        padding: 15px;
-        margin-top: 15px;
-        border-radius: 8px;
-      }}
-      
-      .source-list h3 {{
-        font-size: 14px;
-        margin-bottom: 10px;
-      }}
-      
-      .source-tag {{
-        padding: 4px 8px;
-        font-size: 10px;
-        margin: 2px;
-      }}
-      
-      .category-section {{
-        margin-bottom: 25px;
-        border-radius: 8px;
-      }}
-      
-      .category-header {{
-        padding: 15px 20px;
-      }}
-      
-      .category-title {{
-        font-size: 18px;
-      }}
-      
-      .category-news {{
-        padding: 15px;
-      }}
-      
-      .news-item {{
-        padding: 15px;
-        margin-bottom: 15px;
-        border-radius: 6px;
-      }}
-      
-      .news-title {{
-        font-size: 16px;
-        margin-bottom: 10px;
-        line-height: 1.3;
-      }}
-      
-      .news-meta {{
-        flex-direction: column;
-        align-items: flex-start;
-        gap: 6px;
-        margin-top: 6px;
-      }}
-      
-      .news-source,
-      .region-badge,
-      .impact-badge,
-      .content-quality-badge {{
-        font-size: 10px;
-        padding: 3px 6px;
-        margin: 2px 4px 2px 0;
-      }}
-      
-      .news-summary {{
-        font-size: 13px;
-        line-height: 1.5;
-        margin-bottom: 10px;
-      }}
-      
-      .key-points {{
-        margin: 10px 0;
-        padding-left: 15px;
-        font-size: 12px;
-      }}
-      
-      .key-points li {{
-        margin-bottom: 3px;
-        line-height: 1.3;
-      }}
-      
-      .footer {{
-        padding: 15px;
-        border-radius: 0;
-        font-size: 12px;
-      }}
-    }}
-    
-    /* 超小屏幕适配 (iPhone SE等) */
-    @media (max-width: 480px) {{
-      .container {{
-        padding: 5px;
-      }}
-      
-      .header {{
-        padding: 15px 10px;
-      }}
-      
-      .logo {{
-        width: 120px;
-      }}
-      
-      .title {{
-        font-size: 20px;
-      }}
-      
-      .subtitle {{
-        font-size: 12px;
-      }}
-      
-      .content {{
-        padding: 15px 10px;
-      }}
-      
-      .stats-grid {{
-        grid-template-columns: 1fr;
-        gap: 8px;
-      }}
-      
-      .stat-card {{
-        padding: 12px;
-      }}
-      
-      .stat-number {{
-        font-size: 20px;
-      }}
-      
-      .category-title {{
-        font-size: 16px;
-      }}
-      
-      .news-title {{
-        font-size: 14px;
-      }}
-      
-      .news-summary {{
-        font-size: 12px;
-      }}
-    }}
-    
-    /* 横屏适配 */
-    @media (max-width: 768px) and (orientation: landscape) {{
-      .stats-grid {{
-        grid-template-columns: repeat(4, 1fr);
-      }}
-      
-      .category-section {{
-        margin-bottom: 20px;
-      }}
-      
-      .news-item {{
-        padding: 12px;
-        margin-bottom: 12px;
-      }}
-    }}
-  </style>
-</head>
-<body>
-  <div class="container">
-    <div class="header">
-      <svg class="logo" viewBox="0 0 400 120" xmlns="http://www.w3.org/2000/svg">
-        <defs>
-          <linearGradient id="logoGradient" x1="0%" y1="0%" x2="100%" y2="100%">
-            <stop offset="0%" style="stop-color:#8B5CF6;stop-opacity:1" />
-            <stop offset="50%" style="stop-color:#3B82F6;stop-opacity:1" />
-            <stop offset="100%" style="stop-color:#06B6D4;stop-opacity:1" />
-          </linearGradient>
-        </defs>
-        <circle cx="40" cy="60" r="25" fill="url(#logoGradient)" opacity="0.8"/>
-        <circle cx="25" cy="35" r="15" fill="url(#logoGradient)" opacity="0.9"/>
-        <circle cx="55" cy="35" r="12" fill="url(#logoGradient)" opacity="0.7"/>
-        <circle cx="35" cy="75" r="10" fill="url(#logoGradient)" opacity="0.6"/>
-        <circle cx="60" cy="75" r="8" fill="url(#logoGradient)" opacity="0.8"/>
-        <text x="90" y="45" font-family="Arial, sans-serif" font-size="24" font-weight="bold" fill="#3b82f6">ocean security</text>
-        <text x="90" y="70" font-family="Arial, sans-serif" font-size="12" fill="#94a3b8">海之安，数字安全专家</text>
-      </svg>
-      <h1 class="title">海之安网络安全日报</h1>
-      <div class="subtitle">{current_time} · AI智能生成</div>
-    </div>
-    
-    <div class="content">
-      <div class="summary-section">
-        <h2 class="summary-title">今日摘要</h2>
-        <div class="summary-content">{analysis_result.get('summary', '今日暂无网络安全新闻摘要')}</div>
-      </div>
-"""
-        
-        # 添加统计信息 - 包含增强爬虫的效果统计
-        sources = analysis_result.get('sources', [])
-        regions = analysis_result.get('regions', [])
-        languages = analysis_result.get('languages', [])
-        enhanced_count = analysis_result.get('enhanced_count', 0)
-        total_chars = analysis_result.get('total_chars', 0)
-        
-        html_template += f"""
-      <div class="stats-section">
-        <div class="stats-grid">
-          <div class="stat-card">
-            <div class="stat-number">{analysis_result.get('total_news', 0)}</div>
-            <div class="stat-label">精选新闻</div>
-            <div class="stat-detail">从{analysis_result.get('original_count', 0)}条中精选</div>
-          </div>
-          <div class="stat-card">
-            <div class="stat-number">{enhanced_count}</div>
-            <div class="stat-label">增强内容</div>
-            <div class="stat-detail">深度抓取成功</div>
-          </div>
-          <div class="stat-card">
-            <div class="stat-number">{total_chars:,}</div>
-            <div class="stat-label">内容字符</div>
-            <div class="stat-detail">丰富可读</div>
-          </div>
-          <div class="stat-card">
-            <div class="stat-number">4</div>
-            <div class="stat-label">分析维度</div>
-            <div class="stat-detail">风险·事件·舆情·趋势</div>
-          </div>
-        </div>
-        <div class="enhancement-info">
-          <h3>🚀 内容增强效果</h3>
-          <div class="enhancement-stats">
-            <div class="enhancement-item">
-              <span class="enhancement-label">深度抓取成功率:</span>
-              <span class="enhancement-value">{(enhanced_count/analysis_result.get('total_news', 1)*100):.1f}%</span>
-            </div>
-            <div class="enhancement-item">
-              <span class="enhancement-label">平均内容长度:</span>
-              <span class="enhancement-value">{total_chars//analysis_result.get('total_news', 1):,}字符</span>
-            </div>
-            <div class="enhancement-item">
-              <span class="enhancement-label">内容质量:</span>
-              <span class="enhancement-value">{'优秀' if enhanced_count > 5 else '良好' if enhanced_count > 2 else '一般'}</span>
-            </div>
-          </div>
-        </div>
-        <div class="source-list">
-          <h3>📰 全球新闻来源</h3>
-          <div class="source-tags">
-"""
-        
-        # 添加来源标签
-        for source in sources:
-            html_template += f'<span class="source-tag">{source}</span>'
-        
-        html_template += """
-          </div>
-        </div>
-      </div>
-"""
-        
-        # 添加分类新闻 - 四维度分类
+        # 四维度分类图标，只渲染有新闻的分类
         icon_map = {
             "安全风险": "icon-risk",
             "安全事件": "icon-event", 
             "安全舆情": "icon-opinion",
             "安全趋势": "icon-trend"
         }
+        categories = [(category, icon_map.get(category, "icon-focus"), news_items)
+                      for category, news_items in analysis_result.get('categories', {}).items() if news_items]
         
-        for category, news_items in analysis_result.get('categories', {}).items():
-            if news_items:
-                icon_class = icon_map.get(category, "icon-focus")
-                html_template += f"""
-      <div class="category-section">
-        <div class="category-header">
-          <h2 class="category-title {icon_class}">{category}</h2>
-        </div>
-        <div class="category-news">
-"""
-                
-                for item in news_items:
-                    impact_level = item.get('impact_level', '中')
-                    impact_class = {
-                        '高': 'impact-high',
-                        '中': 'impact-medium', 
-                        '低': 'impact-low'
-                    }.get(impact_level, 'impact-medium')
-                    
-                    # 处理关键点列表
-                    key_points_html = ""
-                    if item.get('key_points'):
-                        key_points_html = "<ul class='key-points'>"
-                        for point in item['key_points'][:3]:  # 最多显示3个关键点
-                            key_points_html += f"<li>{point}</li>"
-                        key_points_html += "</ul>"
-                    
-                    # 添加内容质量标识
-                    quality_badge = ""
-                    if hasattr(item, 'enhanced_content') and item.get('enhanced_content'):
-                        quality_badge = '<span class="content-quality-badge quality-enhanced">深度内容</span>'
-                    elif item.get('char_count', 0) > 500:
-                        quality_badge = '<span class="content-quality-badge quality-rss">RSS内容</span>'
-                    else:
-                        quality_badge = '<span class="content-quality-badge quality-failed">简要内容</span>'
-                    
-                    html_template += f"""          <div class="news-item">
-            <div class="news-header">
-              <div class="news-title">{item['title']}{quality_badge}</div>
-              <div class="news-meta">
-                <span class="news-source">{item.get('source', '未知来源')}</span>
-                <span class="region-badge">{item.get('region', 'Unknown')}</span>
-                <span class="impact-badge {impact_class}">影响: {impact_level}</span>
-              </div>
-            </div>
-            <div class="news-summary">
-              <strong>内容要素：</strong>{item.get('summary', '暂无详细总结')}
-            </div>
-            {key_points_html}
-          </div>
-"""
-                
-                html_template += """        </div>
-      </div>
-"""
+        # 样式见 templates/report.css，缺少移动端适配时补上移动端样式
+        report_css = render_template('report.css')
+        if "@media (max-width: 768px)" not in report_css:
+            report_css += mobile_css + "\n"
+        if inline_css is None:
+            inline_css = self.inline_css
         
-        # 添加footer
-        html_template += f"""    </div>
-    
-    <div class="footer">
-      <p>© 2025 海之安（中国）科技有限公司 | 基于智谱GLM AI生成</p>
-      <p>共分析 {analysis_result.get('total_news', 0)} 条安全新闻 | 官网：<a href="https://www.oceansecurity.cn" style="color: #3b82f6;">www.oceansecurity.cn</a></p>
-    </div>
-  </div>
-</body>
-</html>"""
-        
-        # 确保包含移动端样式保护
-        try:
-            from style_protection import ensure_mobile_responsive
-            html_template = ensure_mobile_responsive(html_template)
-            logger.info("✅ 移动端样式保护已应用")
-        except ImportError:
-            # 如果保护模块不可用，手动检查和添加
-            if "@media (max-width: 768px)" not in html_template:
-                fallback_css = self._get_fallback_mobile_css()
-                html_template = html_template.replace("</style>", fallback_css + "\n  </style>")
-                logger.info("✅ 备用移动端样式已应用")
+        # 页面结构见 templates/report.html
+        html_template = render_template('report.html', {
+            'title': self._report_title(current_time),
+            'current_time': current_time,
+            'stylesheet_href': None if inline_css else publish_stylesheet('report', report_css),
+            'inline_css': report_css,
+            'summary': analysis_result.get('summary', '今日暂无网络安全新闻摘要'),
+            'total_news': analysis_result.get('total_news', 0),
+            'total_news_divisor': analysis_result.get('total_news', 1) or 1,
+            'original_count': analysis_result.get('original_count', 0),
+            'enhanced_count': analysis_result.get('enhanced_count', 0),
+            'total_chars': analysis_result.get('total_chars', 0),
+            'sources': analysis_result.get('sources', []),
+            'categories': categories,
+            'impact_classes': {'高': 'impact-high', '中': 'impact-medium', '低': 'impact-low'}
+        })
         
         return html_template
     
@@ -1602,16 +1099,20 @@ class GLMNewsGenerator:
     }
         """
     
-    def generate_daily_report(self, days_back: int = 1) -> str:
+    def generate_daily_report(self, days_back: int = 1, resume: bool = False, run_id: str = None) -> str:
         """
         生成每日安全快报
         
         Args:
             days_back: 生成几天前的报告
+            resume: 是否从该报告日期最近一次未完成运行的检查点继续
+            run_id: 指定要继续的运行ID（output/runs 下的目录名），优先于 resume
             
         Returns:
             生成的HTML文件路径
         """
+        target_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y%m%d')
+        self._checkpoint = self._open_checkpoint(target_date, resume, run_id)
         try:
             # 1. 抓取新闻
             news_list = self.fetch_security_news(days_back)
@@ -1625,20 +1126,85 @@ class GLMNewsGenerator:
             analysis_result = self.generate_news_analysis(news_list)
             
             # 3. 生成HTML报告
-            target_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y%m%d')
-            html_content = self.generate_html_report(analysis_result, target_date)
+            with span('render.html'):
+                html_content = self.generate_html_report(analysis_result, target_date)
             
-            # 4. 保存文件
+            # 4. 保存文件：先写结构化元数据，索引生成器收到HTML变更时即可直接读取
             filename = f"news{target_date}.html"
-            with open(filename, 'w', encoding='utf-8') as f:
+            self._write_report_metadata(analysis_result, target_date, filename)
+            with span('write.report', path=filename), open(filename, 'w', encoding='utf-8') as f:
                 f.write(html_content)
             
+            self._remember_reported_news(analysis_result.get('selected_news', news_list))
+            if self._checkpoint is not None:
+                self._checkpoint.finish(filename)
+            
             logger.info(f"✅ 成功生成AI智能新闻快报: {filename}")
             return filename
             
         except Exception as e:
             logger.error(f"生成报告失败: {e}")
+            if self._checkpoint is not None and self._checkpoint.completed_stages():
+                logger.info(f"💾 已完成阶段 {', '.join(self._checkpoint.completed_stages())} 的结果已保存，"
+                            f"可使用 --resume 从检查点 {self._checkpoint.run_id} 继续")
             return ""
+        finally:
+            self._checkpoint = None
+            self.close()
+            # 开启 NEWS_PROFILE 时输出耗时追踪和汇总表
+            get_profiler().finish()
+    
+    def _write_report_metadata(self, analysis_result: Dict, target_date: str, filename: str):
+        """
+        在快报HTML旁写入结构化元数据（newsYYYYMMDD.json），写入失败不影响报告生成
+        
+        Args:
+            analysis_result: 分析结果
+            target_date: 报告日期（YYYYMMDD）
+            filename: 快报HTML文件名
+        """
+        from src.core.report_metadata import build_report_metadata, write_report_metadata
+        try:
+            title = self._report_title(datetime.now().strftime('%Y年%m月%d日'))
+            with span('write.metadata', path=filename):
+                metadata = build_report_metadata(analysis_result, target_date, title, filename)
+                write_report_metadata(filename, metadata)
+        except Exception as e:
+            logger.warning(f"快报元数据写入失败，索引将回退到HTML解析: {e}")
+    
+    def _open_checkpoint(self, target_date: str, resume: bool, run_id: str = None):
+        """
+        打开本次运行的检查点：指定运行ID或恢复模式时沿用已有运行，否则新建；未启用时返回None
+        """
+        try:
+            from config.glm_config import CHECKPOINT_CONFIG
+        except ImportError:
+            CHECKPOINT_CONFIG = {}
+        runs_dir = CHECKPOINT_CONFIG.get('runs_dir')
+        if not CHECKPOINT_CONFIG.get('enabled', True) or not runs_dir:
+            return None
+        
+        from src.core.checkpoint import RunCheckpoint
+        try:
+            if run_id:
+                checkpoint = RunCheckpoint(run_id, runs_dir)
+            elif resume:
+                checkpoint = RunCheckpoint.find_resumable(target_date, runs_dir)
+                if checkpoint is None:
+                    logger.info(f"没有 {target_date} 未完成的运行，重新开始")
+                    checkpoint = RunCheckpoint.create(target_date, runs_dir)
+            else:
+                checkpoint = RunCheckpoint.create(target_date, runs_dir)
+        except OSError as e:
+            logger.warning(f"检查点目录不可用，本次运行不保存检查点: {e}")
+            return None
+        
+        completed = checkpoint.completed_stages()
+        if completed:
+            logger.info(f"⏩ 从检查点 {checkpoint.run_id} 继续，已完成阶段: {', '.join(completed)}")
+        else:
+            logger.info(f"💾 本次运行检查点: {checkpoint.path}")
+        return checkpoint
 
 def main():
     """主函数"""
@@ -1650,10 +1216,23 @@ def main():
         print("获取API密钥：https://open.bigmodel.cn/")
         return
     
-    generator = GLMNewsGenerator(api_key)
+    import argparse
+    parser = argparse.ArgumentParser(description="基于智谱GLM的网络安全新闻快报生成器")
+    parser.add_argument('--days-back', type=int, default=1, help="生成几天前的报告（默认1，即昨天）")
+    parser.add_argument('--resume', nargs='?', const=True, default=False, metavar='RUN_ID',
+                        help="从最近一次未完成运行（或指定运行ID）的检查点继续")
+    parser.add_argument('--inline-css', action='store_true', default=None,
+                        help="把样式内联到快报中生成单文件HTML（用于邮件发送）")
+    args = parser.parse_args()
+    
+    generator = GLMNewsGenerator(api_key, inline_css=args.inline_css)
     
     # 生成昨天的新闻快报
-    result = generator.generate_daily_report(days_back=1)
+    result = generator.generate_daily_report(
+        days_back=args.days_back,
+        resume=bool(args.resume),
+        run_id=args.resume if isinstance(args.resume, str) else None
+    )
     
     if result:
         print(f"🎉 AI智能新闻快报生成成功: {result}")
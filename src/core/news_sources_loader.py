@@ -138,6 +138,29 @@ class NewsSourcesLoader:
         enabled_sources = self.get_enabled_sources()
         return [source for source in enabled_sources if source.get('category') in official_categories]
     
+    def get_regional_weights(self) -> Dict[str, float]:
+        """
+        获取地区权重配置
+        
+        Returns:
+            Dict[str, float]: 地区名称到权重的映射
+        """
+        if not self.config:
+            return {}
+        return dict(self.config.get('regional_weights', {}))
+    
+    def get_category_priorities(self) -> Dict[str, str]:
+        """
+        获取新闻源类别的优先级配置
+        
+        Returns:
+            Dict[str, str]: 类别名称到优先级（highest/high/medium/low）的映射
+        """
+        if not self.config:
+            return {}
+        return {name: info.get('priority', 'medium')
+                for name, info in self.config.get('source_categories', {}).items()}
+    
     def get_source_statistics(self) -> Dict:
         """
         获取新闻源统计信息
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+新闻预排序
+在抓取全文和调用GLM之前，用关键词命中、源权重、地区权重、源类别优先级和时效性
+对全部候选新闻做低成本打分，只有排名靠前的新闻才进入全文抓取和GLM精选
+"""
+
+import logging
+import math
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 源类别优先级对应的得分系数
+PRIORITY_FACTORS = {
+    'highest': 1.3,
+    'high': 1.15,
+    'medium': 1.0,
+    'low': 0.85
+}
+
+Scorer = Callable[[Dict], float]
+
+
+def keyword_scorer(news: Dict) -> float:
+    """关键词命中越多越相关，按对数递增避免长文刷分"""
+    return 1 + 0.25 * math.log2(1 + news.get('keyword_hits', 0))
+
+
+def source_weight_scorer(news: Dict) -> float:
+    """新闻源配置中的 weight"""
+    return news.get('weight', 1.0)
+
+
+def make_region_scorer(regional_weights: Dict[str, float]) -> Scorer:
+    """按 regional_weights 配置的地区权重打分"""
+    def scorer(news: Dict) -> float:
+        return regional_weights.get(news.get('region'), 1.0)
+    return scorer
+
+
+def make_category_scorer(category_priorities: Dict[str, str]) -> Scorer:
+    """按 source_categories 配置的类别优先级打分"""
+    def scorer(news: Dict) -> float:
+        return PRIORITY_FACTORS.get(category_priorities.get(news.get('category')), 1.0)
+    return scorer
+
+
+def make_recency_scorer(half_life_days: float, today: Optional[date] = None) -> Scorer:
+    """按发布日期指数衰减，每经过 half_life_days 天得分减半"""
+    def scorer(news: Dict) -> float:
+        published = news.get('published_date')
+        if not published or half_life_days <= 0:
+            return 1.0
+        age = max(((today or date.today()) - published).days, 0)
+        return 0.5 ** (age / half_life_days)
+    return scorer
+
+
+class PreRanker:
+    """可插拔的新闻预排序器，总分为各打分器得分的乘积"""
+
+    def __init__(self, scorers: Optional[List[Tuple[str, Scorer]]] = None):
+        """
+        初始化预排序器
+
+        Args:
+            scorers: (名称, 打分函数) 列表，打分函数接收新闻字典并返回正数系数
+        """
+        self.scorers: List[Tuple[str, Scorer]] = list(scorers or [])
+
+    def add_scorer(self, name: str, scorer: Scorer):
+        """
+        注册打分器
+
+        Args:
+            name: 打分器名称（记录在 pre_rank_factors 中便于排查）
+            scorer: 打分函数
+        """
+        self.scorers.append((name, scorer))
+
+    def score(self, news: Dict) -> float:
+        """
+        计算单条新闻的预排序得分，并把各项系数记录到 pre_rank_factors
+
+        Args:
+            news: 新闻字典
+
+        Returns:
+            预排序得分
+        """
+        total = 1.0
+        factors = {}
+        for name, scorer in self.scorers:
+            factor = scorer(news)
+            factors[name] = round(factor, 3)
+            total *= factor
+        news['pre_rank_factors'] = factors
+        news['pre_rank_score'] = total
+        return total
+
+    def rank(self, news_list: List[Dict], top_n: Optional[int] = None) -> List[Dict]:
+        """
+        对新闻打分并按得分降序排列（得分相同时按发布日期降序）
+
+        Args:
+            news_list: 候选新闻列表
+            top_n: 只返回前N条，None表示全部返回
+
+        Returns:
+            排序后的新闻列表
+        """
+        for news in news_list:
+            self.score(news)
+        ranked = sorted(news_list,
+                        key=lambda x: (x['pre_rank_score'], x.get('published_date') or date.min),
+                        reverse=True)
+        if top_n is not None:
+            ranked = ranked[:top_n]
+        if ranked:
+            logger.info(f"📊 预排序: {len(news_list)} 条候选保留前 {len(ranked)} 条, "
+                        f"得分区间 {ranked[-1]['pre_rank_score']:.2f} ~ {ranked[0]['pre_rank_score']:.2f}")
+        return ranked
+
+
+def create_default_ranker(regional_weights: Optional[Dict[str, float]] = None,
+                          category_priorities: Optional[Dict[str, str]] = None,
+                          recency_half_life_days: float = 2.0) -> PreRanker:
+    """
+    创建默认的预排序器
+
+    Args:
+        regional_weights: 地区权重（news_sources_config.json 中的 regional_weights）
+        category_priorities: 源类别优先级（news_sources_config.json 中的 source_categories）
+        recency_half_life_days: 时效性得分的半衰期（天）
+
+    Returns:
+        PreRanker 实例
+    """
+    return PreRanker([
+        ('keywords', keyword_scorer),
+        ('source_weight', source_weight_scorer),
+        ('region', make_region_scorer(regional_weights or {})),
+        ('category', make_category_scorer(category_priorities or {})),
+        ('recency', make_recency_scorer(recency_half_life_days)),
+    ])
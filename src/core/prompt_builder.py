@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+按token预算组装新闻提示词
+每条新闻由标题行（完整保留）和正文摘录（按预算截断）组成：先按排序依次收录标题行，
+再把剩余预算按预排序得分成比例分配给各条正文，得分越高保留的正文越多
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from src.utils.token_estimator import estimate_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class PromptBuilder:
+    """新闻提示词组装器"""
+
+    def __init__(self, token_budget: int, min_item_tokens: int = 30, max_item_tokens: int = 400,
+                 body_format: str = "   内容: {body}\n"):
+        """
+        初始化组装器
+
+        Args:
+            token_budget: 整个提示词（含模板）的估算token上限
+            min_item_tokens: 每条收录新闻至少保留的正文token数
+            max_item_tokens: 每条新闻正文最多占用的token数
+            body_format: 正文行格式，{body} 为截断后的正文
+        """
+        self.token_budget = token_budget
+        self.min_item_tokens = min_item_tokens
+        self.max_item_tokens = max_item_tokens
+        self.body_format = body_format
+        self.body_overhead = estimate_tokens(body_format.format(body=''))
+
+    def build(self, entries: List[Dict], template: str = '', name: str = '提示词',
+              max_items: Optional[int] = None) -> Dict:
+        """
+        组装新闻文本
+
+        Args:
+            entries: 已按重要性排序的新闻条目，每条包含 header（标题行）、body（正文）、score（得分）
+            template: 提示词模板（只用于扣除模板本身占用的预算）
+            name: 用于日志的调用名称
+            max_items: 最多收录的条数（例如受输出token上限约束时）
+
+        Returns:
+            Dict: news_text（组装后的新闻文本）、included（收录条数）、total（候选条数）、
+                  truncated（正文被截断的条数）、prompt_tokens（估算的提示词token数）、budget
+        """
+        template_tokens = estimate_tokens(template)
+        available = self.token_budget - template_tokens
+
+        # 按顺序收录标题行，并为每条正文预留最低预算
+        included = []
+        used = 0
+        for entry in entries[:max_items]:
+            cost = estimate_tokens(entry['header'])
+            if entry.get('body'):
+                cost += self.body_overhead + self.min_item_tokens
+            if included and used + cost > available:
+                break
+            included.append(entry)
+            used += cost
+
+        allocations = self._allocate(included, available - used)
+
+        parts = []
+        truncated = 0
+        for entry, allocation in zip(included, allocations):
+            part = entry['header']
+            body = entry.get('body') or ''
+            if body:
+                excerpt = truncate_to_tokens(body, allocation)
+                if len(excerpt) < len(body):
+                    truncated += 1
+                    excerpt = excerpt.rstrip() + "..."
+                part += self.body_format.format(body=excerpt)
+            parts.append(part)
+
+        news_text = "\n".join(parts)
+        report = {
+            'news_text': news_text,
+            'included': len(included),
+            'total': len(entries),
+            'truncated': truncated,
+            'prompt_tokens': template_tokens + estimate_tokens(news_text),
+            'budget': self.token_budget
+        }
+        logger.info(f"📝 {name}: 收录 {report['included']}/{report['total']} 条新闻, "
+                    f"{truncated} 条正文截断, 提示词约 {report['prompt_tokens']} tokens (预算 {self.token_budget})")
+        return report
+
+    def _allocate(self, entries: List[Dict], extra: int) -> List[int]:
+        """
+        在最低预算之外，把 extra 个token按得分成比例分配给各条正文，
+        已满足需求（正文全文或 max_item_tokens）的条目不再分配，剩余部分继续分给其他条目
+        """
+        demands = [min(estimate_tokens(entry.get('body') or ''), self.max_item_tokens) for entry in entries]
+        allocations = [min(demand, self.min_item_tokens) for demand in demands]
+        extra = max(extra, 0)
+        open_items = [i for i, demand in enumerate(demands) if allocations[i] < demand]
+        while extra > 0 and open_items:
+            weights = {i: max(entries[i].get('score') or 0, 1e-6) for i in open_items}
+            total_weight = sum(weights.values())
+            given = 0
+            for i in open_items:
+                share = int(extra * weights[i] / total_weight)
+                grant = min(share, demands[i] - allocations[i])
+                allocations[i] += grant
+                given += grant
+            open_items = [i for i in open_items if allocations[i] < demands[i]]
+            if given == 0:
+                break
+            extra -= given
+        return allocations
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+快报文件元数据清单
+持久化记录每个 news*.html 的修改时间、大小、内容哈希和提取出的标题/摘要/日期，
+重建索引时只重新解析发生变化的文件，已解析过的历史快报直接读取清单
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _file_hash(filepath: str) -> str:
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ReportManifest:
+    """快报元数据清单（JSON文件）"""
+
+    def __init__(self, path: str, extractor: Callable[[str], Optional[Dict]], version: str = '1'):
+        """
+        加载清单
+
+        Args:
+            path: 清单文件路径
+            extractor: 从快报文件提取元数据的函数，返回可JSON序列化的字典，失败时返回None
+            version: 提取逻辑的版本号，与清单中记录的不一致时丢弃全部旧记录
+        """
+        self.path = path
+        self.extractor = extractor
+        self.version = version
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self.stats = {'reused': 0, 'rehashed': 0, 'parsed': 0, 'removed': 0}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"快报清单读取失败，将重新解析全部文件: {e}")
+            return
+        if manifest.get('version') != self.version:
+            logger.info("快报提取逻辑已更新，重新解析全部文件")
+            self.dirty = True
+            return
+        self.entries = manifest.get('files', {})
+
+    @staticmethod
+    def _key(filepath: str) -> str:
+        return os.path.normpath(filepath)
+
+    def lookup(self, filepath: str, verify: bool = True) -> Optional[Dict]:
+        """
+        获取文件的元数据，文件有变化时重新提取
+
+        Args:
+            filepath: 快报文件路径
+            verify: 是否检查文件是否变化；为False时只要清单中有记录就直接使用
+
+        Returns:
+            提取出的元数据，文件不存在或提取失败时返回None
+        """
+        key = self._key(filepath)
+        entry = self.entries.get(key)
+        if entry is not None and not verify:
+            self.stats['reused'] += 1
+            return entry['data']
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            self._remove(key)
+            return None
+
+        if entry is not None and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.stats['reused'] += 1
+            return entry['data']
+
+        content_hash = _file_hash(filepath)
+        if entry is not None and entry['hash'] == content_hash:
+            # 内容未变，只是修改时间变了（如重新检出），不必重新解析
+            self.stats['rehashed'] += 1
+            entry.update(mtime=stat.st_mtime_ns, size=stat.st_size)
+            self.dirty = True
+            return entry['data']
+
+        data = self.extractor(filepath)
+        self.stats['parsed'] += 1
+        if data is None:
+            self._remove(key)
+            return None
+        self.entries[key] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': content_hash, 'data': data}
+        self.dirty = True
+        return data
+
+    def refresh(self, filepaths: Iterable[str], changed: Optional[Iterable[str]] = None) -> List[Tuple[str, Dict]]:
+        """
+        获取一组文件的元数据
+
+        Args:
+            filepaths: 当前全部快报文件
+            changed: 已知发生变化的文件（如文件监控事件），提供时其余已记录的文件不再检查；
+                     为None时检查每个文件的修改时间和大小
+
+        Returns:
+            与 filepaths 顺序一致的 (文件路径, 元数据) 列表（跳过提取失败的文件）
+        """
+        changed_keys = None if changed is None else {self._key(path) for path in changed}
+        results = []
+        for filepath in filepaths:
+            verify = changed_keys is None or self._key(filepath) in changed_keys
+            data = self.lookup(filepath, verify=verify)
+            if data is not None:
+                results.append((filepath, data))
+        return results
+
+    def prune(self, filepaths: Iterable[str]):
+        """
+        移除清单中已不存在的文件
+
+        Args:
+            filepaths: 当前全部快报文件
+        """
+        current = {self._key(path) for path in filepaths}
+        for key in [key for key in self.entries if key not in current]:
+            self._remove(key)
+
+    def _remove(self, key: str):
+        if self.entries.pop(key, None) is not None:
+            self.stats['removed'] += 1
+            self.dirty = True
+
+    def save(self):
+        """有变化时原子写入清单"""
+        if not self.dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'files': self.entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.warning(f"快报清单保存失败: {e}")
+
+    def take_stats(self) -> Dict[str, int]:
+        """取出本次重建的解析统计并清零"""
+        stats, self.stats = self.stats, dict.fromkeys(self.stats, 0)
+        return stats
+
+    def log_stats(self):
+        """输出本次重建的解析统计"""
+        stats = self.take_stats()
+        logger.info(f"📇 快报清单: 复用 {stats['reused']} 个, 内容未变 {stats['rehashed']} 个, "
+                    f"重新解析 {stats['parsed']} 个, 移除 {stats['removed']} 个")
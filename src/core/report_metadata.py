@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+快报结构化元数据
+生成快报时在HTML旁写入同名JSON（newsYYYYMMDD.json），记录标题、摘要、分类、统计和来源，
+索引生成器直接读取，不必再从HTML中解析；没有JSON的旧快报仍回退到HTML解析
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# 写入元数据的新闻字段（其余字段如正文、发布日期对象不写入）
+ITEM_FIELDS = ('title', 'summary', 'source', 'region', 'impact_level', 'link')
+
+
+def sidecar_path(html_path: str) -> str:
+    """快报HTML对应的元数据文件路径"""
+    return os.path.splitext(html_path)[0] + '.json'
+
+
+def build_report_metadata(analysis_result: Dict, date_str: str, title: str, html_path: str) -> Dict:
+    """
+    根据分析结果构建快报元数据
+
+    Args:
+        analysis_result: generate_news_analysis 的分析结果
+        date_str: 报告日期（YYYYMMDD）
+        title: 快报HTML的标题
+        html_path: 快报HTML文件名
+
+    Returns:
+        可JSON序列化的元数据
+    """
+    categories = {
+        category: [{field: item[field] for field in ITEM_FIELDS if item.get(field) is not None}
+                   for item in items]
+        for category, items in (analysis_result.get('categories') or {}).items()
+    }
+    headline = next((items[0]['title'] for items in categories.values() if items and items[0].get('title')), '')
+    return {
+        'schema': SCHEMA_VERSION,
+        'report': os.path.basename(html_path),
+        'date': date_str,
+        'title': title,
+        'summary': analysis_result.get('summary', ''),
+        'headline': headline,
+        'total_news': analysis_result.get('total_news', 0),
+        'original_count': analysis_result.get('original_count', 0),
+        'enhanced_count': analysis_result.get('enhanced_count', 0),
+        'total_chars': analysis_result.get('total_chars', 0),
+        'category_counts': {category: len(items) for category, items in categories.items()},
+        'categories': categories,
+        'sources': sorted(analysis_result.get('sources') or []),
+        'regions': sorted(analysis_result.get('regions') or []),
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def write_report_metadata(html_path: str, metadata: Dict) -> str:
+    """
+    原子写入快报元数据
+
+    Args:
+        html_path: 快报HTML文件路径
+        metadata: build_report_metadata 构建的元数据
+
+    Returns:
+        元数据文件路径
+    """
+    path = sidecar_path(html_path)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        # default=str 兜底，避免个别字段中的日期对象导致写入失败
+        json.dump(metadata, f, ensure_ascii=False, indent=2, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_report_metadata(html_path: str) -> Optional[Dict]:
+    """
+    读取快报HTML对应的元数据
+
+    Args:
+        html_path: 快报HTML文件路径
+
+    Returns:
+        元数据，文件不存在、损坏或版本不兼容时返回None（调用方回退到HTML解析）
+    """
+    path = sidecar_path(html_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"快报元数据读取失败，回退到HTML解析 {path}: {e}")
+        return None
+    if not isinstance(metadata, dict) or metadata.get('schema') != SCHEMA_VERSION:
+        return None
+    return metadata
+
+
+def report_date(metadata: Dict) -> Optional[datetime]:
+    """元数据中的报告日期，缺失或格式错误时返回None"""
+    try:
+        return datetime.strptime(metadata['date'], '%Y%m%d')
+    except (KeyError, TypeError, ValueError):
+        return None
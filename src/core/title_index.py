@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GLM精选结果与候选新闻的对应
+优先使用提示词中携带的新闻编号；编号缺失或无效时，依次按规范化标题精确查找、
+按标题二字组倒排索引做模糊匹配（Dice系数），避免逐条两两比较标题
+"""
+
+import logging
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize_title(title: str) -> str:
+    """
+    规范化标题：全角转半角、转小写、去掉空白和标点
+
+    Args:
+        title: 原始标题
+
+    Returns:
+        规范化后的标题
+    """
+    return _NON_WORD_RE.sub('', unicodedata.normalize('NFKC', title or '').lower())
+
+
+def _bigrams(text: str) -> Counter:
+    if len(text) < 2:
+        return Counter([text] if text else [])
+    return Counter(text[i:i + 2] for i in range(len(text) - 1))
+
+
+class TitleIndex:
+    """候选新闻标题索引"""
+
+    def __init__(self, titles: List[str], min_similarity: float = 0.5):
+        """
+        建立索引
+
+        Args:
+            titles: 候选新闻标题（下标即新闻在候选列表中的位置）
+            min_similarity: 模糊匹配的最低Dice相似度
+        """
+        self.min_similarity = min_similarity
+        self.exact: Dict[str, int] = {}
+        self.sizes: List[int] = []
+        self.postings: Dict[str, List[tuple]] = {}
+        for i, title in enumerate(titles):
+            normalized = normalize_title(title)
+            self.exact.setdefault(normalized, i)
+            grams = _bigrams(normalized)
+            self.sizes.append(sum(grams.values()))
+            for gram, count in grams.items():
+                self.postings.setdefault(gram, []).append((i, count))
+
+    def lookup(self, title: str, exclude: Set[int] = frozenset()) -> Optional[int]:
+        """
+        查找标题对应的候选下标
+
+        Args:
+            title: 待查找的标题
+            exclude: 已被选中、不再参与匹配的下标
+
+        Returns:
+            候选下标，找不到时返回None
+        """
+        normalized = normalize_title(title)
+        if not normalized:
+            return None
+        index = self.exact.get(normalized)
+        if index is not None and index not in exclude:
+            return index
+
+        query = _bigrams(normalized)
+        query_size = sum(query.values())
+        shared = [0] * len(self.sizes)
+        for gram, query_count in query.items():
+            for i, count in self.postings.get(gram, ()):
+                shared[i] += count if count < query_count else query_count
+        best, best_score = None, 0.0
+        for i, count in enumerate(shared):
+            if not count or i in exclude:
+                continue
+            score = 2 * count / (query_size + self.sizes[i])
+            if score > best_score:
+                best, best_score = i, score
+        return best if best_score >= self.min_similarity else None
+
+
+def resolve_selection(selected_items: List[Dict], titles: List[str]) -> List[int]:
+    """
+    把GLM精选结果解析为候选新闻下标
+
+    Args:
+        selected_items: GLM返回的精选条目，包含 id（提示词中的新闻编号，从1开始）和 title
+        titles: 候选新闻标题
+
+    Returns:
+        按精选顺序排列、去重后的候选下标
+    """
+    index = TitleIndex(titles)
+    selected: List[int] = []
+    chosen: Set[int] = set()
+    by_title = unresolved = 0
+    for item in selected_items:
+        if not isinstance(item, dict):
+            unresolved += 1
+            continue
+        position = _parse_id(item.get('id'), len(titles))
+        if position is None or position in chosen:
+            position = index.lookup(str(item.get('title', '')), exclude=chosen)
+            if position is None:
+                unresolved += 1
+                continue
+            by_title += 1
+        selected.append(position)
+        chosen.add(position)
+
+    if by_title or unresolved:
+        logger.info(f"🔎 精选结果对应: 编号 {len(selected) - by_title} 条, 标题匹配 {by_title} 条, "
+                    f"无法对应 {unresolved} 条")
+    return selected
+
+
+def _parse_id(value, count: int) -> Optional[int]:
+    """解析新闻编号（兼容 3、"3"、"[3]" 等写法），返回从0开始的下标"""
+    match = re.search(r'\d+', str(value)) if value is not None else None
+    if not match:
+        return None
+    position = int(match.group(0)) - 1
+    return position if 0 <= position < count else None
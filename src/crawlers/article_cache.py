@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文章内容缓存
+以规范化URL的SHA-256为键，持久化增强爬虫提取出的标题、正文、摘要和元数据
+"""
+
+import hashlib
+import os
+from typing import Dict, Optional
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+from src.utils.disk_cache import SQLiteCache
+
+DEFAULT_CACHE_PATH = os.path.join('output', 'cache', 'articles.sqlite3')
+
+# 不影响页面内容的跟踪参数：TRACKING_PARAMS 按完整名称匹配，TRACKING_PREFIXES 按前缀匹配
+# （fromDate、from_id 等真实参数不能按 from 前缀去掉，否则不同文章会共用一个缓存键）
+TRACKING_PARAMS = frozenset(('spm', 'from', 'fbclid', 'gclid'))
+TRACKING_PREFIXES = ('utm_',)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    规范化URL：统一协议和主机大小写，去掉片段、跟踪参数和末尾斜杠，参数排序
+
+    Args:
+        url: 原始URL
+
+    Returns:
+        规范化后的URL
+    """
+    parsed = urlparse(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+             if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)]
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        path,
+        parsed.params,
+        urlencode(sorted(query)),
+        ''
+    ))
+
+
+class ArticleCache:
+    """文章提取结果缓存"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, ttl: float = 7 * 24 * 3600,
+                 max_entries: int = 5000):
+        """
+        初始化文章缓存
+
+        Args:
+            db_path: SQLite数据库路径
+            ttl: 缓存有效期（秒）
+            max_entries: 最大缓存文章数
+        """
+        self.store = SQLiteCache(db_path, ttl=ttl, max_entries=max_entries, name="文章缓存")
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """计算URL对应的缓存键"""
+        return hashlib.sha256(canonicalize_url(url).encode('utf-8')).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """读取文章提取结果"""
+        return self.store.get(self.key_for(url))
+
+    def set(self, url: str, result: Dict) -> None:
+        """写入文章提取结果（仅缓存成功的结果）"""
+        if result.get('success'):
+            self.store.set(self.key_for(url), result)
+
+    def stats(self) -> Dict:
+        """获取命中统计"""
+        return self.store.stats()
+
+    def log_stats(self):
+        """将命中统计写入运行日志"""
+        self.store.log_stats()
+
+    def close(self):
+        """关闭缓存"""
+        self.store.close()
@@ -6,19 +6,51 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+import os
 import re
+import sys
 import time
 import logging
-from typing import Dict, Optional, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional, List, Iterator
 from urllib.parse import urljoin, urlparse
 import json
 
+try:
+    from src.crawlers.lxml_extractor import LXML_AVAILABLE, LxmlArticleExtractor, select_content_node
+    from src.utils.profiler import span
+except ImportError:
+    # 在 src/crawlers 目录下直接运行时，从项目根目录导入 src/utils 中的模块
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.utils.profiler import span
+    from lxml_extractor import LXML_AVAILABLE, LxmlArticleExtractor, select_content_node
+
 logger = logging.getLogger(__name__)
 
 class EnhancedNewsCrawler:
-    def __init__(self):
+    def __init__(self, cache=None, pool_connections: int = 20, pool_maxsize: int = 4,
+                 rate_limiter=None):
+        """
+        初始化爬虫
+        
+        爬虫实例应在整个运行期间复用，会话中的连接池会保持长连接，
+        同一主机的后续请求无需重新建立TCP/TLS连接。用完后调用 close()。
+        
+        Args:
+            cache: 可选的文章内容缓存（ArticleCache），命中时跳过网络请求和解析
+            pool_connections: 缓存连接池的主机数量
+            pool_maxsize: 每个主机保持的最大连接数
+            rate_limiter: 可选的按域名限速器（DomainRateLimiter），只作用于实际发出的网络请求
+        """
+        self.cache = cache
+        self.rate_limiter = rate_limiter
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -59,53 +91,78 @@ class EnhancedNewsCrawler:
             '.comments', '.comment', '.sidebar', '.menu', '.navigation',
             '.breadcrumb', '.tags', '.author-info', '.share-buttons'
         ]
+        
+        # lxml可用时使用单次遍历提取引擎，否则退回BeautifulSoup
+        self.extractor = None
+        if LXML_AVAILABLE:
+            self.extractor = LxmlArticleExtractor(self.content_selectors, self.remove_selectors)
     
-    def extract_article_content(self, url: str, max_length: int = 3000) -> Dict:
+    def extract_article_content(self, url: str, max_length: int = 3000, rate_limiter=None) -> Dict:
         """
         提取文章完整内容
         
         Args:
             url: 文章链接
             max_length: 最大内容长度
+            rate_limiter: 本次请求使用的按域名限速器，默认使用爬虫自身的限速器
             
         Returns:
             包含标题、内容、摘要等信息的字典
         """
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached:
+                logger.info(f"文章缓存命中: {url}")
+                cached['url'] = url
+                return self._truncate_result(cached, max_length)
+        
         try:
             logger.info(f"正在抓取文章内容: {url}")
             
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 提取标题
-            title = self._extract_title(soup)
-            
-            # 提取主要内容
-            content = self._extract_main_content(soup, url)
-            
-            # 提取摘要
-            summary = self._extract_summary(soup, content)
-            
-            # 提取关键信息
-            metadata = self._extract_metadata(soup)
+            rate_limiter = rate_limiter or self.rate_limiter
+            with span('article.fetch', url=url):
+                if rate_limiter is not None:
+                    with rate_limiter.acquire(url):
+                        response = self.session.get(url, timeout=15)
+                else:
+                    response = self.session.get(url, timeout=15)
+                response.raise_for_status()
             
-            # 清理和截断内容
-            if content and len(content) > max_length:
-                content = content[:max_length] + "..."
+            with span('article.parse', url=url):
+                if self.extractor is not None:
+                    declared = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+                    title, content, summary, metadata = self._extract_with_lxml(response.content, url, declared)
+                else:
+                    soup = BeautifulSoup(response.content, 'html.parser')
+                    
+                    # 提取标题
+                    title = self._extract_title(soup)
+                    
+                    # 提取主要内容
+                    content = self._extract_main_content(soup, url)
+                    
+                    # 提取摘要
+                    summary = self._extract_summary(soup, content)
+                    
+                    # 提取关键信息
+                    metadata = self._extract_metadata(soup)
             
             result = {
                 'title': title,
                 'content': content,
                 'summary': summary,
-                'word_count': len(content.split()) if content else 0,
-                'char_count': len(content) if content else 0,
                 'metadata': metadata,
                 'url': url,
                 'success': True
             }
             
+            # 缓存未截断的结果，不同max_length的调用可共享
+            if self.cache is not None:
+                self.cache.set(url, result)
+            
+            # 清理和截断内容
+            result = self._truncate_result(result, max_length)
+            
             logger.info(f"成功提取内容: {title[:50]}... ({result['char_count']}字符)")
             return result
             
@@ -123,6 +180,50 @@ class EnhancedNewsCrawler:
                 'error': str(e)
             }
     
+    def close(self):
+        """关闭会话，释放连接池"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _truncate_result(self, result: Dict, max_length: int) -> Dict:
+        """截断内容并计算字数统计"""
+        result = dict(result)
+        content = result.get('content') or ''
+        if len(content) > max_length:
+            content = content[:max_length] + "..."
+        result['content'] = content
+        result['word_count'] = len(content.split()) if content else 0
+        result['char_count'] = len(content)
+        return result
+    
+    def _extract_with_lxml(self, html: bytes, url: str, encoding: str = None):
+        """
+        使用lxml单次遍历引擎提取标题、正文、摘要和元数据
+        
+        Args:
+            html: 页面原始字节
+            url: 页面地址
+            encoding: HTTP头中显式声明的字符集
+            
+        Returns:
+            (title, content, summary, metadata)
+        """
+        domain = urlparse(url).netloc.lower()
+        extracted = self.extractor.extract(html, domain, encoding)
+        
+        content = extracted['content']
+        if not content:
+            content = self.extractor.generic_content(extracted['root'])
+        content = self._clean_content(content)
+        
+        summary = extracted['meta_description'] or self._summary_from_content(content)
+        return extracted['title'], content, summary, extracted['metadata']
+    
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """提取文章标题"""
         # 尝试多种标题选择器
@@ -178,20 +279,9 @@ class EnhancedNewsCrawler:
     
     def _extract_content_generic(self, soup: BeautifulSoup) -> str:
         """通用内容提取方法"""
-        # 查找最可能包含主要内容的元素
-        content_candidates = []
-        
-        # 查找包含大量文本的div或p标签
-        for tag in ['div', 'section', 'article']:
-            elements = soup.find_all(tag)
-            for element in elements:
-                text = element.get_text(strip=True)
-                if len(text) > 200:  # 至少200字符
-                    content_candidates.append((element, len(text)))
-        
-        if content_candidates:
-            # 选择文本最长的元素
-            best_element = max(content_candidates, key=lambda x: x[1])[0]
+        # 按可读性得分选择最可能包含主要内容的元素
+        best_element = self._best_content_node(soup)
+        if best_element is not None:
             content = best_element.get_text(separator='\n', strip=True)
             return self._clean_content(content)
         
@@ -203,6 +293,31 @@ class EnhancedNewsCrawler:
         
         return ""
     
+    @staticmethod
+    def _best_content_node(soup: BeautifulSoup, min_length: int = 200):
+        """
+        返回得分最高的正文容器，评分见 lxml_extractor.select_content_node
+        
+        文本长度口径与 get_text(strip=True) 一致，避免对每个 div/section/article 重复调用 get_text
+        
+        Args:
+            soup: 已移除噪声节点的文档
+            min_length: 候选容器的最小文本长度
+            
+        Returns:
+            得分最高的元素，没有满足条件的候选时返回 None
+        """
+        def nodes():
+            # 前序遍历的逆序保证子节点先于父节点处理
+            for node in reversed(list(soup.descendants)):
+                if isinstance(node, Tag):
+                    yield node, node.name, 0, node.parent
+                elif type(node) in (NavigableString, CData):
+                    # 注释、脚本等字符串不计入正文，与 get_text 一致
+                    yield None, '', len(node.strip()), node.parent
+        
+        return select_content_node(nodes(), min_length)
+    
     def _clean_content(self, content: str) -> str:
         """清理内容"""
         if not content:
@@ -243,6 +358,10 @@ class EnhancedNewsCrawler:
             return og_desc['content'].strip()
         
         # 如果没有meta描述，从内容中提取前200字符作为摘要
+        return self._summary_from_content(content)
+    
+    def _summary_from_content(self, content: str) -> str:
+        """从正文中按句截取不超过200字符的摘要"""
         if content:
             sentences = content.split('。')
             summary = ""
@@ -298,37 +417,74 @@ class EnhancedNewsCrawler:
         
         return metadata
     
-    def batch_extract_articles(self, urls: List[str], delay: float = 1.0) -> List[Dict]:
+    def batch_extract_articles(self, urls: List[str], delay: float = 1.0,
+                               max_workers: int = 4) -> List[Dict]:
         """
         批量提取文章内容
         
         Args:
             urls: 文章链接列表
-            delay: 请求间隔时间
+            delay: 同一域名两次请求的最小间隔（秒）
+            max_workers: 同时进行的最大请求数
             
         Returns:
-            提取结果列表
+            提取结果列表（与输入顺序一致）
         """
-        results = []
+        from src.utils.rate_limiter import DomainRateLimiter
         
-        for i, url in enumerate(urls):
-            try:
-                result = self.extract_article_content(url)
-                results.append(result)
-                
-                # 避免请求过于频繁
-                if i < len(urls) - 1:
-                    time.sleep(delay)
-                    
-            except Exception as e:
-                logger.error(f"批量提取失败 {url}: {e}")
-                results.append({
-                    'url': url,
-                    'success': False,
-                    'error': str(e)
-                })
-        
-        return results
+        limiter = DomainRateLimiter(rate=1.0 / delay if delay > 0 else 0, burst=1,
+                                    max_concurrent_per_host=1)
+        results = {}
+        for result in self.iter_extract_articles(urls, max_workers=max_workers, rate_limiter=limiter):
+            results[result['url']] = result
+        return [results[url] for url in urls]
+    
+    def iter_extract_articles(self, urls: List[str], max_workers: int = 8, rate_limiter=None,
+                              max_length: int = 3000) -> Iterator[Dict]:
+        """
+        并行提取文章内容，按完成顺序逐个产出结果
+        
+        礼貌性限速按域名生效：不同站点的请求可以并行，同一站点受令牌桶约束。
+        提交顺序按域名轮转，避免单个站点的排队占满所有工作线程。
+        
+        Args:
+            urls: 文章链接列表（重复链接只抓取一次）
+            max_workers: 同时进行的最大请求数
+            rate_limiter: 按域名限速器，默认使用爬虫自身的限速器
+            max_length: 最大内容长度
+            
+        Yields:
+            每篇文章的提取结果
+        """
+        from src.utils.rate_limiter import DomainRateLimiter
+        
+        limiter = rate_limiter or self.rate_limiter or DomainRateLimiter()
+        
+        # 按域名分组后轮转排列
+        by_domain = OrderedDict()
+        for url in OrderedDict.fromkeys(urls):
+            by_domain.setdefault(urlparse(url).netloc.lower(), []).append(url)
+        ordered = []
+        while by_domain:
+            for domain in list(by_domain):
+                ordered.append(by_domain[domain].pop(0))
+                if not by_domain[domain]:
+                    del by_domain[domain]
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='article') as executor:
+            futures = {executor.submit(self.extract_article_content, url, max_length, limiter): url
+                       for url in ordered}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logger.error(f"批量提取失败 {url}: {e}")
+                    yield {
+                        'url': url,
+                        'success': False,
+                        'error': str(e)
+                    }
 
 # 测试函数
 def test_crawler():
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RSS条件请求缓存
+按 rss_url 持久化 ETag / Last-Modified 和上次解析出的条目，
+请求时携带 If-None-Match / If-Modified-Since，服务器返回304时直接复用缓存的解析结果
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import feedparser
+
+try:
+    from src.utils.profiler import span
+except ImportError:
+    # 在 src/crawlers 目录下直接运行时，从项目根目录导入 src/utils 中的模块
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.utils.profiler import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join('output', 'cache', 'feeds')
+
+# 需要持久化的条目字段（足够支撑下游的筛选和构建新闻条目）
+ENTRY_FIELDS = ('title', 'link', 'summary', 'published', 'updated', 'author')
+TIME_FIELDS = ('published_parsed', 'updated_parsed')
+
+
+class FeedCache:
+    """基于磁盘的RSS条件请求缓存，每个源一个JSON文件"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.stats = {'not_modified': 0, 'modified': 0, 'bytes': 0}
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def load(self, url: str) -> Optional[Dict]:
+        """
+        读取某个源的缓存记录
+
+        Args:
+            url: RSS地址
+
+        Returns:
+            缓存记录，不存在或损坏时返回None
+        """
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"读取RSS缓存失败 {url}: {e}")
+            return None
+
+    def save(self, url: str, etag: Optional[str], last_modified: Optional[str], feed) -> None:
+        """
+        写入某个源的缓存记录（原子替换）
+
+        Args:
+            url: RSS地址
+            etag: 响应的ETag
+            last_modified: 响应的Last-Modified
+            feed: feedparser解析结果
+        """
+        record = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time(),
+            'entries': [self._serialize_entry(entry) for entry in feed.entries]
+        }
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"写入RSS缓存失败 {url}: {e}")
+
+    def conditional_headers(self, record: Optional[Dict]) -> Dict:
+        """根据缓存记录生成条件请求头"""
+        headers = {}
+        if record:
+            if record.get('etag'):
+                headers['If-None-Match'] = record['etag']
+            if record.get('last_modified'):
+                headers['If-Modified-Since'] = record['last_modified']
+        return headers
+
+    def fetch(self, url: str, session, timeout: float = 15) -> Tuple[object, bool]:
+        """
+        发送条件请求获取RSS
+
+        Args:
+            url: RSS地址
+            session: requests会话
+            timeout: 超时时间（秒）
+
+        Returns:
+            (解析结果, 是否命中缓存)
+        """
+        record = self.load(url)
+        response = session.get(url, headers=self.conditional_headers(record), timeout=timeout)
+
+        if response.status_code == 304 and record is not None:
+            with self._lock:
+                self.stats['not_modified'] += 1
+            logger.info(f"RSS未变化(304)，复用缓存: {url}")
+            return self._deserialize_feed(record), True
+
+        response.raise_for_status()
+        with span('feed.parse', url=url):
+            feed = feedparser.parse(response.content)
+        with self._lock:
+            self.stats['modified'] += 1
+            self.stats['bytes'] += len(response.content)
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self.save(url, etag, last_modified, feed)
+        return feed, False
+
+    def log_stats(self):
+        """输出本次运行的缓存统计"""
+        logger.info(f"RSS缓存统计: 304复用 {self.stats['not_modified']} 个, "
+                    f"重新下载 {self.stats['modified']} 个 ({self.stats['bytes']:,} 字节)")
+
+    @staticmethod
+    def _serialize_entry(entry) -> Dict:
+        data = {}
+        for field in ENTRY_FIELDS:
+            if entry.get(field):
+                data[field] = entry.get(field)
+        for field in TIME_FIELDS:
+            if entry.get(field):
+                data[field] = list(entry.get(field))[:9]
+        if entry.get('content'):
+            data['content'] = [{'value': item.get('value', '')} for item in entry.get('content')]
+        return data
+
+    @staticmethod
+    def _deserialize_feed(record: Dict):
+        entries = []
+        for data in record.get('entries', []):
+            entry = feedparser.FeedParserDict(data)
+            for field in TIME_FIELDS:
+                if field in entry:
+                    entry[field] = time.struct_time(entry[field])
+            if 'content' in entry:
+                entry['content'] = [feedparser.FeedParserDict(item) for item in entry['content']]
+            entries.append(entry)
+        return feedparser.FeedParserDict({'entries': entries, 'feed': feedparser.FeedParserDict(), 'bozo': 0})
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+并发RSS抓取器
+使用有界线程池并发抓取所有新闻源，按主机限速，并设置整体截止时间
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Optional
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.crawlers.feed_cache import FeedCache
+from src.utils.profiler import span
+from src.utils.rate_limiter import DomainRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+class ConcurrentFeedFetcher:
+    """并发RSS抓取器"""
+
+    def __init__(self, max_workers: int = 8, timeout: float = 15, deadline: float = 60,
+                 rate_limiter: DomainRateLimiter = None, headers: Dict = None,
+                 feed_cache: FeedCache = None):
+        """
+        初始化抓取器
+
+        Args:
+            max_workers: 最大并发线程数
+            timeout: 单个源的请求超时时间（秒）
+            deadline: 整个抓取阶段的截止时间（秒），超时未完成的源将被放弃
+            rate_limiter: 按主机的限速器，默认同一主机每2秒一个请求
+            headers: 请求头
+            feed_cache: RSS条件请求缓存，为None时每次完整下载
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.deadline = deadline
+        self.feed_cache = feed_cache
+        self.rate_limiter = rate_limiter or DomainRateLimiter(rate=0.5, burst=1, max_concurrent_per_host=1)
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def fetch_one(self, source: Dict) -> Dict:
+        """
+        抓取并解析单个新闻源
+
+        Args:
+            source: 新闻源配置
+
+        Returns:
+            Dict: 包含 source、feed、error、from_cache、elapsed 的结果
+        """
+        start = time.monotonic()
+        url = source['rss_url']
+        try:
+            from_cache = False
+            with span('feed.fetch', source=source.get('name', url)), self.rate_limiter.acquire(url):
+                if self.feed_cache is not None:
+                    feed, from_cache = self.feed_cache.fetch(url, self.session, timeout=self.timeout)
+                else:
+                    response = self.session.get(url, timeout=self.timeout)
+                    with span('feed.parse', source=source.get('name', url)):
+                        feed = feedparser.parse(response.content)
+            return {'source': source, 'feed': feed, 'error': None, 'from_cache': from_cache,
+                    'elapsed': time.monotonic() - start}
+        except Exception as e:
+            return {'source': source, 'feed': None, 'error': str(e), 'from_cache': False,
+                    'elapsed': time.monotonic() - start}
+
+    def fetch_all(self, sources: List[Dict]) -> List[Dict]:
+        """
+        并发抓取所有新闻源
+
+        Args:
+            sources: 新闻源配置列表
+
+        Returns:
+            List[Dict]: 按原始源顺序排列的抓取结果；截止时间内未完成的源标记为超时
+        """
+        if not sources:
+            return []
+
+        results: List[Optional[Dict]] = [None] * len(sources)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='feed')
+        futures = {executor.submit(self.fetch_one, source): i for i, source in enumerate(sources)}
+        end_time = time.monotonic() + self.deadline
+        pending = set(futures)
+
+        try:
+            while pending:
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results[futures[future]] = result
+                    if result['error']:
+                        logger.error(f"抓取 {result['source']['name']} 失败: {result['error']}")
+                    else:
+                        cache_note = "，304复用缓存" if result['from_cache'] else ""
+                        logger.info(f"已抓取 {result['source']['name']} 的RSS源 ({result['elapsed']:.1f}s{cache_note})")
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        for future in pending:
+            index = futures[future]
+            logger.warning(f"⚠️ {sources[index]['name']} 超出抓取截止时间({self.deadline}s)，已放弃")
+            results[index] = {'source': sources[index], 'feed': None,
+                              'error': 'deadline exceeded', 'from_cache': False,
+                              'elapsed': self.deadline}
+
+        return results
+
+    def close(self):
+        """关闭会话"""
+        self.session.close()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基于lxml的单次遍历文章提取引擎
+一次深度优先遍历同时完成：噪声节点标记、标题候选、meta描述、元数据和正文候选收集，
+替代 BeautifulSoup(html.parser) 上的多轮 select() 扫描
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    import lxml.html
+except ImportError:
+    # 未安装lxml时 LxmlArticleExtractor 不可用，但可读性评分 select_content_node 与解析库无关，仍可使用
+    lxml = None
+
+LXML_AVAILABLE = lxml is not None
+
+_SELECTOR_RE = re.compile(
+    r'^(?P<tag>[a-zA-Z][a-zA-Z0-9]*)?'
+    r'(?P<classes>(?:\.[\w-]+)*)'
+    r'(?:\[(?P<attr>[\w-]+)(?:="?(?P<value>[^"\]]*)"?)?\])?$'
+)
+
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+# 与原BeautifulSoup实现保持一致的候选规则
+TITLE_SELECTORS = [
+    'h1.article-title', 'h1.post-title', 'h1.entry-title',
+    'h1.title', '.article-header h1', '.post-header h1',
+    'h1', 'title'
+]
+TIME_SELECTORS = ['time[datetime]', '.publish-time', '.post-date', '.article-date', '[datetime]']
+AUTHOR_SELECTORS = ['.author', '.byline', '.post-author', '.article-author']
+TAG_SELECTORS = ['.tags a', '.post-tags a', '.article-tags a']
+
+
+class _Compound:
+    """简单选择器：tag、.class、[attr] 或 [attr="value"] 的组合"""
+    __slots__ = ('tag', 'classes', 'attr', 'value')
+
+    def __init__(self, text: str):
+        match = _SELECTOR_RE.match(text)
+        if not match:
+            raise ValueError(f"不支持的选择器: {text}")
+        self.tag = (match.group('tag') or '').lower() or None
+        self.classes = frozenset(c for c in match.group('classes').split('.') if c)
+        self.attr = match.group('attr')
+        self.value = match.group('value')
+
+    def matches(self, element, tag: str, classes: frozenset) -> bool:
+        if self.tag and self.tag != tag:
+            return False
+        if self.classes and not self.classes <= classes:
+            return False
+        if self.attr:
+            actual = element.get(self.attr)
+            if actual is None or (self.value is not None and actual != self.value):
+                return False
+        return True
+
+
+class _Selector:
+    """支持一级后代关系（如 '.tags a'）的选择器"""
+    __slots__ = ('key', 'target', 'ancestor')
+
+    def __init__(self, text: str, key: Tuple):
+        parts = text.split()
+        if len(parts) > 2:
+            raise ValueError(f"不支持的选择器: {text}")
+        self.key = key
+        self.target = _Compound(parts[-1])
+        self.ancestor = _Compound(parts[0]) if len(parts) == 2 else None
+
+    def matches(self, element, tag: str, classes: frozenset) -> bool:
+        if not self.target.matches(element, tag, classes):
+            return False
+        if self.ancestor is None:
+            return True
+        for parent in element.iterancestors():
+            if isinstance(parent.tag, str) and self.ancestor.matches(
+                    parent, parent.tag.lower(), _classes_of(parent)):
+                return True
+        return False
+
+
+class _SelectorIndex:
+    """按标签名和类名索引选择器，每个元素只检查可能命中的规则"""
+
+    def __init__(self):
+        self.by_tag: Dict[str, List[_Selector]] = {}
+        self.by_class: Dict[str, List[_Selector]] = {}
+        self.generic: List[_Selector] = []
+
+    def add(self, text: str, key: Tuple):
+        selector = _Selector(text, key)
+        target = selector.target
+        if target.classes:
+            self.by_class.setdefault(next(iter(sorted(target.classes))), []).append(selector)
+        elif target.tag:
+            self.by_tag.setdefault(target.tag, []).append(selector)
+        else:
+            self.generic.append(selector)
+
+    def match(self, element, tag: str, classes: frozenset):
+        candidates = list(self.by_tag.get(tag, ()))
+        for cls in classes:
+            candidates.extend(self.by_class.get(cls, ()))
+        candidates.extend(self.generic)
+        for selector in candidates:
+            if selector.matches(element, tag, classes):
+                yield selector.key
+
+
+def _classes_of(element) -> frozenset:
+    value = element.get('class')
+    return frozenset(value.split()) if value else frozenset()
+
+
+def detect_encoding(html: bytes, declared: str = None) -> str:
+    """
+    判断页面编码：优先页面meta声明，其次HTTP头声明，最后尝试UTF-8并退回GB18030
+
+    Args:
+        html: 页面原始字节
+        declared: Content-Type 头中显式声明的字符集
+
+    Returns:
+        编码名称
+    """
+    match = _META_CHARSET_RE.search(html[:4096])
+    if match:
+        return match.group(1).decode('ascii', 'ignore').lower()
+    if declared:
+        return declared
+    try:
+        html.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'gb18030'
+
+
+def element_text(element, separator: str = '') -> str:
+    """等价于 BeautifulSoup 的 get_text(separator, strip=True)"""
+    return separator.join(piece.strip() for piece in element.itertext() if piece.strip())
+
+
+class LxmlArticleExtractor:
+    """单次遍历的文章提取器"""
+
+    def __init__(self, content_selectors: Dict[str, List[str]], remove_selectors: List[str]):
+        """
+        初始化提取器
+
+        Args:
+            content_selectors: 域名到正文选择器列表的映射，'generic' 为默认规则
+            remove_selectors: 需要移除的噪声节点选择器
+        """
+        self.content_selectors = content_selectors
+        self.remove_selectors = remove_selectors
+        self._indexes: Dict[str, _SelectorIndex] = {}
+
+    def _index_for(self, domain: str) -> Tuple[_SelectorIndex, int]:
+        key = domain if domain in self.content_selectors else 'generic'
+        if key not in self._indexes:
+            index = _SelectorIndex()
+            for selector in self.remove_selectors:
+                index.add(selector, ('remove', 0))
+            for i, selector in enumerate(TITLE_SELECTORS):
+                index.add(selector, ('title', i))
+            for i, selector in enumerate(TIME_SELECTORS):
+                index.add(selector, ('time', i))
+            for i, selector in enumerate(AUTHOR_SELECTORS):
+                index.add(selector, ('author', i))
+            for i, selector in enumerate(TAG_SELECTORS):
+                index.add(selector, ('tags', i))
+            for i, selector in enumerate(self.content_selectors[key]):
+                index.add(selector, ('content', i))
+            index.add('meta', ('meta', 0))
+            self._indexes[key] = index
+        return self._indexes[key], len(self.content_selectors[key])
+
+    def extract(self, html: bytes, domain: str, encoding: str = None) -> Dict:
+        """
+        提取文章信息
+
+        Args:
+            html: 页面原始字节
+            domain: 页面域名（用于选择站点特定规则）
+            encoding: HTTP头中显式声明的字符集
+
+        Returns:
+            Dict: title、content（未清洗）、meta_description、metadata，
+                  以及已移除噪声节点的文档根节点 root（供通用正文提取使用）
+        """
+        if not html or not html.strip():
+            return {'title': "未知标题", 'content': "", 'meta_description': "",
+                    'metadata': {}, 'root': lxml.html.Element('html')}
+
+        parser = lxml.html.HTMLParser(encoding=detect_encoding(html, encoding))
+        root = lxml.html.fromstring(html, parser=parser)
+        index, content_count = self._index_for(domain)
+
+        titles: Dict[int, object] = {}
+        times: Dict[int, object] = {}
+        authors: Dict[int, object] = {}
+        tag_links: Dict[int, list] = {}
+        contents: List[list] = [[] for _ in range(content_count)]
+        meta = {}
+        to_drop = []
+
+        # 深度优先前序遍历，保证各候选按文档顺序收集
+        stack = [(root, False)]
+        while stack:
+            element, removed = stack.pop()
+            if not isinstance(element.tag, str):
+                # 注释和处理指令不参与正文
+                if not removed:
+                    to_drop.append(element)
+                continue
+
+            tag = element.tag.lower()
+            classes = _classes_of(element)
+            keys = list(index.match(element, tag, classes))
+
+            if not removed and any(kind == 'remove' for kind, _ in keys):
+                removed = True
+                to_drop.append(element)
+
+            for kind, priority in keys:
+                if kind == 'title':
+                    # 标题在移除噪声之前提取（与原实现一致）
+                    titles.setdefault(priority, element)
+                elif kind == 'meta':
+                    name = element.get('name') or element.get('property')
+                    if name in ('description', 'og:description') and name not in meta and element.get('content'):
+                        meta[name] = element.get('content')
+                elif removed:
+                    continue
+                elif kind == 'content':
+                    contents[priority].append(element)
+                elif kind == 'time':
+                    times.setdefault(priority, element)
+                elif kind == 'author':
+                    authors.setdefault(priority, element)
+                elif kind == 'tags':
+                    tag_links.setdefault(priority, []).append(element)
+
+            for child in reversed(element):
+                stack.append((child, removed))
+
+        title = self._pick_title(titles)
+
+        for element in to_drop:
+            if element.getparent() is not None:
+                element.drop_tree()
+
+        return {
+            'title': title,
+            'content': self._pick_content(contents),
+            'meta_description': (meta.get('description') or meta.get('og:description') or '').strip(),
+            'metadata': self._build_metadata(times, authors, tag_links),
+            'root': root
+        }
+
+    @staticmethod
+    def _pick_title(titles: Dict[int, object]) -> str:
+        for priority in sorted(titles):
+            text = element_text(titles[priority])
+            if text and len(text) > 10:
+                return text
+        page_titles = titles.get(TITLE_SELECTORS.index('title'))
+        if page_titles is not None:
+            return element_text(page_titles)
+        return "未知标题"
+
+    @staticmethod
+    def _pick_content(contents: List[list]) -> str:
+        for elements in contents:
+            parts = []
+            for element in elements:
+                text = element_text(element, '\n')
+                if text and len(text) > 100:
+                    parts.append(text)
+            if parts:
+                return '\n\n'.join(parts)
+        return ""
+
+    @staticmethod
+    def _build_metadata(times: Dict, authors: Dict, tag_links: Dict) -> Dict:
+        metadata = {}
+        if times:
+            element = times[min(times)]
+            metadata['publish_time'] = element.get('datetime') or element_text(element)
+        if authors:
+            metadata['author'] = element_text(authors[min(authors)])
+        if tag_links:
+            metadata['tags'] = [element_text(a) for a in tag_links[min(tag_links)]]
+        return metadata
+
+    @staticmethod
+    def generic_content(root) -> str:
+        """
+        通用正文提取：按可读性得分选择最佳 div/section/article，最后退回到所有段落
+
+        Args:
+            root: 已移除噪声节点的文档根节点
+
+        Returns:
+            未清洗的正文文本
+        """
+        best = best_content_node(root)
+        if best is not None:
+            return element_text(best, '\n')
+
+        paragraphs = [element_text(p) for p in root.iter('p')]
+        return '\n\n'.join(p for p in paragraphs if p)
+
+
+def content_score(text_length: int, link_length: int) -> float:
+    """可读性得分：文本长度按链接密度的平方折减，包裹导航、推荐列表的外层容器得分低于正文本身"""
+    if not text_length:
+        return 0.0
+    return text_length * (1 - link_length / text_length) ** 2
+
+
+def select_content_node(nodes: Iterable[Tuple[object, str, int, object]], min_length: int = 200):
+    """
+    一次自底向上累加每个节点的文本长度与链接文本长度，返回得分最高的正文容器
+    lxml 与 BeautifulSoup 两条解析路径共用这一评分，只是遍历文档的方式不同
+
+    Args:
+        nodes: 子节点先于父节点产出的 (节点, 小写标签名, 自身直接包含的文本长度, 父节点)；
+               节点为None表示一段文本，只把长度累加到父节点
+        min_length: 候选容器的最小文本长度
+
+    Returns:
+        得分最高的 div/section/article 节点，没有满足条件的候选时返回 None
+    """
+    text_lengths: Dict[int, int] = {}
+    link_lengths: Dict[int, int] = {}
+    best, best_score = None, -1.0
+
+    for node, tag, text_length, parent in nodes:
+        link_length = 0
+        if node is not None:
+            text_length += text_lengths.pop(id(node), 0)
+            link_length = link_lengths.pop(id(node), 0)
+            if tag == 'a':
+                link_length = text_length
+            if tag in ('div', 'section', 'article') and text_length > min_length:
+                score = content_score(text_length, link_length)
+                # 得分相同时保留文档中靠前（外层）的节点
+                if score >= best_score:
+                    best, best_score = node, score
+
+        if parent is not None:
+            key = id(parent)
+            text_lengths[key] = text_lengths.get(key, 0) + text_length
+            link_lengths[key] = link_lengths.get(key, 0) + link_length
+
+    return best
+
+
+def best_content_node(root, min_length: int = 200):
+    """
+    返回lxml文档中得分最高的正文容器
+
+    文本长度口径与 element_text(element) 一致，每个文本片段只统计一次，
+    避免对每个祖先节点重复拼接文本（嵌套越深代价越高）
+
+    Args:
+        root: 文档根节点
+        min_length: 候选容器的最小文本长度
+
+    Returns:
+        得分最高的 div/section/article 元素，没有满足条件的候选时返回 None
+    """
+    # 持有全部元素，保证遍历期间节点代理对象（及其 id）不变
+    elements = list(root.iter())
+
+    def nodes():
+        # 前序遍历的逆序保证子节点先于父节点处理
+        for element in reversed(elements):
+            parent = element.getparent()
+            if element.tail and parent is not None:
+                yield None, '', len(element.tail.strip()), parent
+            is_tag = isinstance(element.tag, str)
+            text_length = len(element.text.strip()) if is_tag and element.text else 0
+            yield element, element.tag.lower() if is_tag else '', text_length, parent
+
+    return select_content_node(nodes(), min_length)
@@ -10,12 +10,26 @@ import feedparser
 from datetime import datetime, date
 import re
 import os
+import sys
 from bs4 import BeautifulSoup
 import time
 import random
 from urllib.parse import urljoin, urlparse
 import logging
 
+try:
+    from src.crawlers.feed_cache import FeedCache
+    from src.utils.keyword_matcher import KeywordMatcher
+    from src.utils.static_assets import externalize_inline_style
+    from src.utils.template_engine import render_template
+except ImportError:
+    from feed_cache import FeedCache
+    # 在 src/crawlers 目录下直接运行时，从项目根目录导入 src/utils 中的模块
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from src.utils.keyword_matcher import KeywordMatcher
+    from src.utils.static_assets import externalize_inline_style
+    from src.utils.template_engine import render_template
+
 # 导入配置文件
 try:
     from scraper_config import NEWS_SOURCES, SECURITY_KEYWORDS, USER_AGENTS, REQUEST_CONFIG, FILE_CONFIG, LOG_CONFIG
@@ -109,12 +123,15 @@ class SecurityNewsScraper:
         self.news_sources = NEWS_SOURCES
         self.today = date.today()
         self.scraped_news = []
+        self.feed_cache = FeedCache()
+        self.keyword_matcher = KeywordMatcher(SECURITY_KEYWORDS)
         
     def fetch_rss_feed(self, rss_url, source_name):
         """获取RSS订阅源的新闻"""
         try:
             logger.info(f"正在抓取 {source_name} 的RSS源: {rss_url}")
-            feed = feedparser.parse(rss_url)
+            # 条件请求：源未更新时复用上次解析结果
+            feed, _ = self.feed_cache.fetch(rss_url, self.session, timeout=REQUEST_CONFIG['timeout'])
             
             today_news = []
             for entry in feed.entries:
@@ -211,14 +228,8 @@ class SecurityNewsScraper:
         """过滤网络安全相关新闻"""
         filtered_news = []
         for news in news_list:
-            title = news['title'].lower()
-            summary = news['summary'].lower()
-            
             # 检查标题或摘要是否包含安全相关关键词
-            is_security_related = any(keyword in title or keyword in summary 
-                                    for keyword in SECURITY_KEYWORDS)
-            
-            if is_security_related:
+            if self.keyword_matcher.is_relevant(news['title'], news['summary']):
                 filtered_news.append(news)
         
         return filtered_news
@@ -251,6 +262,7 @@ class SecurityNewsScraper:
                 unique_news.append(news)
         
         self.scraped_news = unique_news
+        self.feed_cache.log_stats()
         logger.info(f"总共获取到 {len(unique_news)} 条不重复的安全新闻")
         return unique_news
     
@@ -278,296 +290,19 @@ class SecurityNewsScraper:
         today_str = self.today.strftime('%Y-%m-%d')
         news_count = len(news_list)
         
-        html_content = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>海之安安全每日快报 - {today_str} - 第{news_count}期</title>
-  
-    <style>
-      * {{
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-      }}
-      
-      body {{
-        font-family: 'Microsoft YaHei', 'SimHei', 'Arial', sans-serif;
-        background: linear-gradient(135deg, #0f172a 0%, #1e293b 50%, #334155 100%);
-        color: #f1f5f9;
-        min-height: 100vh;
-        padding: 20px;
-        line-height: 1.6;
-      }}
-      
-      .container {{
-        max-width: 1200px;
-        margin: 0 auto;
-        background: rgba(15, 23, 42, 0.95);
-        border: 1px solid rgba(59, 130, 246, 0.3);
-        border-radius: 16px;
-        box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.8), 
-                    0 0 0 1px rgba(59, 130, 246, 0.1),
-                    inset 0 1px 0 rgba(255, 255, 255, 0.1);
-        overflow: hidden;
-      }}
-      
-      .header {{
-        background: linear-gradient(90deg, rgba(59, 130, 246, 0.1) 0%, rgba(147, 51, 234, 0.1) 100%);
-        border-bottom: 1px solid rgba(59, 130, 246, 0.3);
-        padding: 40px;
-        text-align: center;
-        position: relative;
-      }}
-      
-      .header::before {{
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 2px;
-        background: linear-gradient(90deg, #3b82f6, #8b5cf6, #06b6d4);
-      }}
-      
-      .logo {{
-        width: 120px;
-        height: auto;
-        margin-bottom: 20px;
-        filter: drop-shadow(0 4px 8px rgba(59, 130, 246, 0.3));
-      }}
-      
-      .title {{
-        font-size: 36px;
-        font-weight: 700;
-        background: linear-gradient(135deg, #3b82f6, #8b5cf6);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        margin-bottom: 16px;
-        text-shadow: 0 0 30px rgba(59, 130, 246, 0.5);
-      }}
-      
-      .subtitle {{
-        font-size: 18px;
-        color: #94a3b8;
-        margin-bottom: 8px;
-      }}
-      
-      .content {{
-        padding: 40px;
-      }}
-      
-      .summary-section {{
-        background: rgba(30, 41, 59, 0.8);
-        border: 1px solid rgba(59, 130, 246, 0.2);
-        border-radius: 12px;
-        padding: 24px;
-        margin-bottom: 32px;
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.3);
-      }}
-      
-      .summary-title {{
-        font-size: 20px;
-        font-weight: 600;
-        color: #3b82f6;
-        margin-bottom: 16px;
-        display: flex;
-        align-items: center;
-        gap: 8px;
-      }}
-      
-      .summary-title::before {{
-        content: '📊';
-        font-size: 24px;
-      }}
-      
-      .summary-content {{
-        color: #cbd5e1;
-        line-height: 1.8;
-        font-size: 16px;
-      }}
-      
-      .category-section {{
-        margin-bottom: 40px;
-        background: rgba(30, 41, 59, 0.4);
-        border-radius: 12px;
-        border: 1px solid rgba(59, 130, 246, 0.15);
-        overflow: hidden;
-      }}
-      
-      .category-header {{
-        background: linear-gradient(135deg, rgba(59, 130, 246, 0.2), rgba(147, 51, 234, 0.2));
-        padding: 20px 24px;
-        border-bottom: 1px solid rgba(59, 130, 246, 0.3);
-      }}
-      
-      .category-title {{
-        font-size: 24px;
-        font-weight: 600;
-        color: #e2e8f0;
-        display: flex;
-        align-items: center;
-        gap: 12px;
-      }}
-      
-      .category-news {{
-        padding: 24px;
-      }}
-      
-      .news-item {{
-        background: rgba(51, 65, 85, 0.6);
-        border: 1px solid rgba(59, 130, 246, 0.2);
-        border-radius: 8px;
-        padding: 20px;
-        margin-bottom: 20px;
-        transition: all 0.3s ease;
-        position: relative;
-      }}
-      
-      .news-item::before {{
-        content: '';
-        position: absolute;
-        left: 0;
-        top: 0;
-        bottom: 0;
-        width: 4px;
-        background: linear-gradient(180deg, #3b82f6, #8b5cf6);
-        border-radius: 2px 0 0 2px;
-      }}
-      
-      .news-item:hover {{
-        border-color: rgba(59, 130, 246, 0.4);
-        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.15);
-      }}
-      
-      .news-title {{
-        font-size: 18px;
-        font-weight: 600;
-        color: #f1f5f9;
-        margin-bottom: 12px;
-        line-height: 1.4;
-      }}
-      
-      .news-analysis {{
-        color: #cbd5e1;
-        line-height: 1.7;
-        font-size: 15px;
-      }}
-      
-      .footer {{
-        background: rgba(15, 23, 42, 0.8);
-        border-top: 1px solid rgba(59, 130, 246, 0.3);
-        padding: 24px 40px;
-        text-align: center;
-        color: #64748b;
-        font-size: 14px;
-      }}
-      
-      /* 图标样式 */
-      .icon-focus::before {{ content: '🎯'; }}
-      .icon-risk::before {{ content: '⚠️'; }}
-      .icon-innovation::before {{ content: '🚀'; }}
-      
-      /* 打印样式 */
-      @media print {{
-        body {{
-          background: white;
-          color: black;
-          padding: 0;
-        }}
-        
-        .container {{
-          box-shadow: none;
-          border: none;
-          background: white;
-        }}
-        
-        .header {{
-          background: #f8f9fa;
-          border-bottom: 2px solid #dee2e6;
-        }}
-        
-        .title {{
-          color: #2563eb !important;
-          -webkit-text-fill-color: #2563eb !important;
-        }}
-        
-        .summary-section,
-        .category-section,
-        .news-item {{
-          background: white;
-          border: 1px solid #dee2e6;
-          color: black;
-        }}
-        
-        .summary-title,
-        .category-title {{
-          color: #2563eb;
-        }}
-        
-        .news-title {{
-          color: #1f2937;
-        }}
-        
-        .news-analysis,
-        .summary-content {{
-          color: #374151;
-        }}
-      }}
-    </style>
-  
-</head>
-<body>
-  <div class="container">
-    <div class="header">
-      <img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABLAAAAN0CAIAAAArnUa0AAAABmJLR0QA/wD/AP+gvaeTAAAgAElEQVR4nOzdd3zV1f3H8fP93pm9SCAhIey9BBkyFJyoOKt1b3FgW2e1WltrW2urXY627j1Q3AMHiooIsqcgG0IGJO/kru/390f6S0NIcs/33pvkwnk9H/3Dws3Nl+Te7z3vcz7nczTTNAUAAAAAQD16d18AAAAAAKB7EAgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAAUBSBEAAAAAAURSAEAAAAAEURCAEAAABAUQRCAAAAAFAUgRAAAAAAFEUgBAAAAABFEQgBAAAAQFEEQgAAAABQFIEQAAAAABRFIAQAAAAARREIAQAAAEBRBEIAAAAA......" alt="Ocean Security Logo" class="logo">
-      <h1 class="title">海之安安全每日快报</h1>
-      <div class="subtitle">{today_str} · 第{news_count}期</div>
-    </div>
-    
-    <div class="content">
-      
-        <div class="summary-section">
-          <h2 class="summary-title">今日摘要</h2>
-          <div class="summary-content">{summary_content}</div>
-        </div>
-      
-        <div class="category-section">
-          <div class="category-header">
-            <h2 class="category-title icon-focus">今日安全新闻</h2>
-          </div>
-          <div class="category-news">'''
-
-        # 添加新闻条目
-        for i, news in enumerate(news_list, 1):
-            # 简化摘要内容
+        # 添加新闻条目（简化摘要内容）
+        items = []
+        for news in news_list:
             summary = self.clean_html_content(news.get('summary', '') or news.get('content', ''))
-            if not summary:
-                summary = "暂无详细摘要内容"
-            
-            html_content += f'''
-        <div class="news-item">
-          <div class="news-title">{news['title']}</div>
-          <div class="news-analysis"><strong>来源：</strong>{news['source']} | <strong>分析：</strong>{summary[:300]}{'...' if len(summary) > 300 else ''}</div>
-        </div>'''
-
-        html_content += f'''
-          </div>
-        </div>
-      
-    </div>
-    
-    <div class="footer">
-      <p>© 2025 Ocean Security · 海之安安全每日快报</p>
-      <p>Generated on {current_time}</p>
-    </div>
-  </div>
-</body>
-</html>'''
+            items.append((news, summary or "暂无详细摘要内容"))
         
-        return html_content
+        return render_template('scraper_report.html', {
+            'today_str': today_str,
+            'news_count': news_count,
+            'summary_content': summary_content,
+            'items': items,
+            'current_time': current_time
+        })
     
     def save_news_file(self, html_content, filename=None):
         """保存新闻文件"""
@@ -579,6 +314,9 @@ class SecurityNewsScraper:
             filename = f"news{self.today.strftime('%Y%m%d')}.html"
         
         try:
+            # 样式发布为带内容哈希的共享样式表，快报中只保留引用
+            html_content = externalize_inline_style(html_content, 'scraper_report',
+                                                    os.path.dirname(os.path.abspath(filename)))
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write(html_content)
             logger.info(f"成功生成新闻文件: {filename}")
@@ -7,9 +7,37 @@
 
 import os
 import glob
+import tempfile
 from datetime import datetime
 from style_protection import validate_mobile_styles
 
+def report_has_mobile_styles(generator):
+    """
+    生成样例快报（引用共享样式表和内联样式两种方式），验证输出中包含移动端样式
+    
+    Args:
+        generator: 新闻生成器
+        
+    Returns:
+        bool: 两种方式生成的快报是否都包含移动端样式
+    """
+    analysis_result = {'summary': '移动端样式检查', 'categories': {}, 'total_news': 0, 'sources': []}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 共享样式表发布在当前目录下的 assets/css
+        os.chdir(tmp_dir)
+        try:
+            for filename, inline_css in (('news_linked.html', False), ('news_inline.html', True)):
+                html = generator.generate_html_report(analysis_result, datetime.now().strftime('%Y%m%d'),
+                                                      inline_css=inline_css)
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(html)
+                if not validate_mobile_styles(filename):
+                    return False
+            return True
+        finally:
+            os.chdir(cwd)
+
 def generate_protection_report():
     """
     生成移动端样式保护状态报告
@@ -60,7 +88,8 @@ def generate_protection_report():
         else:
             print("❌ 样式保护模块调用未集成")
         
-        if "ensure_mobile_responsive" in source:
+        # 在临时目录生成样例快报，检查发布的样式表和内联样式中实际包含移动端样式
+        if report_has_mobile_styles(generator):
             print("✅ 样式确保机制已集成")
         else:
             print("❌ 样式确保机制未集成")
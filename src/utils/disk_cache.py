@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基于SQLite的持久化键值缓存
+支持过期时间(TTL)和按最近访问时间淘汰(LRU)的条目数/总大小上限，线程安全
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache:
+    """SQLite键值缓存，值以JSON形式存储"""
+
+    def __init__(self, db_path: str, ttl: float = 7 * 24 * 3600, max_entries: int = 5000,
+                 name: str = "缓存", max_bytes: int = 0):
+        """
+        初始化缓存
+
+        Args:
+            db_path: SQLite数据库文件路径
+            ttl: 条目有效期（秒），<=0 表示永不过期
+            max_entries: 最大条目数，超出时淘汰最久未访问的条目
+            name: 缓存名称，用于日志
+            max_bytes: 缓存值总大小上限（字节），<=0 表示不限制；超出时同样按最久未访问淘汰
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        读取缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存值，不存在或已过期时返回None
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, created = row
+            if self.ttl > 0 and now - created > self.ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        写入缓存，必要时淘汰最久未访问的条目
+
+        Args:
+            key: 缓存键
+            value: 可JSON序列化的值
+        """
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, payload, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """删除缓存条目"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _evict(self):
+        if self.max_entries > 0:
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY accessed ASC LIMIT ?)", (overflow,)
+                )
+                self.evictions += overflow
+
+        if self.max_bytes > 0:
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(CAST(value AS BLOB))), 0) FROM entries"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                victims = []
+                for key, size in self._conn.execute(
+                        "SELECT key, LENGTH(CAST(value AS BLOB)) FROM entries ORDER BY accessed ASC"):
+                    if total <= self.max_bytes:
+                        break
+                    victims.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+                self.evictions += len(victims)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def stats(self) -> dict:
+        """获取命中统计"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def log_stats(self):
+        """将命中统计写入运行日志"""
+        stats = self.stats()
+        logger.info(f"{self.name}统计: 命中 {stats['hits']} 次, 未命中 {stats['misses']} 次, "
+                    f"淘汰 {stats['evictions']} 条, 命中率 {stats['hit_rate'] * 100:.1f}%")
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+预编译关键词匹配器
+将安全关键词和分类关键词构建为字典树并预编译为正则表达式（英文、中文各一个），
+对每段文本只扫描一次即可得到命中的关键词、分类及其命中次数
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+_WORD_CHAR_RE = re.compile(r'[a-z0-9]')
+
+# 英文复合词的常见前缀，前缀之后的关键词同样算作命中（cyberattack、anti-malware、counterattack）
+COMPOUND_PREFIXES = ('cyber', 'anti', 'counter')
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    将关键词列表构建为字典树形式的正则，同一位置优先匹配最长的关键词
+
+    Args:
+        words: 小写关键词
+
+    Returns:
+        正则表达式片段
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """单次扫描的关键词匹配器"""
+
+    def __init__(self, keywords: List[str], categories: Optional[Dict[str, List[str]]] = None):
+        """
+        初始化匹配器
+
+        Args:
+            keywords: 判断安全相关性的关键词
+            categories: 分类名称到分类关键词列表的映射
+        """
+        self.keywords = {keyword.lower(): keyword for keyword in keywords}
+        self.categories = list(categories or {})
+        self._categories_of: Dict[str, List[str]] = {}
+        for name, words in (categories or {}).items():
+            for word in words:
+                self._categories_of.setdefault(word.lower(), []).append(name)
+
+        terms = set(self.keywords) | set(self._categories_of)
+        # 英文关键词要求左侧为词边界或复合词前缀，避免 "source" 命中 "rce"，同时保留 "cyberattack"；
+        # 中文关键词按子串匹配。两类分开编译，正则引擎可以按首字符快速跳过不可能命中的位置
+        word_terms = [term for term in terms if _WORD_CHAR_RE.match(term)]
+        other_terms = [term for term in terms if not _WORD_CHAR_RE.match(term)]
+        self._patterns = []
+        if word_terms:
+            boundary = '|'.join([r'(?<![a-z0-9])'] + [f'(?<={prefix})' for prefix in COMPOUND_PREFIXES])
+            self._patterns.append(re.compile(f'(?:{boundary})' + _trie_pattern(word_terms)))
+        if other_terms:
+            self._patterns.append(re.compile(_trie_pattern(other_terms)))
+        # 同一位置只会返回最长的关键词，这里预先记录它包含的更短关键词（如"安全漏洞"包含"安全"）
+        self._prefixes = {term: [other for other in terms if term.startswith(other)] for term in terms}
+
+    def _scan(self, text: str) -> Iterable[str]:
+        """逐个产出文本中命中的关键词（小写形式），重叠的关键词分别产出"""
+        lowered = text.lower()
+        for pattern in self._patterns:
+            match = pattern.search(lowered)
+            while match:
+                yield from self._prefixes[match.group()]
+                # 从下一个字符继续查找，保留起点落在当前关键词内部的重叠命中
+                match = pattern.search(lowered, match.start() + 1)
+
+    def match(self, *texts: str) -> Dict:
+        """
+        匹配一段或多段文本
+
+        Args:
+            texts: 待匹配的文本（如标题、摘要），空值会被忽略
+
+        Returns:
+            Dict: keywords（安全关键词→命中次数）、categories（分类→命中次数）、
+                  hits（安全关键词总命中次数）、relevant（是否安全相关）
+        """
+        terms = Counter()
+        for text in texts:
+            if text:
+                terms.update(self._scan(text))
+
+        keywords = {self.keywords[term]: count for term, count in terms.items() if term in self.keywords}
+        categories = Counter()
+        for term, count in terms.items():
+            for name in self._categories_of.get(term, ()):
+                categories[name] += count
+
+        hits = sum(keywords.values())
+        return {
+            'keywords': keywords,
+            'categories': dict(categories),
+            'hits': hits,
+            'relevant': hits > 0
+        }
+
+    def is_relevant(self, *texts: str) -> bool:
+        """
+        判断文本是否包含任一安全关键词，命中即返回
+
+        Args:
+            texts: 待匹配的文本
+
+        Returns:
+            是否安全相关
+        """
+        for text in texts:
+            if text and any(term in self.keywords for term in self._scan(text)):
+                return True
+        return False
+
+    def classify(self, *texts: str, default: str = None) -> Optional[str]:
+        """
+        按分类定义顺序返回第一个命中的分类
+
+        Args:
+            texts: 待匹配的文本
+            default: 没有命中任何分类时的返回值
+
+        Returns:
+            分类名称
+        """
+        categories = self.match(*texts)['categories']
+        for name in self.categories:
+            if name in categories:
+                return name
+        return default
+
+
+_default_matcher = None
+
+
+def get_default_matcher() -> KeywordMatcher:
+    """
+    获取基于 config/glm_config.py 中 SECURITY_KEYWORDS 和 NEWS_CATEGORIES 构建的共享匹配器
+
+    Returns:
+        KeywordMatcher 实例（进程内只构建一次）
+    """
+    global _default_matcher
+    if _default_matcher is None:
+        from config.glm_config import SECURITY_KEYWORDS, NEWS_CATEGORIES
+        _default_matcher = KeywordMatcher(
+            SECURITY_KEYWORDS,
+            {name: info['keywords'] for name, info in NEWS_CATEGORIES.items()}
+        )
+    return _default_matcher
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基于SimHash的新闻近似重复检测
+标题与正文按中英文分别切词（中文取相邻二字组，英文取单词），计算64位SimHash指纹，
+通过分段(LSH)索引只比较可能相似的候选，近似线性时间完成聚类；
+每个簇保留权重最高的一条，已报道过的指纹持久化保存，用于抑制前几天的旧闻
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+
+_TOKEN_RE = re.compile(r'[a-z0-9](?:[a-z0-9.\-]*[a-z0-9])?|[\u4e00-\u9fff]+')
+_CVE_RE = re.compile(r'^cve-\d{4}-\d{4,}$')
+_STOPWORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'were', 'with'
+])
+
+# 按字节统计权重时，每个比特位对应的字节取值
+_BYTE_VALUES_WITH_BIT = [[value for value in range(256) if value >> bit & 1] for bit in range(8)]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    中英文混合切词：英文按单词（保留 CVE 编号、版本号等整体），中文按相邻二字组
+
+    Args:
+        text: 原始文本
+
+    Returns:
+        词元列表
+    """
+    tokens = []
+    for piece in _TOKEN_RE.findall(text.lower()):
+        if piece[0] >= '\u4e00':
+            if len(piece) == 1:
+                tokens.append(piece)
+            else:
+                tokens.extend(piece[i:i + 2] for i in range(len(piece) - 1))
+        elif piece not in _STOPWORDS:
+            tokens.append(piece)
+    return tokens
+
+
+@lru_cache(maxsize=65536)
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def simhash(features: Dict[str, int]) -> int:
+    """
+    计算加权特征的64位SimHash
+
+    按字节累计权重而不是逐比特累计，每个特征只需8次加法
+
+    Args:
+        features: 特征到权重的映射
+
+    Returns:
+        64位指纹
+    """
+    byte_weights = [[0] * 256 for _ in range(FINGERPRINT_BITS // 8)]
+    total = 0
+    for feature, weight in features.items():
+        value = _feature_hash(feature)
+        total += weight
+        for column in byte_weights:
+            column[value & 0xFF] += weight
+            value >>= 8
+
+    fingerprint = 0
+    for byte_index, column in enumerate(byte_weights):
+        for bit, values in enumerate(_BYTE_VALUES_WITH_BIT):
+            # 该比特为1的特征权重超过一半时置1
+            if 2 * sum(map(column.__getitem__, values)) > total:
+                fingerprint |= 1 << (byte_index * 8 + bit)
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """两个指纹的汉明距离"""
+    return bin(a ^ b).count('1')
+
+
+class NearDuplicateIndex:
+    """近似重复新闻索引"""
+
+    def __init__(self, index_path: Optional[str] = None, max_distance: int = 10,
+                 history_days: int = 3, title_weight: int = 3, content_chars: int = 2000):
+        """
+        初始化索引
+
+        Args:
+            index_path: 历史指纹的持久化文件路径，为空时不保存历史
+            max_distance: 判定为重复的最大汉明距离
+            history_days: 历史指纹保留天数，<=0 表示不抑制往日新闻
+            title_weight: 标题词元相对正文词元的权重
+            content_chars: 参与指纹计算的正文最大字符数
+        """
+        self.index_path = index_path
+        self.max_distance = max_distance
+        self.history_days = history_days
+        self.title_weight = title_weight
+        self.content_chars = content_chars
+        # 按鸽巢原理分为 max_distance+1 段，距离不超过阈值的两个指纹至少有一段完全相同
+        self.bands = max_distance + 1
+        self.history: List[Dict] = self._load()
+        self.stats = {'clusters': 0, 'duplicates': 0, 'suppressed': 0}
+
+    def _band_keys(self, fingerprint: int) -> List[tuple]:
+        width = FINGERPRINT_BITS // self.bands
+        keys = []
+        for band in range(self.bands):
+            shift = band * width
+            bits = width if band < self.bands - 1 else FINGERPRINT_BITS - shift
+            keys.append((band, fingerprint >> shift & ((1 << bits) - 1)))
+        return keys
+
+    def fingerprint(self, news: Dict) -> int:
+        """
+        计算新闻指纹：标题词元加权，正文只取前 content_chars 个字符；
+        CVE编号是跨来源（包括中英文报道）最可靠的共同特征，给予额外权重
+
+        Args:
+            news: 新闻字典（使用 title、content 或 summary）
+
+        Returns:
+            64位指纹
+        """
+        features = Counter()
+        for token in tokenize(news.get('title', '')):
+            features[token] += self.title_weight
+        body = news.get('content') or news.get('summary') or ''
+        for token in tokenize(body[:self.content_chars]):
+            features[token] += 1
+        for token in list(features):
+            if _CVE_RE.match(token):
+                features[token] *= 5
+        return simhash(features)
+
+    def deduplicate(self, news_list: List[Dict], weight_key: str = 'weight') -> List[Dict]:
+        """
+        聚类去重，每个簇保留权重最高的一条（权重相同时保留先出现的）；
+        与往日已报道新闻重复的簇整体丢弃
+
+        Args:
+            news_list: 新闻列表
+            weight_key: 用于选择代表条目的权重字段
+
+        Returns:
+            去重后的新闻列表，保持原有顺序
+        """
+        buckets: Dict[tuple, List[int]] = {}
+        history_buckets: Dict[tuple, List[int]] = {}
+        today = date.today().isoformat()
+        past = [record for record in self.history if record['date'] < today]
+        for i, record in enumerate(past):
+            for key in self._band_keys(record['fingerprint']):
+                history_buckets.setdefault(key, []).append(i)
+
+        fingerprints = []
+        representatives: List[int] = []   # 每个簇当前代表条目的下标
+        cluster_of: List[int] = []        # 每条新闻所属簇
+        suppressed_clusters = set()
+        for i, news in enumerate(news_list):
+            fingerprint = self.fingerprint(news)
+            fingerprints.append(fingerprint)
+            keys = self._band_keys(fingerprint)
+
+            cluster = None
+            for key in keys:
+                for other in buckets.get(key, ()):
+                    if hamming_distance(fingerprint, fingerprints[other]) <= self.max_distance:
+                        cluster = cluster_of[other]
+                        break
+                if cluster is not None:
+                    break
+
+            if cluster is None:
+                cluster = len(representatives)
+                representatives.append(i)
+                if any(hamming_distance(fingerprint, past[j]['fingerprint']) <= self.max_distance
+                       for key in keys for j in history_buckets.get(key, ())):
+                    suppressed_clusters.add(cluster)
+            else:
+                self.stats['duplicates'] += 1
+                current = news_list[representatives[cluster]]
+                if news.get(weight_key, 0) > current.get(weight_key, 0):
+                    representatives[cluster] = i
+            cluster_of.append(cluster)
+            for key in keys:
+                buckets.setdefault(key, []).append(i)
+
+        self.stats['clusters'] += len(representatives)
+        self.stats['suppressed'] += len(suppressed_clusters)
+        kept = sorted(index for cluster, index in enumerate(representatives)
+                      if cluster not in suppressed_clusters)
+        for index in kept:
+            news_list[index]['fingerprint'] = fingerprints[index]
+        return [news_list[index] for index in kept]
+
+    def remember(self, news_list: List[Dict]):
+        """
+        记录今天已报道的新闻指纹（同一天重复运行时覆盖当天的记录）
+
+        Args:
+            news_list: 已报道的新闻列表
+        """
+        today = date.today().isoformat()
+        self.history = [record for record in self.history if record['date'] != today]
+        for news in news_list:
+            fingerprint = news.get('fingerprint')
+            if fingerprint is None:
+                fingerprint = self.fingerprint(news)
+            self.history.append({'fingerprint': fingerprint, 'title': news.get('title', ''), 'date': today})
+
+    def _load(self) -> List[Dict]:
+        if not self.index_path or self.history_days <= 0 or not os.path.exists(self.index_path):
+            return []
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"近似去重索引读取失败，将重新建立: {e}")
+            return []
+        cutoff = (date.today() - timedelta(days=self.history_days)).isoformat()
+        return [
+            {'fingerprint': int(record['fingerprint'], 16), 'title': record.get('title', ''), 'date': record['date']}
+            for record in records if record.get('date', '') >= cutoff
+        ]
+
+    def save(self):
+        """持久化历史指纹（原子替换）"""
+        if not self.index_path or self.history_days <= 0:
+            return
+        os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+        records = [
+            {'fingerprint': f"{record['fingerprint']:016x}", 'title': record['title'], 'date': record['date']}
+            for record in self.history
+        ]
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def log_stats(self):
+        """输出去重统计"""
+        logger.info(f"🧹 近似去重: {self.stats['clusters']} 个簇, 合并重复 {self.stats['duplicates']} 条, "
+                    f"抑制往日旧闻 {self.stats['suppressed']} 条")
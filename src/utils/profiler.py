@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+运行耗时分析器
+在流水线各环节（RSS抓取、解析、关键词过滤、去重、文章抓取、GLM调用、HTML渲染、写文件）记录耗时区间，
+运行结束时输出 Chrome Trace 格式的JSON（可用 chrome://tracing、Perfetto、speedscope 查看火焰图）并打印汇总表。
+
+通过环境变量 NEWS_PROFILE 开启：
+    NEWS_PROFILE=1                  写入 output/profiles/trace-<时间>.json
+    NEWS_PROFILE=/path/trace.json   写入指定路径
+未开启时 span() 直接返回共享的空上下文，几乎没有开销
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = 'NEWS_PROFILE'
+DEFAULT_PROFILE_DIR = 'output/profiles'
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    """一个耗时区间，退出时写入分析器"""
+
+    __slots__ = ('profiler', 'name', 'args', 'start')
+
+    def __init__(self, profiler: 'Profiler', name: str, args: Dict):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self) -> '_Span':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.profiler.record(self.name, self.start, end, self.args)
+        return False
+
+
+class Profiler:
+    """耗时分析器，线程安全"""
+
+    def __init__(self, enabled: bool = False, trace_path: Optional[str] = None):
+        """
+        初始化分析器
+
+        Args:
+            enabled: 是否记录耗时
+            trace_path: 追踪文件路径，为None时写入 output/profiles/trace-<时间>.json
+        """
+        self.enabled = enabled
+        self.trace_path = trace_path
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def from_env(cls) -> 'Profiler':
+        """根据环境变量 NEWS_PROFILE 创建分析器"""
+        value = os.environ.get(PROFILE_ENV, '').strip()
+        if value.lower() in ('', '0', 'false', 'no', 'off'):
+            return cls(enabled=False)
+        if value.lower() in ('1', 'true', 'yes', 'on'):
+            return cls(enabled=True)
+        return cls(enabled=True, trace_path=value)
+
+    def reset(self):
+        """清空已记录的区间，开始新一轮记录"""
+        with self._lock:
+            self.events: List[Dict] = []
+            self.threads: Dict[int, str] = {}
+            self.origin = time.perf_counter()
+
+    def span(self, name: str, **args):
+        """
+        创建耗时区间（上下文管理器）
+
+        Args:
+            name: 区间名称，点号前的部分作为分类，如 feed.fetch、glm.call
+            **args: 附加信息，写入追踪文件（如来源、链接）
+
+        Returns:
+            上下文管理器；未开启时返回共享的空上下文
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def record(self, name: str, start: float, end: float, args: Optional[Dict] = None):
+        """
+        记录一个已结束的区间
+
+        Args:
+            name: 区间名称
+            start: 开始时间（time.perf_counter）
+            end: 结束时间（time.perf_counter）
+            args: 附加信息
+        """
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': name.split('.', 1)[0],
+            'ph': 'X',
+            'ts': round((start - self.origin) * 1e6, 1),
+            'dur': round((end - start) * 1e6, 1),
+            'pid': os.getpid(),
+            'tid': thread.ident,
+        }
+        if args:
+            event['args'] = {key: value if isinstance(value, (int, float, bool)) else str(value)
+                             for key, value in args.items()}
+        with self._lock:
+            self.events.append(event)
+            self.threads.setdefault(thread.ident, thread.name)
+
+    def summary(self) -> List[Dict]:
+        """
+        按区间名称汇总耗时
+
+        Returns:
+            汇总列表（按总耗时降序），每项包含 name、count、total_ms、avg_ms、max_ms
+        """
+        with self._lock:
+            events = list(self.events)
+        stats: Dict[str, Dict] = {}
+        for event in events:
+            item = stats.setdefault(event['name'], {'name': event['name'], 'count': 0,
+                                                    'total_ms': 0.0, 'max_ms': 0.0})
+            duration = event['dur'] / 1000
+            item['count'] += 1
+            item['total_ms'] += duration
+            item['max_ms'] = max(item['max_ms'], duration)
+        for item in stats.values():
+            item['avg_ms'] = item['total_ms'] / item['count']
+        return sorted(stats.values(), key=lambda item: item['total_ms'], reverse=True)
+
+    def wall_time_ms(self) -> float:
+        """从第一个区间开始到最后一个区间结束的墙钟时间（毫秒）"""
+        with self._lock:
+            if not self.events:
+                return 0.0
+            start = min(event['ts'] for event in self.events)
+            end = max(event['ts'] + event['dur'] for event in self.events)
+        return (end - start) / 1000
+
+    def format_summary(self) -> str:
+        """汇总表文本"""
+        rows = self.summary()
+        lines = [f"⏱️ 运行耗时统计（墙钟 {self.wall_time_ms() / 1000:.2f} 秒，并行环节的总耗时可能超过墙钟时间）",
+                 # 表头中文字符占两列，按显示宽度对齐
+                 f"{'环节':<24}{'次数':>6}{'总耗时(ms)':>11}{'平均(ms)':>10}{'最大(ms)':>10}"]
+        for row in rows:
+            lines.append(f"{row['name']:<26}{row['count']:>8}{row['total_ms']:>14.1f}"
+                         f"{row['avg_ms']:>12.1f}{row['max_ms']:>12.1f}")
+        return '\n'.join(lines)
+
+    def write_trace(self, path: str) -> str:
+        """
+        写入 Chrome Trace 格式的追踪文件
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            文件路径
+        """
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+        pid = os.getpid()
+        metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                    for tid, name in threads.items()]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        return path
+
+    def finish(self) -> Optional[str]:
+        """
+        结束本轮记录：写入追踪文件、打印汇总表并清空记录
+
+        Returns:
+            追踪文件路径，未开启或没有记录时返回None
+        """
+        if not self.enabled or not self.events:
+            return None
+        path = self.trace_path or os.path.join(
+            DEFAULT_PROFILE_DIR, f"trace-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+        try:
+            self.write_trace(path)
+        except OSError as e:
+            logger.warning(f"耗时追踪文件写入失败: {e}")
+            path = None
+        logger.info(self.format_summary())
+        if path:
+            logger.info(f"🔥 耗时追踪已保存: {path}（可用 chrome://tracing 或 https://ui.perfetto.dev 查看）")
+        self.reset()
+        return path
+
+
+_profiler = Profiler.from_env()
+
+
+def get_profiler() -> Profiler:
+    """获取全局分析器"""
+    return _profiler
+
+
+def span(name: str, **args):
+    """
+    在全局分析器上创建耗时区间
+
+    Args:
+        name: 区间名称
+        **args: 附加信息
+
+    Returns:
+        上下文管理器
+    """
+    return _profiler.span(name, **args)
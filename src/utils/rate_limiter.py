@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+按主机的请求限速器
+每个主机（域名）独立维护一个令牌桶和并发上限，礼貌性限制只作用于同一站点
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class _TokenBucket:
+    """单个主机的令牌桶"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        预定一个令牌
+
+        Returns:
+            float: 调用方需要等待的秒数（0表示立即可用）
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class DomainRateLimiter:
+    """按域名的令牌桶限速器，线程安全"""
+
+    def __init__(self, rate: float = 0.5, burst: int = 1, max_concurrent_per_host: int = 2):
+        """
+        初始化限速器
+
+        Args:
+            rate: 每个主机每秒允许的请求数
+            burst: 每个主机允许的突发请求数
+            max_concurrent_per_host: 每个主机同时进行的最大请求数
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent_per_host = max_concurrent_per_host
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """提取URL的主机名"""
+        return urlparse(url).netloc.lower()
+
+    def _get(self, host: str):
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = _TokenBucket(self.rate, self.burst)
+                self._semaphores[host] = threading.Semaphore(self.max_concurrent_per_host)
+            return self._buckets[host], self._semaphores[host]
+
+    def wait(self, url: str) -> float:
+        """
+        阻塞直到该URL所在主机允许发出下一个请求
+
+        Args:
+            url: 请求地址
+
+        Returns:
+            float: 实际等待的秒数
+        """
+        if self.rate <= 0:
+            return 0.0
+        bucket, _ = self._get(self.host_of(url))
+        delay = bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    @contextmanager
+    def acquire(self, url: str):
+        """
+        获取该主机的并发名额并等待令牌，用于包裹一次完整请求
+
+        Args:
+            url: 请求地址
+        """
+        _, semaphore = self._get(self.host_of(url))
+        with semaphore:
+            self.wait(url)
+            yield
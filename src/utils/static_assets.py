@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+静态样式表发布
+快报和索引页共用的CSS写入站点目录下的 assets/css/<名称>.<内容哈希>.css，页面通过 <link> 引用。
+文件名随内容变化，同一文件内容永不改变，浏览器和CDN可以长期缓存
+（Cache-Control: public, max-age=31536000, immutable，见站点根目录 _headers）。
+旧的样式表文件不删除，历史快报仍引用它们。
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 样式表相对站点根目录的位置（快报和 index.html 都在站点根目录）
+ASSET_CSS_DIR = os.path.join('assets', 'css')
+HASH_LENGTH = 10
+
+_STYLE_BLOCK_RE = re.compile(r'([ \t]*)<style>\n?(.*?)[ \t]*</style>', re.DOTALL)
+
+_published = set()
+_lock = threading.Lock()
+
+
+def fingerprint(content: str) -> str:
+    """样式内容的哈希（文件名中使用的前 HASH_LENGTH 位）"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+
+
+def publish_stylesheet(name: str, css: str, site_root: str = '.') -> str:
+    """
+    发布带内容哈希的样式表，内容相同的文件已存在时不重复写入
+
+    Args:
+        name: 样式表名称，如 report
+        css: 样式内容
+        site_root: 站点根目录（页面所在目录）
+
+    Returns:
+        页面中引用的相对路径，如 assets/css/report.1a2b3c4d5e.css
+    """
+    filename = f"{name}.{fingerprint(css)}.css"
+    href = f"{ASSET_CSS_DIR.replace(os.sep, '/')}/{filename}"
+    path = os.path.join(site_root, ASSET_CSS_DIR, filename)
+    key = os.path.abspath(path)
+    if key in _published and os.path.exists(path):
+        return href
+    with _lock:
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(css)
+            os.replace(tmp_path, path)
+            logger.info(f"🎨 发布样式表: {href}")
+        _published.add(key)
+    return href
+
+
+def stylesheet_link(href: str, indent: str = '  ') -> str:
+    """引用样式表的 <link> 标签"""
+    return f'{indent}<link rel="stylesheet" href="{href}">'
+
+
+def externalize_inline_style(html: str, name: str, site_root: str = '.') -> str:
+    """
+    把页面中的 <style> 块发布为带哈希的样式表并替换为 <link>
+
+    Args:
+        html: 页面HTML
+        name: 样式表名称
+        site_root: 站点根目录
+
+    Returns:
+        替换后的HTML，页面中没有 <style> 块时原样返回
+    """
+    match = _STYLE_BLOCK_RE.search(html)
+    if not match:
+        return html
+    href = publish_stylesheet(name, match.group(2), site_root)
+    return html[:match.start()] + stylesheet_link(href, match.group(1)) + html[match.end():]
+
+
+def linked_stylesheet_path(html: str, site_root: str = '.') -> Optional[str]:
+    """页面引用的本地 assets/css 样式表的文件路径，没有时返回None"""
+    match = re.search(r'<link rel="stylesheet" href="(assets/css/[^"]+\.css)"', html)
+    if not match:
+        return None
+    return os.path.join(site_root, *match.group(1).split('/'))
@@ -5,6 +5,8 @@
 确保移动端响应式样式不会被覆盖
 """
 
+import os
+
 def get_mobile_responsive_css():
     """
     获取移动端响应式CSS样式
@@ -342,6 +344,16 @@ def validate_mobile_styles(file_path):
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
+        # 引用共享样式表的快报，检查样式表中的内容
+        try:
+            from src.utils.static_assets import linked_stylesheet_path
+        except ImportError:
+            from static_assets import linked_stylesheet_path
+        stylesheet = linked_stylesheet_path(content, os.path.dirname(file_path))
+        if stylesheet and os.path.exists(stylesheet):
+            with open(stylesheet, 'r', encoding='utf-8') as f:
+                content += f.read()
+        
         # 检查关键的移动端样式
         mobile_indicators = [
             "@media (max-width: 768px)",
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+轻量模板引擎
+模板编译为Python函数并按文件缓存，渲染时把片段追加到列表后一次性拼接，避免巨型f-string和循环中的字符串累加。
+模板文件位于项目根目录 templates/ 下，CSS等静态内容无需转义花括号。
+
+语法：
+    {{ 表达式 }}                      输出Python表达式的值
+    {% if 条件 %} / {% elif 条件 %} / {% else %} / {% endif %}
+    {% for 变量 in 表达式 %} / {% endfor %}
+    {% set 变量 = 表达式 %}
+    {% include '文件名' %}            引入另一个模板（共享当前变量）
+    {# 注释 #}
+只包含一个 {% %} 或 {# #} 标签的整行（连同缩进和换行）不会出现在输出中
+"""
+
+import ast
+import builtins
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TEMPLATE_DIR = os.path.join(PROJECT_ROOT, 'templates')
+
+_TOKEN_RE = re.compile(r'(\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})', re.DOTALL)
+# 独占一行的块标签，去掉所在行的缩进和行尾换行
+_STANDALONE_RE = re.compile(r'^[ \t]*(\{%(?:(?!%\})[^\n])*%\}|\{#(?:(?!#\})[^\n])*#\})[ \t]*\n', re.MULTILINE)
+_FOR_RE = re.compile(r'^for\s+(.+?)\s+in\s+(.+)$', re.DOTALL)
+_SET_RE = re.compile(r'^set\s+([A-Za-z_][\w, ]*?)\s*=\s*(.+)$', re.DOTALL)
+_INCLUDE_RE = re.compile(r'^include\s+([\'"])(.+?)\1$')
+
+
+class TemplateError(Exception):
+    """模板语法错误或找不到模板"""
+
+
+class Template:
+    """编译后的模板"""
+
+    def __init__(self, source: str, name: str = '<string>', loader: Optional['TemplateEngine'] = None):
+        """
+        编译模板
+
+        Args:
+            source: 模板源码
+            name: 模板名称（用于错误信息）
+            loader: 解析 include 的模板引擎，为None时不支持 include
+        """
+        self.name = name
+        self.loader = loader
+        # include 的模板文件及其修改时间，用于判断缓存是否失效
+        self.dependencies: Dict[str, float] = {}
+        self.python_source = self._compile_source(source)
+        namespace = {'__builtins__': builtins, '_builtins': builtins}
+        exec(compile(self.python_source, f'<template {name}>', 'exec'), namespace)
+        self._render = namespace['_render']
+
+    def render(self, context: Optional[Dict] = None, **kwargs) -> str:
+        """
+        渲染模板
+
+        Args:
+            context: 模板变量
+            **kwargs: 额外的模板变量（覆盖 context 中的同名变量）
+
+        Returns:
+            渲染结果
+        """
+        if kwargs:
+            context = dict(context or {}, **kwargs)
+        return self._render(context or {})
+
+    def _compile_source(self, source: str) -> str:
+        body: List[str] = []
+        names = set()
+        self._emit_template(source, self.name, body, names, [], 1)
+        lines = ['def _render(_context):', '    _out = []', '    _append = _out.append']
+        # 模板中用到的变量在函数开头从上下文取出，渲染时作为局部变量访问
+        for name in sorted(names):
+            if not hasattr(builtins, name):
+                lines.append(f'    if {name!r} in _context: {name} = _context[{name!r}]')
+            else:
+                lines.append(f'    {name} = _context[{name!r}] if {name!r} in _context else _builtins.{name}')
+        lines.extend(body)
+        lines.append("    return ''.join(_out)")
+        return '\n'.join(lines)
+
+    def _emit_template(self, source: str, name: str, body: List[str], names: set, stack: List[Tuple[str, int]],
+                       indent: int):
+        source = _STANDALONE_RE.sub(r'\1', source)
+        pending: List[str] = []
+        base_depth = len(stack)
+
+        def pad():
+            return '    ' * (indent + len(stack) - base_depth)
+
+        def flush():
+            if pending:
+                body.append(f"{pad()}_append({''.join(pending)!r})")
+                pending.clear()
+
+        line = 1
+        for token in _TOKEN_RE.split(source):
+            if not token:
+                continue
+            if token.startswith('{{') and token.endswith('}}'):
+                flush()
+                expression = self._expression(token[2:-2], name, line)
+                self._collect_names(expression, names)
+                body.append(f"{pad()}_append(str({expression}))")
+            elif token.startswith('{%') and token.endswith('%}'):
+                flush()
+                self._emit_tag(token[2:-2].strip(), name, line, body, names, stack, pad)
+            elif token.startswith('{#') and token.endswith('#}'):
+                pass
+            else:
+                pending.append(token)
+            line += token.count('\n')
+        flush()
+        if len(stack) > base_depth:
+            tag, tag_line = stack[-1]
+            raise TemplateError(f"{name}:{tag_line} 缺少 end{tag}")
+
+    def _emit_tag(self, tag: str, name: str, line: int, body: List[str], names: set,
+                  stack: List[Tuple[str, int]], pad):
+        keyword = tag.split(None, 1)[0] if tag else ''
+        rest = tag[len(keyword):].strip()
+        if keyword == 'if':
+            self._collect_names(self._expression(rest, name, line), names)
+            body.append(f"{pad()}if {rest}:")
+            stack.append(('if', line))
+            body.append(f"{pad()}pass")
+        elif keyword in ('elif', 'else'):
+            if not stack or stack[-1][0] != 'if':
+                raise TemplateError(f"{name}:{line} {keyword} 没有对应的 if")
+            stack.pop()
+            if keyword == 'elif':
+                self._collect_names(self._expression(rest, name, line), names)
+                body.append(f"{pad()}elif {rest}:")
+            else:
+                body.append(f"{pad()}else:")
+            stack.append(('if', line))
+            body.append(f"{pad()}pass")
+        elif keyword == 'for':
+            match = _FOR_RE.match(tag)
+            if not match:
+                raise TemplateError(f"{name}:{line} for 语法错误: {tag}")
+            target, iterable = match.group(1), self._expression(match.group(2), name, line)
+            self._collect_names(iterable, names)
+            body.append(f"{pad()}for {target} in {iterable}:")
+            stack.append(('for', line))
+            body.append(f"{pad()}pass")
+        elif keyword in ('endif', 'endfor'):
+            if not stack or stack[-1][0] != keyword[3:]:
+                raise TemplateError(f"{name}:{line} {keyword} 没有对应的 {keyword[3:]}")
+            stack.pop()
+        elif keyword == 'set':
+            match = _SET_RE.match(tag)
+            if not match:
+                raise TemplateError(f"{name}:{line} set 语法错误: {tag}")
+            expression = self._expression(match.group(2), name, line)
+            self._collect_names(expression, names)
+            body.append(f"{pad()}{match.group(1)} = {expression}")
+        elif keyword == 'include':
+            match = _INCLUDE_RE.match(tag)
+            if not match or self.loader is None:
+                raise TemplateError(f"{name}:{line} include 语法错误或未提供模板目录: {tag}")
+            path = self.loader.path_of(match.group(2))
+            source = self.loader.read_source(match.group(2))
+            self.dependencies[path] = os.path.getmtime(path)
+            self._emit_template(source, match.group(2), body, names, stack, len(pad()) // 4)
+        else:
+            raise TemplateError(f"{name}:{line} 未知标签: {tag}")
+
+    @staticmethod
+    def _expression(expression: str, name: str, line: int) -> str:
+        expression = expression.strip()
+        try:
+            compile(expression, name, 'eval')
+        except SyntaxError as e:
+            raise TemplateError(f"{name}:{line} 表达式语法错误: {expression} ({e.msg})")
+        return expression
+
+    @staticmethod
+    def _collect_names(expression: str, names: set):
+        """收集表达式中引用的变量名"""
+        for node in ast.walk(ast.parse(expression, mode='eval')):
+            if isinstance(node, ast.Name):
+                names.add(node.id)
+
+
+class TemplateEngine:
+    """模板目录加载器，编译结果按文件修改时间缓存"""
+
+    def __init__(self, directory: str = TEMPLATE_DIR):
+        """
+        Args:
+            directory: 模板目录
+        """
+        self.directory = directory
+        self._cache: Dict[str, Tuple[float, Template]] = {}
+        self._lock = threading.Lock()
+        self.compile_count = 0
+
+    def path_of(self, name: str) -> str:
+        """模板文件路径"""
+        return os.path.join(self.directory, name)
+
+    def read_source(self, name: str) -> str:
+        """读取模板源码"""
+        path = self.path_of(name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError as e:
+            raise TemplateError(f"模板不存在: {path} ({e})")
+
+    def get_template(self, name: str) -> Template:
+        """
+        获取编译后的模板，模板文件（含 include 的文件）未修改时直接使用缓存
+
+        Args:
+            name: 模板文件名（相对模板目录）
+
+        Returns:
+            编译后的模板
+        """
+        path = self.path_of(name)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError as e:
+            raise TemplateError(f"模板不存在: {path} ({e})")
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == mtime and self._dependencies_fresh(cached[1]):
+            return cached[1]
+        with self._lock:
+            template = Template(self.read_source(name), name, loader=self)
+            self.compile_count += 1
+            self._cache[name] = (mtime, template)
+        return template
+
+    @staticmethod
+    def _dependencies_fresh(template: Template) -> bool:
+        try:
+            return all(os.path.getmtime(path) == mtime for path, mtime in template.dependencies.items())
+        except OSError:
+            return False
+
+    def render(self, name: str, context: Optional[Dict] = None, **kwargs) -> str:
+        """
+        渲染模板文件
+
+        Args:
+            name: 模板文件名
+            context: 模板变量
+            **kwargs: 额外的模板变量
+
+        Returns:
+            渲染结果
+        """
+        return self.get_template(name).render(context, **kwargs)
+
+
+_engine = TemplateEngine()
+
+
+def get_engine() -> TemplateEngine:
+    """获取项目 templates/ 目录的全局模板引擎"""
+    return _engine
+
+
+def render_template(name: str, context: Optional[Dict] = None, **kwargs) -> str:
+    """
+    使用全局模板引擎渲染 templates/ 下的模板
+
+    Args:
+        name: 模板文件名
+        context: 模板变量
+        **kwargs: 额外的模板变量
+
+    Returns:
+        渲染结果
+    """
+    return _engine.render(name, context, **kwargs)
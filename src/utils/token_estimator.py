@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+中英文混合文本的token数估算
+不依赖模型分词器，按偏保守的比例估算：中日韩字符及全角标点每字约1个token，
+其余字符（英文单词、数字、空白、标点）约每4个字符1个token
+"""
+
+import math
+import re
+
+_WIDE_CHAR_RE = re.compile(r'[　-〿㐀-䶿一-鿿＀-￯]')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    估算文本的token数
+
+    Args:
+        text: 任意中英文混合文本
+
+    Returns:
+        估算的token数
+    """
+    if not text:
+        return 0
+    wide = len(_WIDE_CHAR_RE.findall(text))
+    return wide + math.ceil((len(text) - wide) / 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    截取不超过估算token数的最长前缀
+
+    Args:
+        text: 原始文本
+        max_tokens: token上限
+
+    Returns:
+        截取后的文本（未超出上限时原样返回）
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    budget = max(max_tokens, 0) * 4  # 以1/4 token为单位计数
+    used = 0
+    for i, char in enumerate(text):
+        used += 4 if _WIDE_CHAR_RE.match(char) else 1
+        if used > budget:
+            return text[:i]
+    return text
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文章内容缓存测试脚本
+测试URL规范化、TTL过期和LRU淘汰
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawlers.article_cache import ArticleCache, canonicalize_url
+from src.utils.disk_cache import SQLiteCache
+
+
+def test_canonicalize_url():
+    """测试URL规范化"""
+    print("🧪 测试1: URL规范化")
+    a = canonicalize_url("HTTPS://WWW.Example.com/post/1/?utm_source=rss&b=2&a=1#comments")
+    b = canonicalize_url("https://www.example.com/post/1?a=1&b=2")
+    assert a == b, f"{a} != {b}"
+    assert canonicalize_url("https://example.com/list?from=rss&spm=a.b&fbclid=x") == "https://example.com/list"
+    # 以 from 开头的真实参数保留，不同页面不会共用缓存键
+    assert canonicalize_url("https://example.com/list?fromDate=2025-01-01") == "https://example.com/list?fromDate=2025-01-01"
+    assert canonicalize_url("https://example.com/list?from_id=1") != canonicalize_url("https://example.com/list?from_id=2")
+    print("✅ 跟踪参数、片段和末尾斜杠已去除，fromDate 等真实参数保留")
+
+
+def test_article_roundtrip():
+    """测试命中与未命中统计"""
+    print("\n🧪 测试2: 文章缓存读写")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ArticleCache(os.path.join(tmp, "articles.sqlite3"))
+        url = "https://www.freebuf.com/articles/1.html"
+        assert cache.get(url) is None
+
+        cache.set(url, {'title': '标题', 'content': '正文', 'success': True})
+        cache.set("https://www.freebuf.com/failed", {'success': False})
+
+        assert cache.get(url + "?utm_medium=feed")['title'] == '标题'
+        assert cache.get("https://www.freebuf.com/failed") is None
+        stats = cache.stats()
+        assert stats['hits'] == 1 and stats['misses'] == 2, stats
+        cache.close()
+    print("✅ 只缓存成功结果，统计正确")
+
+
+def test_ttl_and_lru():
+    """测试过期和容量淘汰"""
+    print("\n🧪 测试3: TTL与LRU淘汰")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteCache(os.path.join(tmp, "c.sqlite3"), ttl=0.05, max_entries=10)
+        cache.set("k", 1)
+        time.sleep(0.1)
+        assert cache.get("k") is None
+
+        cache = SQLiteCache(os.path.join(tmp, "lru.sqlite3"), ttl=0, max_entries=2)
+        cache.set("a", 1)
+        time.sleep(0.01)
+        cache.set("b", 2)
+        time.sleep(0.01)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert len(cache) == 2
+    print("✅ 过期条目失效，最久未访问的条目被淘汰")
+
+
+if __name__ == "__main__":
+    test_canonicalize_url()
+    test_article_roundtrip()
+    test_ttl_and_lru()
+    print("\n🎉 文章缓存测试全部通过")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+异步GLM客户端测试脚本
+启动模拟 bigmodel.cn chat/completions 接口的本地SSE服务器，
+测试流式增量解析、首token时间、长连接复用和非流式调用
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import aiohttp  # noqa: F401
+    from utils.async_glm_client import AsyncGLMClient
+except ImportError:
+    aiohttp = None
+
+API_PATH = '/api/paas/v4/chat/completions'
+TOKENS = ['今日', '安全', '态势', '平稳']
+TOKEN_DELAY = 0.1
+
+
+class MockSSEHandler(BaseHTTPRequestHandler):
+    """模拟GLM接口：校验鉴权头，stream=true 时以分块传输逐个发送SSE事件"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if self.path != API_PATH or self.headers.get('Authorization') != 'Bearer test-key':
+            self._send_json(401, {'error': {'code': '1000', 'message': '身份验证失败'}})
+            return
+        if not payload.get('stream'):
+            self._send_json(200, {'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': ''.join(TOKENS)}}],
+                                  'usage': {'total_tokens': 10}})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for i, token in enumerate(TOKENS):
+            time.sleep(TOKEN_DELAY)
+            event = {'id': 'mock', 'choices': [{'index': 0, 'delta': {'role': 'assistant', 'content': token}}]}
+            if i == len(TOKENS) - 1:
+                event['choices'][0]['finish_reason'] = 'stop'
+                event['usage'] = {'prompt_tokens': 6, 'completion_tokens': 4, 'total_tokens': 10}
+            self._write_chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n")
+        self._write_chunk("data: [DONE]\n\n")
+        self._write_chunk("")
+
+    def _write_chunk(self, text):
+        data = text.encode('utf-8')
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CountingServer(ThreadingHTTPServer):
+    """统计新建连接数的服务器"""
+    daemon_threads = True
+    connections = 0
+
+    def get_request(self):
+        self.connections += 1
+        return super().get_request()
+
+
+def start_server():
+    server = CountingServer(('127.0.0.1', 0), MockSSEHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}{API_PATH}"
+
+
+def test_streaming_and_keepalive():
+    """测试流式增量解析、首token时间和长连接复用"""
+    print("🧪 测试1: SSE流式响应与长连接")
+    if aiohttp is None:
+        print("⚠️ 未安装aiohttp，跳过")
+        return
+    server, url = start_server()
+    received = []
+
+    async def run():
+        async with AsyncGLMClient('test-key', base_url=url, timeout=10) as client:
+            results = []
+            for _ in range(3):
+                results.append(await client.complete([{"role": "user", "content": "hi"}],
+                                                     on_token=received.append))
+            return results, client.metrics_summary()
+
+    results, summary = asyncio.run(run())
+    server.shutdown()
+
+    first = results[0]
+    assert first['content'] == ''.join(TOKENS) and first['chunks'] == len(TOKENS), first
+    assert first['usage']['total_tokens'] == 10
+    assert received[:len(TOKENS)] == TOKENS
+    assert first['ttft'] < first['latency'] - TOKEN_DELAY * 2, first
+    assert server.connections == 1, server.connections
+    assert summary['calls'] == 3 and summary['failures'] == 0
+    print(f"✅ 首token {first['ttft']:.2f}秒 / 总耗时 {first['latency']:.2f}秒，3次调用共用1个连接")
+
+
+def test_concurrent_and_errors():
+    """测试并发调用、非流式调用和鉴权失败"""
+    print("\n🧪 测试2: 并发、非流式与错误处理")
+    if aiohttp is None:
+        print("⚠️ 未安装aiohttp，跳过")
+        return
+    server, url = start_server()
+
+    async def run():
+        async with AsyncGLMClient('test-key', base_url=url, timeout=10) as client:
+            start = time.perf_counter()
+            many = await client.call_many({'summary': '摘要', 'categories': '分类'})
+            elapsed = time.perf_counter() - start
+            plain = await client.call_api([{"role": "user", "content": "hi"}], stream=False)
+        async with AsyncGLMClient('wrong-key', base_url=url, timeout=10) as client:
+            failed = await client.complete([{"role": "user", "content": "hi"}])
+        return many, elapsed, plain, failed
+
+    many, elapsed, plain, failed = asyncio.run(run())
+    server.shutdown()
+
+    assert all(r['content'] == ''.join(TOKENS) for r in many.values())
+    assert elapsed < TOKEN_DELAY * len(TOKENS) * 1.8, elapsed
+    assert plain == ''.join(TOKENS)
+    assert failed['content'] is None and failed['error'].startswith('HTTP 401')
+    print(f"✅ 两个提示词并发耗时 {elapsed:.2f}秒，鉴权失败返回错误信息")
+
+
+if __name__ == "__main__":
+    test_streaming_and_keepalive()
+    test_concurrent_and_errors()
+    print("\n🎉 异步GLM客户端测试全部通过")
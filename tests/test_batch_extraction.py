@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量正文提取测试脚本
+替换 extract_article_content 后测试按域名轮转提交、同一域名的并发限制和结果保持输入顺序
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawlers.enhanced_crawler import EnhancedNewsCrawler
+from src.utils.rate_limiter import DomainRateLimiter
+
+URLS = [
+    'https://a.example.com/1', 'https://a.example.com/2', 'https://a.example.com/3',
+    'https://b.example.com/1', 'https://b.example.com/2',
+    'https://c.example.com/1',
+    'https://a.example.com/1',
+]
+
+
+class StubExtractor:
+    """替代 extract_article_content：经过限速器后记录调用顺序和每个域名的同时请求数"""
+
+    def __init__(self, duration=0.0, fail_url=None):
+        self.duration = duration
+        self.fail_url = fail_url
+        self.calls = []
+        self.active = Counter()
+        self.max_active = Counter()
+        self.max_total = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url, max_length=3000, rate_limiter=None):
+        host = urlparse(url).netloc
+        with rate_limiter.acquire(url):
+            with self.lock:
+                self.calls.append(url)
+                self.active[host] += 1
+                self.max_active[host] = max(self.max_active[host], self.active[host])
+                self.max_total = max(self.max_total, sum(self.active.values()))
+            time.sleep(self.duration)
+            with self.lock:
+                self.active[host] -= 1
+        if url == self.fail_url:
+            raise RuntimeError('连接被重置')
+        return {'url': url, 'title': f'标题 {url}', 'success': True}
+
+
+def test_round_robin_order():
+    """测试提交顺序按域名轮转，重复链接只抓取一次"""
+    print("🧪 测试1: 按域名轮转")
+    crawler = EnhancedNewsCrawler()
+    stub = StubExtractor()
+    crawler.extract_article_content = stub
+    limiter = DomainRateLimiter(rate=0, max_concurrent_per_host=1)
+    results = list(crawler.iter_extract_articles(URLS, max_workers=1, rate_limiter=limiter))
+    crawler.close()
+    assert stub.calls == [
+        'https://a.example.com/1', 'https://b.example.com/1', 'https://c.example.com/1',
+        'https://a.example.com/2', 'https://b.example.com/2',
+        'https://a.example.com/3',
+    ], stub.calls
+    assert sorted(result['url'] for result in results) == sorted(set(URLS))
+    print("✅ a、b、c 三个域名交替提交，重复链接去重")
+
+
+def test_batch_order_and_per_domain_limit():
+    """测试批量提取保持输入顺序，同一域名不并发，不同域名并行"""
+    print("\n🧪 测试2: 输入顺序与域名并发限制")
+    crawler = EnhancedNewsCrawler()
+    stub = StubExtractor(duration=0.05, fail_url='https://b.example.com/2')
+    crawler.extract_article_content = stub
+    results = crawler.batch_extract_articles(URLS, delay=0, max_workers=4)
+    crawler.close()
+
+    assert [result['url'] for result in results] == URLS
+    assert results[0] is results[-1]
+    assert results[4]['success'] is False and results[4]['error'] == '连接被重置'
+    assert all(result['success'] for i, result in enumerate(results) if i != 4)
+    assert set(stub.max_active.values()) == {1}, stub.max_active
+    assert stub.max_total > 1, stub.max_total
+    print(f"✅ 结果与输入顺序一致，同一域名最多1个请求，最多 {stub.max_total} 个域名同时抓取")
+
+
+if __name__ == "__main__":
+    test_round_robin_order()
+    test_batch_order_and_per_domain_limit()
+    print("\n🎉 批量正文提取测试全部通过")
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+英文新闻批量翻译测试脚本
+使用本地模拟API验证按token预算分批、按id对应结果，以及缺失条目的逐条补译
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.enhanced_glm_client import EnhancedGLMClient
+from src.core.glm_news_generator import GLMNewsGenerator
+
+
+class MockGLMHandler(BaseHTTPRequestHandler):
+    """
+    批量请求按id倒序返回译文并故意漏掉 id 为 "2" 的条目；单条请求直接返回译文。
+    fail 为True时所有请求都返回无法解析的说明文字
+    """
+    batch_sizes = []
+    single_titles = []
+    fail = False
+    lock = threading.Lock()
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        prompt = payload['messages'][0]['content']
+        match = re.search(r'^\[.*?^\]', prompt, re.DOTALL | re.MULTILINE)
+        if match:
+            items = json.loads(match.group(0))
+            with MockGLMHandler.lock:
+                MockGLMHandler.batch_sizes.append(len(items))
+            translations = [
+                {'id': item['id'], 'chinese_title': f"译：{item['title']}", 'summary': '批量摘要',
+                 'key_points': [], 'impact_analysis': '', 'threat_level': '高危'}
+                for item in reversed(items) if item['id'] != '2'
+            ]
+            content = '```json\n' + json.dumps({'translations': translations}, ensure_ascii=False) + '\n```'
+        else:
+            title = re.search(r'标题：(.*)', prompt).group(1)
+            with MockGLMHandler.lock:
+                MockGLMHandler.single_titles.append(title)
+            content = json.dumps({'chinese_title': f"单译：{title}", 'summary': '单条摘要',
+                                  'key_points': [], 'impact_analysis': '', 'threat_level': '中危'},
+                                 ensure_ascii=False)
+        if MockGLMHandler.fail:
+            content = '抱歉，暂时无法处理这条请求。'
+        body = json.dumps({'choices': [{'message': {'content': content}}]}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    MockGLMHandler.batch_sizes = []
+    MockGLMHandler.single_titles = []
+    MockGLMHandler.fail = False
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockGLMHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_client(server):
+    client = EnhancedGLMClient('test-key', base_url=f"http://127.0.0.1:{server.server_port}/", timeout=5)
+    client.session.trust_env = False
+    return client
+
+
+def test_batches_map_by_id():
+    """测试分批和按id对应结果"""
+    print("🧪 测试1: 按输出上限分批并按id对应")
+    server = start_server()
+    client = make_client(server)
+    items = [{'id': i, 'title': f'Ransomware hits vendor {i}', 'content': 'Attackers encrypted servers. ' * 5,
+              'source': 'BleepingComputer'} for i in range(7)]
+    # 每批最多 1000 // 450 = 2 条
+    results = client.translate_batch(items, output_tokens_per_item=450, max_tokens=1000)
+    client.close()
+    server.shutdown()
+
+    assert sorted(MockGLMHandler.batch_sizes) == [1, 2, 2, 2], MockGLMHandler.batch_sizes
+    assert sorted(results) == [str(i) for i in range(7)], sorted(results)
+    for i in range(7):
+        if i != 2:
+            assert results[str(i)]['chinese_title'] == f'译：Ransomware hits vendor {i}', results[str(i)]
+    print("✅ 7条新闻分4批请求，乱序返回的结果按id正确对应")
+
+    assert MockGLMHandler.single_titles == ['Ransomware hits vendor 2'], MockGLMHandler.single_titles
+    assert results['2']['chinese_title'] == '单译：Ransomware hits vendor 2'
+    print("✅ 批量结果缺失的条目逐条补译")
+
+
+def test_input_budget_split():
+    """测试按输入token预算分批"""
+    print("\n🧪 测试2: 按输入token预算分批")
+    server = start_server()
+    client = make_client(server)
+    items = [{'id': i, 'title': f'Title {i}', 'content': 'x' * 800, 'source': 'S'} for i in range(4)]
+    # 模板约400 token，每条约220 token，预算只够每批容纳2条
+    client.translate_batch(items, input_token_budget=900, max_tokens=10000)
+    client.close()
+    server.shutdown()
+    assert MockGLMHandler.batch_sizes == [2, 2], MockGLMHandler.batch_sizes
+    print("✅ 超出输入预算时拆分为多批")
+
+
+def test_generator_applies_translations():
+    """测试生成器把译文写回英文新闻"""
+    print("\n🧪 测试3: 生成器批量翻译")
+    server = start_server()
+    generator = GLMNewsGenerator('test-key')
+    generator._enhanced_client = make_client(server)
+    news_list = [
+        {'title': 'Zero-day in VPN', 'content': 'Exploited.', 'source': 'A', 'language': 'en'},
+        {'title': '国内安全新闻', 'content': '正文', 'source': 'B', 'language': 'zh'},
+        {'title': 'Phishing wave', 'content': 'Emails.', 'source': 'C', 'language': 'en'},
+    ]
+    generator.translate_english_news_batch(news_list)
+    generator.close()
+    server.shutdown()
+    assert MockGLMHandler.batch_sizes == [2], MockGLMHandler.batch_sizes
+    assert news_list[0]['chinese_title'] == '译：Zero-day in VPN'
+    assert news_list[2]['chinese_title'] == '单译：Phishing wave'  # 序号2被模拟API漏掉
+    assert 'chinese_title' not in news_list[1]
+    print("✅ 一次请求翻译全部英文新闻，中文新闻保持不变")
+
+
+def test_pipeline_translates_selected_news():
+    """测试生成分析时精选出的英文新闻一次批量翻译，译文进入摘要与分类的输入"""
+    print("\n🧪 测试4: 流水线中的批量翻译")
+    server = start_server()
+    generator = GLMNewsGenerator('test-key')
+    client = make_client(server)
+    generator._enhanced_client = client
+    prompts = []
+    client.generate_summary = lambda news_text: prompts.append(news_text) or '今日摘要'
+    client.categorize_and_summarize = lambda news_text, max_tokens=None: {'安全风险': [{'title': '译文'}]}
+    generator.select_top_news = lambda news_list: news_list
+    news_list = [
+        {'title': f'Breach at company {i}', 'content': 'Data stolen. ' * 10, 'source': 'S', 'language': 'en'}
+        for i in range(4)
+    ] + [{'title': '国内安全新闻', 'content': '正文', 'source': 'B', 'language': 'zh'}]
+    result = generator.generate_news_analysis(news_list)
+    generator.close()
+    server.shutdown()
+
+    assert MockGLMHandler.batch_sizes == [4], MockGLMHandler.batch_sizes
+    assert MockGLMHandler.single_titles == ['Breach at company 2'], MockGLMHandler.single_titles
+    assert result['selected_news'][0]['chinese_title'] == '译：Breach at company 0'
+    assert '中文标题: 译：Breach at company 0' in prompts[0] and '中文标题: 单译：Breach at company 2' in prompts[0]
+    print("✅ 4条英文新闻合并为1次批量请求，译文写入摘要与分类的输入")
+
+
+def test_failed_translation_not_applied():
+    """测试批量和逐条翻译都无法解析时不写入占位译文，也不保存翻译检查点"""
+    print("\n🧪 测试5: 翻译失败")
+    from src.core.checkpoint import RunCheckpoint
+
+    server = start_server()
+    MockGLMHandler.fail = True
+    generator = GLMNewsGenerator('test-key')
+    client = make_client(server)
+    generator._enhanced_client = client
+    prompts = []
+    client.generate_summary = lambda news_text: prompts.append(news_text) or '今日摘要'
+    client.categorize_and_summarize = lambda news_text, max_tokens=None: {'安全风险': []}
+    generator.select_top_news = lambda news_list: news_list
+    news_list = [
+        {'title': f'Unparseable reply {i}', 'content': 'Data stolen. ' * 10, 'source': 'S', 'language': 'en'}
+        for i in range(2)
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        generator._checkpoint = RunCheckpoint.create('20250102', tmp_dir)
+        result = generator.generate_news_analysis(news_list)
+        saved = generator._checkpoint.completed_stages()
+    generator.close()
+    server.shutdown()
+
+    assert MockGLMHandler.batch_sizes == [2], MockGLMHandler.batch_sizes
+    assert sorted(MockGLMHandler.single_titles) == ['Unparseable reply 0', 'Unparseable reply 1']
+    for news in result['selected_news']:
+        assert 'chinese_title' not in news and 'translated_summary' not in news, news
+    assert '中文' not in prompts[0] and '具体详情请参考原文' not in prompts[0]
+    assert 'selection' in saved and 'translation' not in saved, saved
+    print("✅ 翻译失败的新闻保持原文，翻译阶段不保存检查点，恢复运行时会重试")
+
+
+if __name__ == "__main__":
+    test_batches_map_by_id()
+    test_input_budget_split()
+    test_generator_applies_translations()
+    test_pipeline_translates_selected_news()
+    test_failed_translation_not_applied()
+    print("\n🎉 批量翻译测试全部通过")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+流水线检查点测试脚本
+测试阶段结果保存与恢复，以及GLM阶段失败后从检查点继续生成报告
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.checkpoint import RunCheckpoint
+from src.core.glm_news_generator import GLMNewsGenerator
+import config.glm_config as glm_config
+
+
+def test_save_and_load():
+    """测试阶段结果读写和日期字段还原"""
+    print("🧪 测试1: 阶段结果读写")
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = RunCheckpoint.create('20251017', tmp)
+        news = [{'title': '漏洞', 'published_date': date(2025, 10, 17), 'fingerprint': 2 ** 63 + 5,
+                 'metadata': {'crawled_at': datetime(2025, 10, 17, 8, 30)}}]
+        checkpoint.save('feeds', news)
+        assert checkpoint.completed_stages() == ['feeds']
+
+        resumed = RunCheckpoint.find_resumable('20251017', tmp)
+        assert resumed.run_id == checkpoint.run_id
+        assert resumed.load('feeds') == news
+
+        checkpoint.finish('news20251017.html')
+        assert RunCheckpoint.find_resumable('20251017', tmp) is None
+        assert RunCheckpoint.find_resumable('20251016', tmp) is None
+    print("✅ 日期、大整数指纹等字段原样恢复，已完成的运行不再被恢复")
+
+
+class FakeClient:
+    """模拟GLM客户端，分类调用可设置为抛出异常"""
+
+    def __init__(self, fail_categories=False):
+        self.fail_categories = fail_categories
+        self.calls = []
+
+    def select_top_news(self, news_text):
+        self.calls.append('select')
+        return [{'id': str(i), 'title': ''} for i in range(1, 11)]
+
+    def run_parallel(self, calls):
+        return {name: call() for name, call in calls.items()}
+
+    def generate_summary(self, news_text):
+        self.calls.append('summary')
+        return '今日安全态势摘要'
+
+    def categorize_and_summarize(self, news_text, max_tokens=2000):
+        self.calls.append('categories')
+        if self.fail_categories:
+            raise RuntimeError("GLM服务不可用")
+        return {"安全风险": [{"title": "漏洞", "source": "S", "summary": "摘要"}],
+                "安全事件": [], "安全舆情": [], "安全趋势": []}
+
+    def close(self):
+        pass
+
+
+def make_generator(client, fetch_calls):
+    generator = GLMNewsGenerator('test-key')
+    generator._get_enhanced_client = lambda: client
+
+    def fetch(days_back):
+        fetch_calls.append(days_back)
+        return [{'title': f'新闻{i}', 'source': 'S', 'link': f'http://x/{i}', 'content': '正文',
+                 'published_date': date.today(), 'language': 'zh', 'weight': 1.0} for i in range(15)]
+
+    generator._fetch_feed_news = fetch
+    generator._crawl_articles = lambda news_list: None
+    generator.generate_html_report = lambda analysis, date_str: f"<html>{analysis['summary']}</html>"
+    generator._remember_reported_news = lambda news_list: None
+    return generator
+
+
+def test_resume_after_glm_failure():
+    """测试分类失败后从检查点继续，不重新抓取和精选"""
+    print("\n🧪 测试2: GLM失败后恢复运行")
+    old_config = getattr(glm_config, 'CHECKPOINT_CONFIG', None)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        glm_config.CHECKPOINT_CONFIG = {'enabled': True, 'runs_dir': os.path.join(tmp, 'runs')}
+        try:
+            fetch_calls = []
+            failing = FakeClient(fail_categories=True)
+            assert make_generator(failing, fetch_calls).generate_daily_report() == ""
+            assert fetch_calls == [1] and failing.calls.count('select') == 1
+
+            client = FakeClient()
+            report = make_generator(client, fetch_calls).generate_daily_report(resume=True)
+            assert report and os.path.exists(report), report
+            assert fetch_calls == [1], fetch_calls
+            assert client.calls == ['categories'], client.calls
+            assert RunCheckpoint.find_resumable(root=glm_config.CHECKPOINT_CONFIG['runs_dir']) is None
+        finally:
+            os.chdir(cwd)
+            glm_config.CHECKPOINT_CONFIG = old_config
+    print("✅ 恢复运行只重新执行失败的分类阶段")
+
+
+if __name__ == "__main__":
+    test_save_and_load()
+    test_resume_after_glm_failure()
+    print("\n🎉 流水线检查点测试全部通过")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+通用正文提取测试脚本
+测试可读性得分在链接密集的外层容器和正文之间的选择
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from src.crawlers.enhanced_crawler import EnhancedNewsCrawler
+
+PAGE = ('<html><body><div id="wrapper"><div class="links">'
+        + '<a href="#">相关推荐文章链接</a>' * 60
+        + '</div><article><!-- 注释不计入正文 --><p>'
+        + '攻击者利用该漏洞远程执行任意代码。' * 30
+        + '</p><p>详情参见 <a href="#">公告</a> 原文。</p></article></div></body></html>')
+
+
+def test_bs4_scoring():
+    """测试BeautifulSoup路径选择正文容器"""
+    print("🧪 测试1: BeautifulSoup 可读性得分")
+    soup = BeautifulSoup(PAGE, 'html.parser')
+    best = EnhancedNewsCrawler._best_content_node(soup)
+    assert best is not None and best.name == 'article', best
+    print("✅ 链接密集的外层容器未被选中")
+
+
+def test_lxml_scoring():
+    """测试lxml路径与BeautifulSoup路径结果一致"""
+    print("\n🧪 测试2: lxml 可读性得分")
+    try:
+        import lxml.html
+        from src.crawlers.lxml_extractor import LxmlArticleExtractor, best_content_node
+    except ImportError:
+        print("⚠️ 未安装lxml，跳过")
+        return
+    best = best_content_node(lxml.html.fromstring(PAGE))
+    assert best is not None and best.tag == 'article', best
+    soup = BeautifulSoup(PAGE, 'html.parser')
+    expected = soup.find('article').get_text(separator='\n', strip=True)
+    assert LxmlArticleExtractor.generic_content(lxml.html.fromstring(PAGE)) == expected
+    print("✅ 两种解析路径选择相同的正文")
+
+
+if __name__ == "__main__":
+    test_bs4_scoring()
+    test_lxml_scoring()
+    print("\n🎉 通用正文提取测试全部通过")
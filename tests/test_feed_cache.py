@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+RSS条件请求缓存测试脚本
+使用替换的会话模拟 200/304 响应，测试 ETag / Last-Modified 回传和304时复用缓存条目
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawlers.feed_cache import FeedCache
+
+FEED_URL = 'https://feed.example.com/rss'
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Ransomware hits hospital</title><link>https://feed.example.com/1</link>
+<description>Attackers encrypted records.</description><pubDate>Thu, 02 Jan 2025 08:00:00 GMT</pubDate></item>
+<item><title>Zero-day in VPN</title><link>https://feed.example.com/2</link>
+<description>Patch now.</description></item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """依次返回预设的响应，并记录每次请求的请求头"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def test_not_modified_reuses_entries():
+    """测试首次下载保存校验值，304时回传校验值并返回缓存的条目"""
+    print("🧪 测试1: 304复用缓存")
+    validators = {'ETag': '"v1"', 'Last-Modified': 'Thu, 02 Jan 2025 08:00:00 GMT'}
+    session = FakeSession([FakeResponse(200, RSS, validators), FakeResponse(304), FakeResponse(304)])
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = FeedCache(tmp_dir)
+        feed, from_cache = cache.fetch(FEED_URL, session)
+        assert not from_cache and len(feed.entries) == 2
+        assert session.sent_headers[0] == {}
+
+        cached, from_cache = cache.fetch(FEED_URL, session)
+        assert from_cache
+        assert session.sent_headers[1] == {'If-None-Match': '"v1"',
+                                           'If-Modified-Since': 'Thu, 02 Jan 2025 08:00:00 GMT'}
+        assert [entry.title for entry in cached.entries] == ['Ransomware hits hospital', 'Zero-day in VPN']
+        assert cached.entries[0].link == 'https://feed.example.com/1'
+        assert cached.entries[0].summary == 'Attackers encrypted records.'
+        assert tuple(cached.entries[0].published_parsed)[:6] == (2025, 1, 2, 8, 0, 0)
+        assert 'published_parsed' not in cached.entries[1]
+
+        # 新的缓存实例从磁盘读取校验值
+        reloaded, from_cache = FeedCache(tmp_dir).fetch(FEED_URL, session)
+        assert from_cache and session.sent_headers[2] == session.sent_headers[1]
+        assert len(reloaded.entries) == 2
+        assert cache.stats == {'not_modified': 1, 'modified': 1, 'bytes': len(RSS)}
+    print("✅ 304时回传 If-None-Match / If-Modified-Since，返回缓存的2条新闻")
+
+
+def test_no_validators_not_cached():
+    """测试响应没有校验值时不写缓存，下次仍完整下载"""
+    print("\n🧪 测试2: 无校验值")
+    session = FakeSession([FakeResponse(200, RSS), FakeResponse(200, RSS, {'ETag': '"v2"'})])
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = FeedCache(tmp_dir)
+        cache.fetch(FEED_URL, session)
+        assert cache.load(FEED_URL) is None
+        feed, from_cache = cache.fetch(FEED_URL, session)
+        assert not from_cache and session.sent_headers == [{}, {}]
+        assert cache.load(FEED_URL)['etag'] == '"v2"'
+    print("✅ 没有 ETag / Last-Modified 时不缓存，不发送条件请求头")
+
+
+if __name__ == "__main__":
+    test_not_modified_reuses_entries()
+    test_no_validators_not_cached()
+    print("\n🎉 RSS条件请求缓存测试全部通过")
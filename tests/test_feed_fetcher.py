@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+并发RSS抓取测试脚本
+使用假时钟测试按主机的令牌桶限速，使用替换后的 fetch_one 测试整体截止时间放弃慢源
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawlers.feed_fetcher import ConcurrentFeedFetcher
+from src.utils import rate_limiter
+from src.utils.rate_limiter import DomainRateLimiter
+
+
+class FakeClock:
+    """替代 rate_limiter 模块中的 time：sleep 只推进时间，并记录每次等待"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_per_host_spacing():
+    """测试同一主机按速率间隔，不同主机互不影响"""
+    print("🧪 测试1: 按主机限速")
+    clock = FakeClock()
+    original_time = rate_limiter.time
+    rate_limiter.time = clock
+    try:
+        limiter = DomainRateLimiter(rate=0.5, burst=1)
+        # 第一个请求立即放行，之后同一主机每个请求间隔 1/rate = 2 秒
+        delays = [limiter.wait('https://a.example.com/feed') for _ in range(3)]
+        assert delays == [0.0, 2.0, 2.0], delays
+        assert clock.now == 1004.0
+
+        # 其他主机有独立的令牌桶，主机名不区分大小写
+        assert limiter.wait('https://B.example.com/rss') == 0.0
+        assert limiter.wait('https://b.example.com/atom') == 2.0
+
+        # 空闲时令牌按时间恢复，不超过 burst
+        clock.now += 10
+        assert limiter.wait('https://a.example.com/feed') == 0.0
+        assert limiter.wait('https://a.example.com/feed') == 2.0
+
+        burst = DomainRateLimiter(rate=1, burst=3)
+        assert [burst.wait('https://c.example.com/') for _ in range(4)] == [0.0, 0.0, 0.0, 1.0]
+        assert DomainRateLimiter(rate=0).wait('https://a.example.com/feed') == 0.0
+    finally:
+        rate_limiter.time = original_time
+    print("✅ 同一主机间隔 2 秒，不同主机独立，空闲后令牌恢复")
+
+
+def test_deadline_cuts_off_slow_feeds():
+    """测试截止时间到达后放弃未完成的源，结果保持原始顺序"""
+    print("\n🧪 测试2: 整体截止时间")
+    release = threading.Event()
+    sources = [{'name': f'源{i}', 'rss_url': f'https://feed{i}.example.com/rss', 'slow': i % 2 == 1}
+               for i in range(4)]
+
+    def fake_fetch_one(source):
+        if source['slow']:
+            release.wait(10)
+        return {'source': source, 'feed': {'entries': []}, 'error': None, 'from_cache': False, 'elapsed': 0.0}
+
+    fetcher = ConcurrentFeedFetcher(max_workers=4, deadline=0.5)
+    fetcher.fetch_one = fake_fetch_one
+    start = time.monotonic()
+    try:
+        results = fetcher.fetch_all(sources)
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+        fetcher.close()
+
+    assert elapsed < 2, elapsed
+    assert [result['source']['name'] for result in results] == ['源0', '源1', '源2', '源3']
+    assert [result['error'] for result in results] == [None, 'deadline exceeded', None, 'deadline exceeded']
+    assert results[1]['feed'] is None and results[1]['elapsed'] == 0.5
+    assert results[0]['feed'] == {'entries': []}
+    print(f"✅ {elapsed:.2f}s 内返回，2个慢源标记为超时，快源结果保留")
+
+
+if __name__ == "__main__":
+    test_per_host_spacing()
+    test_deadline_cuts_off_slow_feeds()
+    print("\n🎉 并发RSS抓取测试全部通过")
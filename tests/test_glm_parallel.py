@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GLM并行调用测试脚本
+使用本地模拟API验证摘要和分类并行执行，以及并发上限
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.enhanced_glm_client import EnhancedGLMClient
+
+DELAY = 0.5
+
+
+class MockGLMHandler(BaseHTTPRequestHandler):
+    """每个请求延迟 DELAY 秒后返回固定内容，并记录最大并发数"""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with MockGLMHandler.lock:
+            MockGLMHandler.active += 1
+            MockGLMHandler.peak = max(MockGLMHandler.peak, MockGLMHandler.active)
+        time.sleep(DELAY)
+        with MockGLMHandler.lock:
+            MockGLMHandler.active -= 1
+        body = json.dumps({'choices': [{'message': {'content': '{"安全风险": []}'}}]}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockGLMHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_summary_and_categories_in_parallel():
+    """测试摘要与分类并行调用"""
+    print("🧪 测试1: 摘要与分类并行调用")
+    server = start_server()
+    client = EnhancedGLMClient('test-key', base_url=f"http://127.0.0.1:{server.server_port}/", timeout=5)
+    client.session.trust_env = False
+
+    start = time.time()
+    results = client.run_parallel({
+        'summary': lambda: client.generate_summary("news"),
+        'categories': lambda: client.categorize_and_summarize("news")
+    })
+    elapsed = time.time() - start
+    client.close()
+    server.shutdown()
+
+    assert results['summary'] == '{"安全风险": []}'
+    assert set(results['categories']) == {"安全风险", "安全事件", "安全舆情", "安全趋势"}
+    assert elapsed < DELAY * 1.8, elapsed
+    print(f"✅ 两次调用总耗时 {elapsed:.2f}秒，约等于单次调用")
+
+
+def test_concurrency_cap():
+    """测试并发上限"""
+    print("\n🧪 测试2: 并发上限")
+    MockGLMHandler.peak = 0
+    server = start_server()
+    client = EnhancedGLMClient('test-key', base_url=f"http://127.0.0.1:{server.server_port}/",
+                               timeout=5, max_concurrency=2)
+    client.session.trust_env = False
+    messages = [{"role": "user", "content": "hi"}]
+    client.run_parallel({str(i): lambda: client.call_api(messages) for i in range(4)})
+    client.close()
+    server.shutdown()
+    assert MockGLMHandler.peak == 2, MockGLMHandler.peak
+    print("✅ 同时进行中的请求不超过上限")
+
+
+if __name__ == "__main__":
+    test_summary_and_categories_in_parallel()
+    test_concurrency_cap()
+    print("\n🎉 GLM并行调用测试全部通过")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+增量JSON提取测试脚本
+测试从夹杂说明文字的输出中提取JSON、截断输出的部分恢复、结果类型检查，以及流式分块解析
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_stream import JSONStreamExtractor, extract_json
+from utils.enhanced_glm_client import EnhancedGLMClient
+
+CATEGORIES = {
+    "安全风险": [{"title": "漏洞{A}", "summary": "含有\"引号\"和}括号"}, {"title": "漏洞B", "summary": "..."}],
+    "安全事件": [{"title": "数据泄露", "summary": "...", "key_points": ["a", "b"]}],
+    "安全舆情": [],
+    "安全趋势": [{"title": "零信任", "summary": "..."}]
+}
+
+
+def test_extract_complete():
+    """测试提取嵌套JSON"""
+    print("🧪 测试1: 提取完整JSON")
+    text = "以下是分析结果{仅供参考}：\n```json\n" + json.dumps(CATEGORIES, ensure_ascii=False, indent=2) + "\n```\n如需调整请告知。"
+    assert extract_json(text) == CATEGORIES
+    assert extract_json('{"a": [1, 2,], }') == {"a": [1, 2]}
+    assert extract_json("没有JSON") is None
+    print("✅ 跳过说明文字和代码块，嵌套对象与字符串中的括号不影响结果")
+
+
+def test_recover_truncated():
+    """测试截断输出只保留完整的数组元素"""
+    print("\n🧪 测试2: 截断输出恢复")
+    text = json.dumps(CATEGORIES, ensure_ascii=False)
+    cut = text.index('"key_points"') + 5
+    assert extract_json(text[:cut]) == {"安全风险": CATEGORIES["安全风险"], "安全事件": []}
+    assert extract_json('[{"id": "1"}, {"id": "2"}, {"id"') == [{"id": "1"}, {"id": "2"}]
+
+    client = EnhancedGLMClient('test-key')
+    result = client.parse_json_response("```json\n" + text[:cut], fallback_data={'fallback': True})
+    client.close()
+    assert result == {"安全风险": CATEGORIES["安全风险"], "安全事件": []}, result
+    print("✅ 截断的JSON恢复到最后一个完整元素")
+
+
+def test_unexpected_array():
+    """测试预期对象时说明文字中的数组不会作为结果返回"""
+    print("\n🧪 测试3: 预期对象时返回数组")
+    client = EnhancedGLMClient('test-key')
+    fallback = {'selected_news': [{'index': 1}]}
+    assert client.parse_json_response('Result: [{"id": 1}]', fallback) == fallback
+    assert client.parse_json_response('[{"id": 1}]', fallback) == fallback
+    assert client.parse_json_response('Result: [{"id": 1}]', []) == [{'id': 1}]
+    client.call_api = lambda *args, **kwargs: 'Result: [{"id": 1}]'
+    selected = client.select_top_news("新闻")
+    assert len(selected) == 10 and selected[0]['title'] == '全球网络安全新闻 1', selected
+    client.close()
+    print("✅ 备用数据为字典时，数组结果改用备用数据")
+
+
+def test_streamed_chunks():
+    """测试分块输入与一次性输入结果一致"""
+    print("\n🧪 测试4: 流式分块解析")
+    text = "```json\n" + json.dumps(CATEGORIES, ensure_ascii=False) + "\n```"
+    extractor = JSONStreamExtractor()
+    snapshots = []
+    for i in range(0, len(text), 7):
+        done = extractor.feed(text[i:i + 7])
+        snapshots.append(len(extractor.partial() or {}))
+        if done is not None:
+            break
+    assert extractor.complete and extractor.value == CATEGORIES
+    assert snapshots[0] == 0 and snapshots[-1] == 4
+    assert snapshots == sorted(snapshots)
+    print("✅ 分块输入时部分结果逐步增长，结束时得到完整结果")
+
+
+def test_async_complete_json():
+    """测试异步流式调用中回调部分结果"""
+    print("\n🧪 测试5: 流式调用回调部分结果")
+    try:
+        from utils.async_glm_client import AsyncGLMClient
+        client = AsyncGLMClient('test-key')
+    except ImportError:
+        print("⚠️ 未安装 aiohttp，跳过")
+        return
+
+    text = json.dumps(CATEGORIES, ensure_ascii=False)
+
+    async def fake_complete(messages, stream=True, on_token=None, **kwargs):
+        for i in range(0, len(text), 5):
+            on_token(text[i:i + 5])
+        return {'content': text, 'error': None}
+
+    client.complete = fake_complete
+    updates = []
+    result = asyncio.run(client.complete_json([{"role": "user", "content": "分类"}],
+                                              on_partial=lambda partial: updates.append(partial)))
+    assert result['json_complete'] and result['json'] == CATEGORIES
+    risk_counts = [len(update.get("安全风险", [])) for update in updates]
+    assert 1 in risk_counts and risk_counts[-1] == 2, risk_counts
+    print(f"✅ 响应结束前收到 {len(updates)} 次部分结果更新")
+
+
+if __name__ == "__main__":
+    test_extract_complete()
+    test_recover_truncated()
+    test_unexpected_array()
+    test_streamed_chunks()
+    test_async_complete_json()
+    print("\n🎉 增量JSON提取测试全部通过")
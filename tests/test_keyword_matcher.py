@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+关键词匹配器测试脚本
+测试重叠关键词计数、英文词边界、复合词和四维度分类
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.keyword_matcher import KeywordMatcher, get_default_matcher
+
+
+def test_overlapping_counts():
+    """测试重叠关键词和命中次数"""
+    print("🧪 测试1: 重叠关键词计数")
+    matcher = KeywordMatcher(['安全', '网络安全', '安全漏洞', 'CVE'])
+    result = matcher.match("网络安全周报：安全漏洞CVE-2024-1234", "cve 补丁")
+    assert result['keywords'] == {'安全': 2, '网络安全': 1, '安全漏洞': 1, 'CVE': 2}, result
+    assert result['hits'] == 6 and result['relevant']
+    print("✅ 同一位置的长短关键词均被统计")
+
+
+def test_word_boundary():
+    """测试英文关键词的词边界"""
+    print("\n🧪 测试2: 英文词边界")
+    matcher = KeywordMatcher(['RCE', 'APT', 'attack'])
+    assert not matcher.is_relevant("Open source resources", "Capture the flag")
+    assert matcher.is_relevant("New RCE found", None)
+    assert matcher.match("Attackers target banks")['keywords'] == {'attack': 1}
+    print("✅ 单词内部的子串不会误命中")
+
+
+def test_compound_words():
+    """测试 cyber-/anti- 等复合词中的关键词"""
+    print("\n🧪 测试3: 英文复合词")
+    matcher = get_default_matcher()
+    for headline in ("Cyberattack hits hospital", "New cyberattacks on banks", "Cybercriminals steal data"):
+        result = matcher.match(headline)
+        assert result['relevant'] and result['hits'] > 0, (headline, result)
+    assert KeywordMatcher(['malware']).is_relevant("New anti-malware engine")
+    # 普通刑事新闻不算安全相关
+    assert not matcher.is_relevant("Criminal trial begins for bank robber")
+    assert not KeywordMatcher(['RCE']).is_relevant("Open source resources")
+    print("✅ 复合词中的关键词正常命中")
+
+
+def test_default_classify():
+    """测试基于配置的四维度分类"""
+    print("\n🧪 测试4: 四维度分类")
+    matcher = get_default_matcher()
+    assert matcher.classify("某厂商披露高危漏洞", default="安全趋势") == "安全风险"
+    assert matcher.classify("Ransomware attack hits hospital", default="安全趋势") == "安全事件"
+    assert matcher.classify("网信办发布数据出境新规政策", default="安全趋势") == "安全舆情"
+    assert matcher.classify("季度观察", default="安全趋势") == "安全趋势"
+    print("✅ 按维度顺序返回第一个命中的分类")
+
+
+if __name__ == "__main__":
+    test_overlapping_counts()
+    test_word_boundary()
+    test_compound_words()
+    test_default_classify()
+    print("\n🎉 关键词匹配器测试全部通过")
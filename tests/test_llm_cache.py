@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GLM响应缓存测试脚本
+使用本地模拟API验证重跑命中缓存、强制重新生成和按大小淘汰
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.enhanced_glm_client import EnhancedGLMClient
+from utils.llm_cache import LLMResponseCache
+
+
+class MockGLMHandler(BaseHTTPRequestHandler):
+    """返回带请求序号的内容，并记录请求次数"""
+    requests = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with MockGLMHandler.lock:
+            MockGLMHandler.requests += 1
+            count = MockGLMHandler.requests
+        body = json.dumps({'choices': [{'message': {'content': f'回复{count}'}}]}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockGLMHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_client(server, db_path, bypass_cache=False):
+    client = EnhancedGLMClient('test-key', base_url=f"http://127.0.0.1:{server.server_port}/", timeout=5,
+                               response_cache=LLMResponseCache(db_path), bypass_cache=bypass_cache)
+    client.session.trust_env = False
+    return client
+
+
+def test_rerun_hits_cache():
+    """测试重跑时相同提示词不再调用API"""
+    print("🧪 测试1: 重跑命中缓存")
+    MockGLMHandler.requests = 0
+    server = start_server()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'llm.sqlite3')
+        messages = [{"role": "user", "content": "总结今日安全新闻"}]
+
+        client = make_client(server, db_path)
+        first = client.call_api(messages)
+        client.close()
+
+        # 模拟新进程重跑
+        client = make_client(server, db_path)
+        second = client.call_api(messages)
+        other = client.call_api(messages, temperature=0.3)
+        client.close()
+    server.shutdown()
+
+    assert first == second == '回复1', (first, second)
+    assert other == '回复2', other
+    assert MockGLMHandler.requests == 2, MockGLMHandler.requests
+    print("✅ 相同参数和提示词命中缓存，温度不同时重新调用")
+
+
+def test_bypass_cache():
+    """测试强制重新生成"""
+    print("\n🧪 测试2: 跳过缓存强制重新生成")
+    MockGLMHandler.requests = 0
+    server = start_server()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'llm.sqlite3')
+        messages = [{"role": "user", "content": "hi"}]
+
+        client = make_client(server, db_path)
+        client.call_api(messages)
+        client.close()
+
+        client = make_client(server, db_path, bypass_cache=True)
+        regenerated = client.call_api(messages)
+        client.close()
+
+        # 强制生成的新结果会覆盖旧缓存
+        client = make_client(server, db_path)
+        cached = client.call_api(messages)
+        client.close()
+    server.shutdown()
+
+    assert regenerated == cached == '回复2', (regenerated, cached)
+    assert MockGLMHandler.requests == 2, MockGLMHandler.requests
+    print("✅ 跳过缓存时重新调用API，并更新缓存")
+
+
+def test_size_eviction():
+    """测试超出总大小上限时淘汰最久未访问的响应"""
+    print("\n🧪 测试3: 按总大小淘汰")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache(os.path.join(tmp, 'llm.sqlite3'), max_bytes=3000)
+        for i in range(5):
+            cache.set('glm-4-flash', 0.7, 2000, [{"role": "user", "content": str(i)}], '安' * 300)
+        kept = [i for i in range(5)
+                if cache.get('glm-4-flash', 0.7, 2000, [{"role": "user", "content": str(i)}]) is not None]
+        cache.close()
+
+    # 每条约900字节（UTF-8编码），上限内只能保留最近的3条
+    assert kept == [2, 3, 4], kept
+    print("✅ 超出大小上限时按最久未访问淘汰")
+
+
+if __name__ == "__main__":
+    test_rerun_hits_cache()
+    test_bypass_cache()
+    test_size_eviction()
+    print("\n🎉 GLM响应缓存测试全部通过")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+近似去重测试脚本
+测试改写报道聚类、代表条目选择和往日旧闻抑制
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.near_dedup import NearDuplicateIndex, tokenize
+
+BODY = ("研究人员披露了Fortinet FortiOS SSL-VPN中的一个严重远程代码执行漏洞CVE-2026-21762，"
+        "攻击者可在未认证的情况下通过特制请求执行任意代码。该漏洞影响7.0至7.4版本，官方已发布补丁，"
+        "建议用户尽快升级。目前已有在野利用迹象，CISA已将其加入已知被利用漏洞目录。")
+
+NEWS = [
+    {'title': 'Fortinet FortiOS SSL-VPN曝严重RCE漏洞CVE-2026-21762', 'content': BODY, 'weight': 1.0},
+    {'title': '某银行遭勒索软件攻击导致业务中断', 'weight': 1.0,
+     'content': '据报道，某地区性银行遭到勒索软件攻击，核心业务系统中断超过12小时，攻击者要求支付比特币赎金。'},
+    {'title': 'FortiOS SSL-VPN远程代码执行漏洞（CVE-2026-21762）已被在野利用', 'weight': 1.2,
+     'content': BODY.replace('研究人员披露了', '近日，安全研究人员公开了').replace('建议用户尽快升级', '请用户及时更新')},
+]
+
+
+def test_tokenize():
+    """测试中英文混合切词"""
+    print("🧪 测试1: 中英文混合切词")
+    assert tokenize("The CVE-2026-1234 漏洞利用") == ['cve-2026-1234', '漏洞', '洞利', '利用']
+    print("✅ 中文二字组，英文单词并去除停用词")
+
+
+def test_cluster_representative():
+    """测试改写报道聚类并保留权重最高的一条"""
+    print("\n🧪 测试2: 改写报道聚类")
+    index = NearDuplicateIndex()
+    result = index.deduplicate([dict(news) for news in NEWS])
+    titles = [news['title'] for news in result]
+    assert titles == [NEWS[1]['title'], NEWS[2]['title']], titles
+    assert index.stats['duplicates'] == 1
+    print("✅ 同一事件只保留权重最高的报道，顺序不变")
+
+
+def test_history_suppression():
+    """测试往日已报道新闻被抑制"""
+    print("\n🧪 测试3: 往日旧闻抑制")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'index.json')
+        index = NearDuplicateIndex(path)
+        index.remember([dict(NEWS[0])])
+        index.save()
+
+        # 今天重复运行不会抑制自己
+        assert len(NearDuplicateIndex(path).deduplicate([dict(n) for n in NEWS])) == 2
+
+        with open(path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+        records[0]['date'] = (date.today() - timedelta(days=1)).isoformat()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(records, f)
+
+        index = NearDuplicateIndex(path)
+        result = index.deduplicate([dict(n) for n in NEWS])
+        assert [news['title'] for news in result] == [NEWS[1]['title']], result
+        assert index.stats['suppressed'] == 1
+    print("✅ 昨天已报道的事件不再出现")
+
+
+if __name__ == "__main__":
+    test_tokenize()
+    test_cluster_representative()
+    test_history_suppression()
+    print("\n🎉 近似去重测试全部通过")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+新闻预排序测试脚本
+测试多因子打分、截取前N条和自定义打分器
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.pre_ranker import create_default_ranker
+
+TODAY = date.today()
+
+
+def make_news(title, **fields):
+    news = {'title': title, 'weight': 1.0, 'region': '中国', 'category': '综合安全',
+            'keyword_hits': 1, 'published_date': TODAY}
+    news.update(fields)
+    return news
+
+
+def test_default_factors():
+    """测试默认打分因子"""
+    print("🧪 测试1: 默认打分因子")
+    ranker = create_default_ranker(
+        regional_weights={'中国': 1.0, '美国': 1.1},
+        category_priorities={'官方警报': 'highest', '综合安全': 'medium', '行业资讯': 'low'}
+    )
+    news_list = [
+        make_news('普通新闻'),
+        make_news('旧闻', published_date=TODAY - timedelta(days=2)),
+        make_news('官方警报', category='官方警报'),
+        make_news('行业资讯', category='行业资讯'),
+        make_news('多关键词', keyword_hits=7),
+        make_news('美国来源', region='美国'),
+    ]
+    ranked = ranker.rank(news_list, top_n=4)
+    assert [n['title'] for n in ranked] == ['多关键词', '官方警报', '美国来源', '普通新闻'], ranked
+    assert ranked[0]['pre_rank_factors']['keywords'] == 1.75
+    print("✅ 关键词、类别、地区和时效性共同决定排序，只保留前N条")
+
+
+def test_custom_scorer():
+    """测试注册自定义打分器"""
+    print("\n🧪 测试2: 自定义打分器")
+    ranker = create_default_ranker()
+    ranker.add_scorer('english_bonus', lambda news: 2.0 if news.get('language') == 'en' else 1.0)
+    ranked = ranker.rank([make_news('中文'), make_news('English', language='en')])
+    assert ranked[0]['title'] == 'English'
+    assert 'english_bonus' in ranked[0]['pre_rank_factors']
+    print("✅ 自定义打分器参与总分计算")
+
+
+if __name__ == "__main__":
+    test_default_factors()
+    test_custom_scorer()
+    print("\n🎉 预排序测试全部通过")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+运行耗时分析器测试脚本
+测试耗时区间记录、Chrome Trace 输出、汇总表，以及未开启时的开销
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.profiler import PROFILE_ENV, Profiler
+
+
+def test_disabled_profiler():
+    """测试未开启时不记录、开销极小"""
+    print("🧪 测试1: 未开启时的开销")
+    profiler = Profiler(enabled=False)
+    start = time.perf_counter()
+    for _ in range(100000):
+        with profiler.span('glm.call', model='glm-4-flash'):
+            pass
+    elapsed = time.perf_counter() - start
+    assert profiler.events == []
+    assert profiler.finish() is None
+    print(f"✅ 10万次空区间耗时 {elapsed * 1000:.1f}ms，未产生任何记录")
+
+
+def test_env_switch():
+    """测试环境变量开关"""
+    print("\n🧪 测试2: 环境变量开关")
+    original = os.environ.get(PROFILE_ENV)
+    try:
+        for value, enabled, path in (('', False, None), ('0', False, None), ('1', True, None),
+                                     ('/tmp/trace.json', True, '/tmp/trace.json')):
+            os.environ[PROFILE_ENV] = value
+            profiler = Profiler.from_env()
+            assert profiler.enabled == enabled and profiler.trace_path == path, value
+    finally:
+        if original is None:
+            os.environ.pop(PROFILE_ENV, None)
+        else:
+            os.environ[PROFILE_ENV] = original
+    print("✅ NEWS_PROFILE=1 使用默认路径，其他值作为追踪文件路径")
+
+
+def test_trace_and_summary():
+    """测试多线程记录、追踪文件格式和汇总表"""
+    print("\n🧪 测试3: 追踪文件与汇总表")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trace_path = os.path.join(tmp_dir, 'profiles', 'trace.json')
+        profiler = Profiler(enabled=True, trace_path=trace_path)
+
+        def fetch(name):
+            with profiler.span('feed.fetch', source=name):
+                time.sleep(0.01)
+
+        with profiler.span('stage.feeds'):
+            threads = [threading.Thread(target=fetch, args=(f"源{i}",), name=f"feed_{i}") for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        try:
+            with profiler.span('glm.call', model='glm-4-flash'):
+                raise ValueError("模拟失败")
+        except ValueError:
+            pass
+
+        rows = {row['name']: row for row in profiler.summary()}
+        assert rows['feed.fetch']['count'] == 4
+        assert rows['stage.feeds']['total_ms'] >= rows['feed.fetch']['max_ms'] >= 10
+        table = profiler.format_summary()
+        assert 'feed.fetch' in table and 'glm.call' in table
+
+        assert profiler.finish() == trace_path
+        assert profiler.events == []
+        with open(trace_path, 'r', encoding='utf-8') as f:
+            trace = json.load(f)
+
+    events = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+    names = {event['args']['name'] for event in trace['traceEvents'] if event['ph'] == 'M'}
+    assert len(events) == 6
+    assert {'feed_0', 'feed_3'} <= names
+    assert {event['cat'] for event in events} == {'feed', 'stage', 'glm'}
+    failed = [event for event in events if event['name'] == 'glm.call'][0]
+    assert failed['args'] == {'model': 'glm-4-flash', 'error': 'ValueError'}
+    print(table)
+    print("✅ 追踪文件符合 Chrome Trace 格式，异常区间标记错误类型")
+
+
+if __name__ == "__main__":
+    test_disabled_profiler()
+    test_env_switch()
+    test_trace_and_summary()
+    print("\n🎉 耗时分析器测试全部通过")
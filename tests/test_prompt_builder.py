@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+提示词组装测试脚本
+测试token估算、按得分分配正文预算以及预算内收录
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.prompt_builder import PromptBuilder
+from src.utils.token_estimator import estimate_tokens, truncate_to_tokens
+
+
+def make_entries(count, body, scores=None):
+    return [
+        {'header': f"{i+1}. 【来源{i}】新闻标题{i}\n", 'body': body, 'score': scores[i] if scores else 1.0}
+        for i in range(count)
+    ]
+
+
+def test_token_estimator():
+    """测试中英文token估算和截断"""
+    print("🧪 测试1: 中英文token估算")
+    assert estimate_tokens('') == 0
+    assert estimate_tokens('勒索软件攻击') == 6
+    assert estimate_tokens('ransomware') == 3
+    assert estimate_tokens('CVE漏洞') == 3
+
+    text = '零日漏洞 zero-day exploit ' * 20
+    for limit in (0, 7, 50, 1000):
+        truncated = truncate_to_tokens(text, limit)
+        assert text.startswith(truncated)
+        assert estimate_tokens(truncated) <= limit
+    assert truncate_to_tokens(text, 1000) == text
+    print("✅ 中文按字、英文按4字符估算，截断结果不超过上限")
+
+
+def test_budget_and_score_allocation():
+    """测试预算内收录和按得分分配正文"""
+    print("\n🧪 测试2: 按得分分配正文预算")
+    body = '攻击者利用该漏洞远程执行代码。' * 40
+    builder = PromptBuilder(1500, min_item_tokens=30, max_item_tokens=400)
+    report = builder.build(make_entries(8, body, scores=[4, 2, 1, 1, 1, 1, 1, 1]), template='模板' * 100)
+
+    assert report['prompt_tokens'] <= 1500, report['prompt_tokens']
+    assert report['included'] == 8 and report['truncated'] == 8
+    parts = report['news_text'].split('\n\n')
+    lengths = [len(part) for part in parts]
+    assert lengths[0] > lengths[1] > lengths[2], lengths
+    assert lengths[2] == lengths[6], lengths
+    print(f"✅ 提示词约 {report['prompt_tokens']} tokens，正文长度随得分递减: {lengths}")
+
+
+def test_short_bodies_release_budget():
+    """测试短正文完整保留，剩余预算分给长正文"""
+    print("\n🧪 测试3: 短正文不截断")
+    entries = make_entries(3, '短正文')
+    entries.append({'header': "4. 【来源】长新闻\n", 'body': 'long body text ' * 200, 'score': 0.1})
+    report = PromptBuilder(1000, max_item_tokens=500).build(entries)
+    assert report['truncated'] == 1
+    assert report['news_text'].count('内容: 短正文\n') == 3
+    assert estimate_tokens(report['news_text'].split('\n\n')[3]) > 400
+    print("✅ 得分低的长正文也能用上其他条目剩余的预算")
+
+
+def test_item_limits():
+    """测试超出预算或条数上限时只收录排在前面的新闻"""
+    print("\n🧪 测试4: 收录条数")
+    report = PromptBuilder(400).build(make_entries(50, '正文' * 100))
+    assert 0 < report['included'] < 50
+    assert report['news_text'].startswith('1. ')
+    assert report['prompt_tokens'] <= 400, report['prompt_tokens']
+
+    report = PromptBuilder(100000).build(make_entries(50, '正文'), max_items=10)
+    assert report['included'] == 10 and report['total'] == 50
+    print("✅ 按顺序收录直到预算或条数上限")
+
+
+if __name__ == "__main__":
+    test_token_estimator()
+    test_budget_and_score_allocation()
+    test_short_bodies_release_budget()
+    test_item_limits()
+    print("\n🎉 提示词组装测试全部通过")
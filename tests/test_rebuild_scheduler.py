@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+索引重建调度测试脚本
+测试文件事件合并为一次重建、在后台线程执行、事件持续不断时按最长推迟时间重建，
+以及真实文件写入时只重新解析变化的文件
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from tools.news_monitor import NewsFileHandler, NewsIndexGenerator, RebuildScheduler
+except ImportError:
+    RebuildScheduler = None
+
+REPORT_HTML = """<html><head><title>海之安网络安全快报 {date}</title></head><body>
+<div class="summary-content">{summary}</div></body></html>"""
+
+
+def write_report(directory, date, summary='今日安全新闻摘要'):
+    path = os.path.join(directory, f"news{date}.html")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(REPORT_HTML.format(date=date, summary=summary))
+    return path
+
+
+def test_burst_coalesced():
+    """测试一组事件只触发一次重建"""
+    print("🧪 测试1: 事件合并")
+    if RebuildScheduler is None:
+        print("⚠️ 未安装 watchdog，跳过")
+        return
+    calls = []
+    scheduler = RebuildScheduler(lambda changed: calls.append((set(changed), threading.current_thread().name)),
+                                 quiet_period=0.1)
+    scheduler.start()
+    for _ in range(5):
+        scheduler.notify('./news20250101.html')
+        scheduler.notify('./news20250102.html')
+    assert calls == []
+    assert scheduler.wait_idle(timeout=5)
+    scheduler.stop(timeout=5)
+    assert calls == [({'./news20250101.html', './news20250102.html'}, 'index-rebuild')], calls
+    print("✅ 10个事件合并为1次重建，在后台线程执行")
+
+
+def test_max_delay():
+    """测试事件持续不断时不会无限推迟重建"""
+    print("\n🧪 测试2: 最长推迟时间")
+    if RebuildScheduler is None:
+        print("⚠️ 未安装 watchdog，跳过")
+        return
+    calls = []
+    scheduler = RebuildScheduler(lambda changed: calls.append(time.monotonic()), quiet_period=0.1, max_delay=0.2)
+    scheduler.start()
+    end = time.monotonic() + 0.7
+    while time.monotonic() < end:
+        scheduler.notify('./news20250101.html')
+        time.sleep(0.02)
+    during_burst = len(calls)
+    scheduler.stop(timeout=5)
+    assert during_burst >= 2, calls
+    print(f"✅ 持续0.7秒的事件期间重建 {during_burst} 次，停止时完成剩余重建（共 {len(calls)} 次）")
+
+
+def test_observer_incremental_rebuild():
+    """测试真实文件写入只触发一次增量重建"""
+    print("\n🧪 测试3: 文件监控增量重建")
+    if RebuildScheduler is None:
+        print("⚠️ 未安装 watchdog，跳过")
+        return
+    from watchdog.observers import Observer
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for day in range(1, 21):
+            write_report(tmp_dir, f"202501{day:02d}")
+        generator = NewsIndexGenerator(tmp_dir, manifest_path=os.path.join(tmp_dir, 'manifest.json'))
+        generator.generate_index()
+
+        parsed = []
+        generator.manifest.extractor = lambda path: parsed.append(os.path.basename(path)) or generator.parse_news_file(path)
+        rebuilds = []
+
+        def rebuild(changed):
+            rebuilds.append(changed)
+            generator.generate_index(changed_paths=changed)
+
+        scheduler = RebuildScheduler(rebuild, quiet_period=0.3)
+        observer = Observer()
+        observer.schedule(NewsFileHandler(scheduler), path=tmp_dir, recursive=False)
+        scheduler.start()
+        observer.start()
+        try:
+            write_report(tmp_dir, '20250121')
+            write_report(tmp_dir, '20250105', summary='更新后的摘要')
+            time.sleep(0.1)
+            assert scheduler.wait_idle(timeout=5)
+        finally:
+            observer.stop()
+            observer.join()
+            scheduler.stop(timeout=5)
+
+        assert len(rebuilds) == 1, rebuilds
+        assert sorted(parsed) == ['news20250105.html', 'news20250121.html'], parsed
+        with open(os.path.join(tmp_dir, 'index.html'), 'r', encoding='utf-8') as f:
+            assert '2025年01月21日' in f.read()
+    print("✅ 两个文件的写入事件合并为1次重建，只重新解析这两个文件")
+
+
+if __name__ == "__main__":
+    test_burst_coalesced()
+    test_max_delay()
+    test_observer_incremental_rebuild()
+    print("\n🎉 索引重建调度测试全部通过")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+快报元数据清单测试脚本
+测试增量解析（只解析新增或修改的文件）、内容未变时跳过解析，以及两个索引生成器的清单复用
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.report_manifest import ReportManifest
+
+REPORT_HTML = """<html><head><title>海之安网络安全快报 {date}</title></head><body>
+<div class="summary-content">{summary}</div>
+<div class="news-title">第一条新闻</div>
+</body></html>"""
+
+
+def write_report(directory, date, summary='今日共收录10条安全新闻。'):
+    path = os.path.join(directory, f"news{date}.html")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(REPORT_HTML.format(date=date, summary=summary))
+    return path
+
+
+def test_incremental_refresh():
+    """测试只解析新增或修改的文件"""
+    print("🧪 测试1: 增量解析")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = [write_report(tmp_dir, f"202501{day:02d}") for day in range(1, 21)]
+        parsed = []
+
+        def extractor(path):
+            parsed.append(os.path.basename(path))
+            with open(path, 'r', encoding='utf-8') as f:
+                return {'size': len(f.read())}
+
+        manifest_path = os.path.join(tmp_dir, 'cache', 'manifest.json')
+        manifest = ReportManifest(manifest_path, extractor)
+        assert len(manifest.refresh(paths)) == 20 and len(parsed) == 20
+        manifest.save()
+
+        # 新进程重新加载清单：修改1个、新增1个、删除1个，内容相同只改修改时间的1个
+        parsed.clear()
+        write_report(tmp_dir, '20250105', summary='更新后的摘要，内容更长一些。')
+        paths.append(write_report(tmp_dir, '20250121'))
+        os.remove(paths.pop(0))
+        touched = time.time() + 10
+        os.utime(paths[5], (touched, touched))
+
+        manifest = ReportManifest(manifest_path, extractor)
+        assert len(manifest.refresh(paths)) == 20
+        manifest.prune(paths)
+        assert sorted(parsed) == ['news20250105.html', 'news20250121.html'], parsed
+        stats = manifest.take_stats()
+        assert stats == {'reused': 17, 'rehashed': 1, 'parsed': 2, 'removed': 1}, stats
+
+        # 已知变化的文件时，其余文件不再检查
+        parsed.clear()
+        write_report(tmp_dir, '20250110', summary='监控事件通知的修改。')
+        manifest.refresh(paths, changed=[paths[8]])
+        assert parsed == ['news20250110.html'], parsed
+    print("✅ 只解析新增和内容变化的文件，已删除的文件从清单移除")
+
+
+def test_version_change():
+    """测试提取逻辑版本变化时重新解析"""
+    print("\n🧪 测试2: 版本变化")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = write_report(tmp_dir, '20250101')
+        manifest_path = os.path.join(tmp_dir, 'manifest.json')
+        manifest = ReportManifest(manifest_path, lambda p: {'v': 1}, version='1')
+        manifest.lookup(path)
+        manifest.save()
+        assert ReportManifest(manifest_path, lambda p: {'v': 1}, version='1').lookup(path) == {'v': 1}
+        assert ReportManifest(manifest_path, lambda p: {'v': 2}, version='2').lookup(path) == {'v': 2}
+    print("✅ 版本号不一致时丢弃旧记录")
+
+
+def test_index_generators():
+    """测试两个索引生成器第二次重建时不再解析HTML"""
+    print("\n🧪 测试3: 索引生成器复用清单")
+    from src.core.generate_index import IndexGenerator
+    try:
+        from tools.news_monitor import NewsIndexGenerator
+    except ImportError:
+        NewsIndexGenerator = None
+        print("⚠️ 未安装 watchdog，跳过监控程序的索引生成器")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for day in range(1, 31):
+            write_report(tmp_dir, f"202501{day:02d}")
+
+        cwd = os.getcwd()
+        os.chdir(tmp_dir)
+        try:
+            first = IndexGenerator().get_latest_news()
+            generator = IndexGenerator()
+            second = generator.get_latest_news()
+            assert first == second and first[0]['file'] == 'news20250130.html'
+            assert first[0]['date_obj'].day == 30 and first[0]['summary'] == '今日共收录10条安全新闻。'
+        finally:
+            os.chdir(cwd)
+
+        if NewsIndexGenerator is not None:
+            NewsIndexGenerator(tmp_dir).generate_index()
+            generator = NewsIndexGenerator(tmp_dir)
+            parsed = []
+            generator.manifest.extractor = lambda path: parsed.append(path) or generator.parse_news_file(path)
+            generator.generate_index()
+            news = generator.extract_news_info(os.path.join(tmp_dir, 'news20250115.html'))
+            assert news['date_obj'].day == 15 and news['title'] == '海之安网络安全快报 20250115'
+            assert os.path.exists(os.path.join(tmp_dir, 'index.html'))
+            assert parsed == [], parsed
+    print("✅ 第二次重建直接使用清单记录")
+
+
+if __name__ == "__main__":
+    test_incremental_refresh()
+    test_version_change()
+    test_index_generators()
+    print("\n🎉 快报元数据清单测试全部通过")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+快报元数据测试脚本
+测试生成快报时写入的 newsYYYYMMDD.json，以及各索引生成器优先读取元数据、旧快报回退到HTML解析
+"""
+
+import os
+import re
+import sys
+import tempfile
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.report_metadata import build_report_metadata, load_report_metadata, write_report_metadata
+
+ANALYSIS_RESULT = {
+    'summary': '今日重点关注勒索软件攻击和零日漏洞利用。' * 20,
+    'categories': {
+        '安全风险': [{'title': '某VPN零日漏洞被利用', 'summary': '攻击者利用漏洞...', 'source': 'FreeBuf',
+                    'region': '中国', 'impact_level': '高', 'pub_date': date(2025, 1, 2)}],
+        '安全事件': [{'title': '医院遭勒索攻击', 'summary': '...', 'source': 'BleepingComputer', 'region': '美国'}],
+        '安全舆情': [],
+        '安全趋势': []
+    },
+    'total_news': 2,
+    'original_count': 30,
+    'enhanced_count': 1,
+    'total_chars': 2400,
+    'sources': ['FreeBuf', 'BleepingComputer'],
+    'regions': ['中国', '美国'],
+    'languages': ['zh', 'en'],
+    'selected_news': [{'title': '某VPN零日漏洞被利用', 'pub_date': date(2025, 1, 2), 'fetched': datetime.now()}]
+}
+
+LEGACY_HTML = """<html><head><title>海之安网络安全日报 - 2025年01月01日</title></head><body>
+<div class="summary-content">旧快报的摘要</div></body></html>"""
+
+
+def test_metadata_roundtrip():
+    """测试元数据只包含可序列化的字段"""
+    print("🧪 测试1: 元数据写入与读取")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        html_path = os.path.join(tmp_dir, 'news20250102.html')
+        metadata = build_report_metadata(ANALYSIS_RESULT, '20250102', '海之安网络安全日报 - 2025年01月03日', html_path)
+        assert write_report_metadata(html_path, metadata).endswith('news20250102.json')
+        loaded = load_report_metadata(html_path)
+        assert loaded == metadata
+        assert loaded['report'] == 'news20250102.html' and loaded['headline'] == '某VPN零日漏洞被利用'
+        assert loaded['category_counts'] == {'安全风险': 1, '安全事件': 1, '安全舆情': 0, '安全趋势': 0}
+        assert 'pub_date' not in loaded['categories']['安全风险'][0]
+        assert load_report_metadata(os.path.join(tmp_dir, 'news20250101.html')) is None
+    print("✅ 元数据包含摘要、分类、统计和来源，日期对象不写入")
+
+
+def test_generator_writes_sidecar():
+    """测试生成器写入的元数据标题与HTML一致"""
+    print("\n🧪 测试2: 生成器写入元数据")
+    from src.core.glm_news_generator import GLMNewsGenerator
+    generator = GLMNewsGenerator('test-key', inline_css=True)
+    html = generator.generate_html_report(ANALYSIS_RESULT, '20250102')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        html_path = os.path.join(tmp_dir, 'news20250102.html')
+        generator._write_report_metadata(ANALYSIS_RESULT, '20250102', html_path)
+        metadata = load_report_metadata(html_path)
+    generator.close()
+    assert metadata['title'] == re.search(r'<title>(.*?)</title>', html).group(1)
+    assert metadata['summary'] == ANALYSIS_RESULT['summary'] and metadata['total_news'] == 2
+    print("✅ 元数据与HTML报告内容一致")
+
+
+def test_index_builders_prefer_metadata():
+    """测试索引生成器读取元数据，没有元数据的旧快报解析HTML"""
+    print("\n🧪 测试3: 索引生成器读取元数据")
+    from src.core.generate_index import IndexGenerator
+    from scripts.start_monitor import extract_news_info
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for day in ('01', '02'):
+            with open(os.path.join(tmp_dir, f'news202501{day}.html'), 'w', encoding='utf-8') as f:
+                f.write(LEGACY_HTML)
+        new_path = os.path.join(tmp_dir, 'news20250102.html')
+        write_report_metadata(new_path, build_report_metadata(ANALYSIS_RESULT, '20250102', '新快报标题', new_path))
+
+        generator = IndexGenerator(manifest_path=os.path.join(tmp_dir, 'manifest.json'))
+        new_news = generator.extract_news_summary(new_path)
+        legacy_news = generator.extract_news_summary(os.path.join(tmp_dir, 'news20250101.html'))
+        assert new_news['title'] == '新快报标题' and new_news['summary'].endswith('...')
+        assert new_news['date'] == '2025年01月02日' and new_news['date_obj'] == datetime(2025, 1, 2)
+        assert legacy_news['title'] == '海之安网络安全日报 - 2025年01月01日'
+        assert legacy_news['summary'] == '旧快报的摘要'
+
+        assert extract_news_info(new_path)['title'] == '新快报标题'
+        assert extract_news_info(os.path.join(tmp_dir, 'news20250101.html'))['summary'] == '旧快报的摘要...'
+
+        try:
+            from tools.news_monitor import NewsIndexGenerator
+        except ImportError:
+            print("⚠️ 未安装 watchdog，跳过监控程序的索引生成器")
+        else:
+            monitor = NewsIndexGenerator(tmp_dir, manifest_path=os.path.join(tmp_dir, 'monitor.json'))
+            assert monitor.extract_news_info(new_path)['title'] == '新快报标题'
+            assert monitor.extract_news_info(os.path.join(tmp_dir, 'news20250101.html'))['date_obj'].day == 1
+    print("✅ 新快报读取元数据，旧快报回退到HTML解析")
+
+
+if __name__ == "__main__":
+    test_metadata_roundtrip()
+    test_generator_writes_sidecar()
+    test_index_builders_prefer_metadata()
+    print("\n🎉 快报元数据测试全部通过")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GLM重试策略测试脚本
+使用本地模拟API验证 Retry-After、重试次数统计和时间预算，
+并确认HTTP适配器层不再叠加重试
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.enhanced_glm_client import EnhancedGLMClient
+from utils.retry_policy import RetryPolicy, parse_retry_after
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """按 server.statuses 依次返回状态码，之后返回成功"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.hits += 1
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = json.dumps({'choices': [{'message': {'content': 'ok'}}]} if status == 200 else {}).encode('utf-8')
+        self.send_response(status)
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_client(statuses, policy):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+    server.daemon_threads = True
+    server.statuses, server.hits = list(statuses), 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = EnhancedGLMClient('test-key', base_url=f"http://127.0.0.1:{server.server_port}/",
+                               timeout=5, retry_policy=policy)
+    client.session.trust_env = False
+    return server, client
+
+
+def test_parse_retry_after():
+    """测试 Retry-After 解析"""
+    print("🧪 测试1: Retry-After 解析")
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('soon') is None and parse_retry_after(None) is None
+    print("✅ 支持秒数和HTTP日期")
+
+
+def test_retry_after_and_metrics():
+    """测试遵守 Retry-After 并统计重试次数"""
+    print("\n🧪 测试2: 重试与统计")
+    policy = RetryPolicy(max_attempts=4, base_delay=0.01)
+    server, client = make_client([429, 503], policy)
+    messages = [{"role": "user", "content": "hi"}]
+    assert client.call_api(messages) == 'ok'
+    assert server.hits == 3, f"适配器层不应额外重试，实际请求 {server.hits} 次"
+    assert policy.metrics['retries'] == 2 and policy.metrics['retry_after_honored'] == 1, policy.metrics
+
+    # 不可重试的状态码立即失败
+    server.statuses = [400]
+    assert client.call_api(messages) is None
+    assert server.hits == 4 and policy.metrics['failures'] == 1
+    client.close()
+    server.shutdown()
+    print("✅ 429/503 各重试一次，400 不重试")
+
+
+def test_budgets():
+    """测试单次调用和整个运行的时间预算"""
+    print("\n🧪 测试3: 时间预算")
+    policy = RetryPolicy(max_attempts=100, base_delay=0.2, max_delay=0.2, call_budget=0.5, run_budget=0.8)
+    server, client = make_client([500] * 1000, policy)
+    messages = [{"role": "user", "content": "hi"}]
+
+    start = time.time()
+    assert client.call_api(messages, retry_count=99) is None
+    first = time.time() - start
+    assert first < 0.6, first
+
+    client.call_api(messages, retry_count=99)
+    assert client.call_api(messages, retry_count=99) is None
+    assert time.time() - start < 0.9
+    assert policy.metrics['budget_exhausted'] == 3, policy.metrics
+    client.close()
+    server.shutdown()
+    print(f"✅ 单次调用 {first:.2f}秒内放弃，运行预算耗尽后不再发起请求")
+
+
+if __name__ == "__main__":
+    test_parse_retry_after()
+    test_retry_after_and_metrics()
+    test_budgets()
+    print("\n🎉 GLM重试策略测试全部通过")
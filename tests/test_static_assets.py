@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共享样式表测试脚本
+测试带内容哈希的样式表发布、快报引用共享样式表与内联模式（邮件发送）的输出，
+以及索引页面的内联样式改为引用样式表
+"""
+
+import os
+import re
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.static_assets import externalize_inline_style, fingerprint, publish_stylesheet
+
+ANALYSIS_RESULT = {
+    'summary': '今日重点关注勒索软件攻击。',
+    'categories': {'安全风险': [{'title': '某VPN零日漏洞被利用', 'summary': '攻击者利用漏洞...', 'source': 'FreeBuf',
+                                'region': '中国', 'impact_level': '高'}]},
+    'total_news': 1,
+    'sources': ['FreeBuf']
+}
+
+
+def test_publish_stylesheet():
+    """测试样式表文件名随内容变化，相同内容不重复写入"""
+    print("🧪 测试1: 发布样式表")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        href = publish_stylesheet('report', 'body { color: red; }\n', tmp_dir)
+        assert href == f"assets/css/report.{fingerprint('body { color: red; }' + chr(10))}.css"
+        path = os.path.join(tmp_dir, *href.split('/'))
+        mtime = os.path.getmtime(path)
+        assert publish_stylesheet('report', 'body { color: red; }\n', tmp_dir) == href
+        assert os.path.getmtime(path) == mtime
+
+        # 内容变化时生成新文件，旧文件保留给历史快报
+        new_href = publish_stylesheet('report', 'body { color: blue; }\n', tmp_dir)
+        assert new_href != href and len(os.listdir(os.path.join(tmp_dir, 'assets', 'css'))) == 2
+
+        html = "<head>\n    <style>\n        h1 { margin: 0; }\n    </style>\n</head>"
+        linked = externalize_inline_style(html, 'index', tmp_dir)
+        assert re.fullmatch(r'<head>\n    <link rel="stylesheet" href="assets/css/index\.\w+\.css">\n</head>', linked)
+        assert externalize_inline_style(linked, 'index', tmp_dir) == linked
+    print("✅ 文件名包含内容哈希，内容不变时复用，内容变化时新增文件")
+
+
+def test_report_modes():
+    """测试快报默认引用共享样式表，内联模式输出单文件"""
+    print("\n🧪 测试2: 快报引用与内联样式")
+    from src.core.glm_news_generator import GLMNewsGenerator
+    from src.utils.style_protection import validate_mobile_styles
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            generator = GLMNewsGenerator('test-key')
+            linked = generator.generate_html_report(ANALYSIS_RESULT, '20250102')
+            inline = generator.generate_html_report(ANALYSIS_RESULT, '20250102', inline_css=True)
+            generator.close()
+            href = re.search(r'<link rel="stylesheet" href="(assets/css/report\.\w+\.css)">', linked).group(1)
+            with open(href, 'r', encoding='utf-8') as f:
+                css = f.read()
+            assert '<style>' not in linked and '@media (max-width: 768px)' in css
+            assert inline.replace(f"  <style>\n{css}  </style>", f'  <link rel="stylesheet" href="{href}">') == linked
+            assert len(linked) < len(inline) / 3
+
+            with open('news20250102.html', 'w', encoding='utf-8') as f:
+                f.write(linked)
+            assert validate_mobile_styles('news20250102.html')
+        finally:
+            os.chdir(cwd)
+    print(f"✅ 快报引用 {href}，内联模式与引用模式的页面内容一致")
+
+
+def test_index_pages():
+    """测试两个索引生成器改为引用样式表"""
+    print("\n🧪 测试3: 索引页面引用样式表")
+    from src.core.generate_index import IndexGenerator
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with open(os.path.join(tmp_dir, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write("<html><head>\n    <style>\n        body { margin: 0; }\n    </style>\n</head><body>\n"
+                    "<div class=\"update-time\">实时更新: 2025年01月01日</div>\n</body></html>")
+        with open(os.path.join(tmp_dir, 'news20250102.html'), 'w', encoding='utf-8') as f:
+            f.write("<html><head><title>海之安网络安全快报</title></head><body></body></html>")
+        os.chdir(tmp_dir)
+        try:
+            assert IndexGenerator(manifest_path='manifest.json').generate_index_html()
+            with open('index.html', 'r', encoding='utf-8') as f:
+                html = f.read()
+        finally:
+            os.chdir(cwd)
+        assert '<style>' not in html and 'href="assets/css/index.' in html
+
+        try:
+            from tools.news_monitor import NewsIndexGenerator
+        except ImportError:
+            print("⚠️ 未安装 watchdog，跳过监控程序的索引页面")
+        else:
+            NewsIndexGenerator(tmp_dir, manifest_path=os.path.join(tmp_dir, 'manifest.json')).generate_index()
+            with open(os.path.join(tmp_dir, 'index.html'), 'r', encoding='utf-8') as f:
+                html = f.read()
+            href = re.search(r'href="(assets/css/news_index\.\w+\.css)"', html).group(1)
+            assert '<style>' not in html and os.path.exists(os.path.join(tmp_dir, *href.split('/')))
+    print("✅ 索引页面的样式发布到 assets/css 并改为引用")
+
+
+if __name__ == "__main__":
+    test_publish_stylesheet()
+    test_report_modes()
+    test_index_pages()
+    print("\n🎉 共享样式表测试全部通过")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模板引擎测试脚本
+测试模板语法、独占一行的标签不留空行、include、编译结果缓存与修改后重新编译，
+以及三个页面生成函数改用模板后的输出
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.template_engine import Template, TemplateEngine, TemplateError
+
+
+def test_syntax():
+    """测试变量、条件、循环、set 和注释"""
+    print("🧪 测试1: 模板语法")
+    source = (
+        "<ul>\n"
+        "{# 新闻列表 #}\n"
+        "{% for title, level in items %}\n"
+        "{% set css = classes.get(level, 'low') %}\n"
+        "  <li class=\"{{ css }}\">{{ loop_prefix }}{{ title[:4] }}{{ '...' if len(title) > 4 else '' }}</li>\n"
+        "{% endfor %}\n"
+        "</ul>\n"
+        "{% if not items %}空{% elif len(items) > 1 %}多条{% else %}一条{% endif %}\n"
+        "CSS: a { color: red; }"
+    )
+    template = Template(source)
+    html = template.render({'items': [('勒索软件攻击', '高'), ('漏洞', '中')], 'classes': {'高': 'high'}},
+                           loop_prefix='- ')
+    assert html == ("<ul>\n"
+                    "  <li class=\"high\">- 勒索软件...</li>\n"
+                    "  <li class=\"low\">- 漏洞</li>\n"
+                    "</ul>\n"
+                    "多条\n"
+                    "CSS: a { color: red; }"), repr(html)
+    assert Template(source).render({'items': [], 'classes': {}}).startswith('<ul>\n</ul>\n空\n')
+    # 上下文中的同名变量优先于内置函数
+    assert Template("{{ len }}").render({'len': 3}) == '3'
+    print("✅ 变量、条件、循环、set、注释和CSS花括号输出正确")
+
+
+def test_syntax_errors():
+    """测试语法错误在编译时报出"""
+    print("\n🧪 测试2: 语法错误")
+    for source in ("{% if x %}未闭合", "{% endfor %}", "{{ 1 + }}", "{% while x %}{% endwhile %}"):
+        try:
+            Template(source, name='bad.html')
+        except TemplateError as e:
+            assert 'bad.html' in str(e)
+        else:
+            raise AssertionError(f"未报错: {source}")
+    print("✅ 未闭合的块、多余的结束标签、表达式错误和未知标签都会报错")
+
+
+def test_include_and_cache():
+    """测试 include 与编译缓存"""
+    print("\n🧪 测试3: include 与编译缓存")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        def write(name, content):
+            path = os.path.join(tmp_dir, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            return path
+
+        write('page.html', "<style>\n{% include 'style.css' %}\n</style>\n<h1>{{ title }}</h1>")
+        style_path = write('style.css', "h1 { color: {{ color }}; }\n")
+        engine = TemplateEngine(tmp_dir)
+        assert engine.render('page.html', title='快报', color='red') == \
+            "<style>\nh1 { color: red; }\n</style>\n<h1>快报</h1>"
+        engine.render('page.html', title='快报', color='blue')
+        assert engine.compile_count == 1
+
+        # 被 include 的文件修改后重新编译
+        write('style.css', "h1 { font-weight: bold; }")
+        later = time.time() + 10
+        os.utime(style_path, (later, later))
+        assert 'bold' in engine.render('page.html', title='快报')
+        assert engine.compile_count == 2
+
+        try:
+            engine.render('missing.html')
+        except TemplateError:
+            pass
+        else:
+            raise AssertionError("缺少模板时未报错")
+    print("✅ include 内联展开，未修改时复用编译结果，依赖文件修改后重新编译")
+
+
+def test_page_renderers():
+    """测试改用模板的三个页面生成函数"""
+    print("\n🧪 测试4: 页面生成")
+    from src.core.glm_news_generator import GLMNewsGenerator
+    from src.crawlers.news_scraper import SecurityNewsScraper
+
+    item = {'title': '某VPN零日漏洞被利用', 'summary': '攻击者利用漏洞。', 'source': 'FreeBuf', 'region': '中国',
+            'impact_level': '高', 'link': 'https://example.com/1', 'enhanced_content': True}
+    analysis_result = {'summary': '今日摘要', 'categories': {'安全风险': [item], '安全事件': []},
+                       'total_news': 1, 'original_count': 10, 'enhanced_count': 1, 'total_chars': 500,
+                       'sources': ['FreeBuf']}
+    generator = GLMNewsGenerator('test-key', inline_css=True)
+    html = generator.generate_html_report(analysis_result, '20250102')
+    generator.close()
+    assert html.count('class="news-item"') == 1 and 'category-title icon-risk' in html
+    assert 'category-title icon-event' not in html
+    assert 'impact-high' in html and '深度内容' in html and '{{' not in html and '{%' not in html
+
+    scraper = SecurityNewsScraper()
+    html = scraper.generate_html_content([dict(item, title='标题' * 20), item])
+    assert html.count('class="news-item"') == 2 and '第2期' in html and '【1】' + '标题' * 15 + '...' in html
+
+    try:
+        from tools.news_monitor import NewsIndexGenerator
+    except ImportError:
+        print("⚠️ 未安装 watchdog，跳过监控程序的索引页面")
+    else:
+        news = {'title': '海之安网络安全快报', 'date': '2025年01月02日', 'summary': '摘要', 'filename': 'news20250102.html'}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            monitor = NewsIndexGenerator(tmp_dir, manifest_path=os.path.join(tmp_dir, 'manifest.json'))
+            html = monitor.generate_html_content(
+                news, {'this_week': [news], 'this_month': [news, news], 'this_year': [], 'older': []})
+        assert '本周新闻' in html and '本月新闻' in html and '今年新闻' not in html
+        assert '共收录 3 篇安全快报' in html
+    print("✅ 快报、抓取页面和索引页面渲染正确")
+
+
+if __name__ == "__main__":
+    test_syntax()
+    test_syntax_errors()
+    test_include_and_cache()
+    test_page_renderers()
+    print("\n🎉 模板引擎测试全部通过")
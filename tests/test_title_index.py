@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+精选结果对应测试脚本
+测试按新闻编号、规范化标题和模糊标题把GLM精选结果对应回候选新闻
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.title_index import TitleIndex, normalize_title, resolve_selection
+
+TITLES = [
+    "Microsoft patches SharePoint zero-day CVE-2025-53770",
+    "某银行发生大规模数据泄露事件",
+    "Ransomware gang hits European hospital network",
+    "国家网信办发布数据出境安全评估新规",
+]
+
+
+def test_resolve_by_id():
+    """测试按编号对应，GLM翻译标题不影响结果"""
+    print("🧪 测试1: 按新闻编号对应")
+    selected = [
+        {'id': '3', 'title': '勒索软件团伙攻击欧洲医院网络'},
+        {'id': 1, 'title': '微软修复SharePoint零日漏洞'},
+        {'id': '[2]', 'title': '某银行数据泄露'},
+    ]
+    assert resolve_selection(selected, TITLES) == [2, 0, 1]
+    print("✅ 编号对应不依赖标题文字")
+
+
+def test_resolve_by_title():
+    """测试编号缺失、越界或重复时按标题对应"""
+    print("\n🧪 测试2: 按标题索引对应")
+    assert normalize_title("Ransomware  Gang, hits!") == normalize_title("ransomware gang hits")
+    selected = [
+        {'title': 'ransomware gang hits european hospital network.'},   # 规范化后精确匹配
+        {'id': '99', 'title': '国家网信办发布数据出境安全评估'},         # 编号越界，模糊匹配
+        {'id': '1', 'title': 'Microsoft patches SharePoint zero-day'},  # 编号有效
+        {'id': '1', 'title': '某银行发生大规模数据泄露'},                 # 编号重复，按标题匹配
+        {'title': '完全无关的标题'},
+    ]
+    assert resolve_selection(selected, TITLES) == [2, 3, 0, 1]
+    print("✅ 规范化精确匹配和模糊匹配都能对应，无关标题不会误配")
+
+
+def test_index_scales():
+    """测试大量候选时查找速度"""
+    print("\n🧪 测试3: 大规模候选查找")
+    codes = [hashlib.md5(str(i).encode()).hexdigest()[:12] for i in range(500)]
+    titles = [f"Security advisory {code} for product line released" for code in codes]
+    index = TitleIndex(titles)
+    start = time.time()
+    for i in range(0, 500, 5):
+        assert index.lookup(f"security advisory {codes[i]} for product line") == i
+    elapsed = time.time() - start
+    print(f"✅ 500条候选中模糊查找100次耗时 {elapsed:.2f}秒")
+
+
+if __name__ == "__main__":
+    test_resolve_by_id()
+    test_resolve_by_title()
+    test_index_scales()
+    print("\n🎉 精选结果对应测试全部通过")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+爬虫会话复用基准测试
+在本地启动一个自签名证书的HTTPS服务器模拟新闻站点，
+对比"每篇文章新建爬虫"与"整个运行复用同一个爬虫"的耗时和TLS握手次数
+
+用法: python3 tools/bench_crawler_session.py [文章数量]
+"""
+
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawlers.enhanced_crawler import EnhancedNewsCrawler
+
+ARTICLE_HTML = ("<html><head><title>本地基准测试文章标题示例</title></head><body><article>"
+                + "<p>勒索软件攻击细节与漏洞分析 security research paragraph.</p>" * 40
+                + "</article></body></html>").encode('utf-8')
+
+
+class ArticleHandler(BaseHTTPRequestHandler):
+    """返回固定文章页面，支持HTTP/1.1长连接"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(ARTICLE_HTML)))
+        self.end_headers()
+        self.wfile.write(ARTICLE_HTML)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CountingServer(ThreadingHTTPServer):
+    """统计TLS握手（新连接）次数的HTTPS服务器"""
+    daemon_threads = True
+
+    def __init__(self, address, handler, context):
+        super().__init__(address, handler)
+        self.context = context
+        self.handshakes = 0
+        self._lock = threading.Lock()
+
+    def get_request(self):
+        sock, addr = self.socket.accept()
+        with self._lock:
+            self.handshakes += 1
+        return self.context.wrap_socket(sock, server_side=True), addr
+
+
+def create_certificate(directory):
+    """使用openssl生成localhost自签名证书"""
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.run([
+        'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+        '-keyout', key, '-out', cert, '-days', '1', '-subj', '/CN=localhost',
+        '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1'
+    ], check=True, capture_output=True)
+    return cert, key
+
+
+def trust_local_cert(crawler, cert):
+    """信任本地自签名证书（忽略环境变量中的CA和代理设置）"""
+    crawler.session.trust_env = False
+    crawler.session.verify = cert
+
+
+def run_cold(urls, cert):
+    """每篇文章新建爬虫（旧行为）"""
+    for url in urls:
+        crawler = EnhancedNewsCrawler()
+        trust_local_cert(crawler, cert)
+        crawler.extract_article_content(url)
+        crawler.close()
+
+
+def run_shared(urls, cert):
+    """整个运行复用同一个爬虫"""
+    with EnhancedNewsCrawler() as crawler:
+        trust_local_cert(crawler, cert)
+        for url in urls:
+            crawler.extract_article_content(url)
+
+
+def run_cold_requests(urls, cert):
+    """仅网络请求：每次新建会话"""
+    for url in urls:
+        crawler = EnhancedNewsCrawler()
+        trust_local_cert(crawler, cert)
+        crawler.session.get(url, timeout=15).content
+        crawler.close()
+
+
+def run_shared_requests(urls, cert):
+    """仅网络请求：复用同一会话"""
+    with EnhancedNewsCrawler() as crawler:
+        trust_local_cert(crawler, cert)
+        for url in urls:
+            crawler.session.get(url, timeout=15).content
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = create_certificate(tmp)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+
+        server = CountingServer(('127.0.0.1', 0), ArticleHandler, context)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        urls = [f"https://localhost:{server.server_port}/post/{i}" for i in range(count)]
+
+        print("🚀 爬虫会话复用基准测试")
+        print("=" * 50)
+        results = {}
+        scenarios = [
+            ("仅请求·每篇新建会话", run_cold_requests),
+            ("仅请求·复用会话", run_shared_requests),
+            ("完整提取·每篇新建爬虫", run_cold),
+            ("完整提取·复用同一爬虫", run_shared),
+        ]
+        for name, runner in scenarios:
+            server.handshakes = 0
+            start = time.perf_counter()
+            runner(urls, cert)
+            elapsed = time.perf_counter() - start
+            results[name] = elapsed
+            print(f"{name}: {count} 篇, 耗时 {elapsed:.3f}s, "
+                  f"平均 {elapsed / count * 1000:.1f}ms/篇, TLS握手 {server.handshakes} 次")
+
+        server.shutdown()
+        print("=" * 50)
+        print(f"⚡ 网络请求加速比: {results['仅请求·每篇新建会话'] / results['仅请求·复用会话']:.2f}x")
+        print(f"⚡ 完整提取加速比: {results['完整提取·每篇新建爬虫'] / results['完整提取·复用同一爬虫']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文章提取引擎基准测试
+在已保存的 news*.html 语料上对比 BeautifulSoup(html.parser) 多轮扫描
+与 lxml 单次遍历引擎的吞吐量，并检查两者提取结果是否一致
+
+用法: python3 tools/bench_extractor.py [重复轮数]
+"""
+
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from src.crawlers.enhanced_crawler import EnhancedNewsCrawler
+
+CORPUS_URL = "https://www.oceansecurity.cn/news.html"
+
+
+def extract_bs4(crawler, html):
+    """原实现：html.parser + 多次 select()"""
+    soup = BeautifulSoup(html, 'html.parser')
+    title = crawler._extract_title(soup)
+    content = crawler._extract_main_content(soup, CORPUS_URL)
+    summary = crawler._extract_summary(soup, content)
+    metadata = crawler._extract_metadata(soup)
+    return title, content, summary, metadata
+
+
+def extract_lxml(crawler, html):
+    """新实现：lxml 单次遍历"""
+    return crawler._extract_with_lxml(html, CORPUS_URL)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    files = sorted(glob.glob(os.path.join(root, 'news*.html')))
+    if not files:
+        print("❌ 未找到 news*.html 语料")
+        return
+
+    corpus = []
+    for path in files:
+        with open(path, 'rb') as f:
+            corpus.append(f.read())
+    total_bytes = sum(len(html) for html in corpus)
+
+    crawler = EnhancedNewsCrawler()
+    print("🚀 文章提取引擎基准测试")
+    print(f"📄 语料: {len(corpus)} 个文件, {total_bytes / 1024:.0f} KB, 重复 {rounds} 轮")
+    print("=" * 50)
+
+    timings = {}
+    for name, extract in [("BeautifulSoup(html.parser)", extract_bs4), ("lxml单次遍历", extract_lxml)]:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for html in corpus:
+                extract(crawler, html)
+        elapsed = time.perf_counter() - start
+        timings[name] = elapsed
+        pages = len(corpus) * rounds
+        print(f"{name}: {elapsed:.3f}s, {pages / elapsed:.1f} 页/秒, "
+              f"{total_bytes * rounds / elapsed / 1024 / 1024:.2f} MB/秒")
+
+    mismatches = 0
+    for path, html in zip(files, corpus):
+        old, new = extract_bs4(crawler, html), extract_lxml(crawler, html)
+        if old[0] != new[0] or old[1] != new[1]:
+            mismatches += 1
+            print(f"⚠️ 结果不一致: {os.path.basename(path)}")
+
+    print("=" * 50)
+    values = list(timings.values())
+    print(f"⚡ 加速比: {values[0] / values[1]:.2f}x")
+    print(f"🔍 标题/正文一致: {len(corpus) - mismatches}/{len(corpus)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+报告渲染基准测试
+用1000份合成快报对比三种渲染方式的耗时，并检查输出是否一致：
+  - 字符串累加：与原 generate_html_report 一样在循环中 html += 片段
+  - 每次重新编译：不缓存，每次渲染都重新编译模板
+  - 预编译模板：模板引擎缓存编译结果，片段追加到列表后一次性拼接
+
+用法: python3 tools/bench_render.py [快报份数]
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.template_engine import Template, get_engine
+
+TEMPLATE_NAME = 'report.html'
+CATEGORIES = [('安全风险', 'icon-risk'), ('安全事件', 'icon-event'), ('安全舆情', 'icon-opinion'), ('安全趋势', 'icon-trend')]
+SOURCES = ['FreeBuf', '安全客', 'BleepingComputer', 'The Hacker News', 'SecurityWeek', 'Dark Reading']
+
+
+def synthetic_context(rng, report_css):
+    """生成一份与 generate_html_report 传给模板的变量结构相同的快报（内联样式）"""
+    categories = []
+    total_news = 0
+    for category, icon_class in CATEGORIES:
+        items = []
+        for _ in range(rng.randint(0, 12)):
+            items.append({
+                'title': f"{category}新闻标题" * rng.randint(1, 4),
+                'summary': '攻击者利用漏洞获取系统权限，影响范围持续扩大。' * rng.randint(2, 10),
+                'source': rng.choice(SOURCES),
+                'region': rng.choice(['中国', '美国', '欧洲', '全球']),
+                'impact_level': rng.choice(['高', '中', '低']),
+                'link': f"https://example.com/news/{rng.randint(1, 10 ** 6)}",
+                'enhanced_content': rng.random() < 0.3
+            })
+        total_news += len(items)
+        if items:
+            categories.append((category, icon_class, items))
+    return {
+        'title': '海之安网络安全日报 - 2025年01月03日',
+        'current_time': '2025年01月03日',
+        'stylesheet_href': None,
+        'inline_css': report_css,
+        'summary': '今日重点关注勒索软件攻击和零日漏洞利用。' * rng.randint(5, 20),
+        'total_news': total_news,
+        'total_news_divisor': total_news or 1,
+        'original_count': total_news * 3,
+        'enhanced_count': total_news // 3,
+        'total_chars': total_news * 1200,
+        'sources': rng.sample(SOURCES, rng.randint(1, len(SOURCES))),
+        'categories': categories,
+        'impact_classes': {'高': 'impact-high', '中': 'impact-medium', '低': 'impact-low'}
+    }
+
+
+def concat_render_function(template):
+    """把编译结果改写为 _out += 片段 的字符串累加版本，作为原实现的对照"""
+    source = template.python_source.replace('    _out = []', "    _out = ''").replace('    _append = _out.append\n', '')
+    source = re.sub(r'^(\s*)_append\((.*)\)$', r'\1_out += \2', source, flags=re.MULTILINE)
+    source = source.replace("return ''.join(_out)", 'return _out')
+    namespace = {'_builtins': __builtins__}
+    exec(compile(source, '<concat>', 'exec'), namespace)
+    return namespace['_render']
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rng = random.Random(42)
+    engine = get_engine()
+    report_css = engine.render('report.css')
+    contexts = [synthetic_context(rng, report_css) for _ in range(count)]
+
+    template = engine.get_template(TEMPLATE_NAME)
+    source = engine.read_source(TEMPLATE_NAME)
+    concat_render = concat_render_function(template)
+
+    renderers = [
+        ("字符串累加", concat_render),
+        ("每次重新编译", lambda context: Template(source, TEMPLATE_NAME, loader=engine).render(context)),
+        ("预编译模板", lambda context: engine.render(TEMPLATE_NAME, context)),
+    ]
+
+    print("🚀 报告渲染基准测试")
+    print(f"📄 合成快报: {count} 份, 新闻 {sum(c['total_news'] for c in contexts)} 条")
+    print("=" * 50)
+
+    timings = {}
+    outputs = {}
+    for name, render in renderers:
+        start = time.perf_counter()
+        outputs[name] = [render(context) for context in contexts]
+        elapsed = time.perf_counter() - start
+        timings[name] = elapsed
+        total_bytes = sum(len(html.encode('utf-8')) for html in outputs[name])
+        print(f"{name}: {elapsed:.3f}s, {count / elapsed:.1f} 份/秒, "
+              f"{total_bytes / elapsed / 1024 / 1024:.2f} MB/秒")
+
+    print("=" * 50)
+    baseline = outputs["预编译模板"]
+    for name in ("字符串累加", "每次重新编译"):
+        print(f"⚡ 预编译模板相对{name}: {timings[name] / timings['预编译模板']:.2f}x")
+    mismatches = sum(1 for name in outputs for a, b in zip(outputs[name], baseline) if a != b)
+    print(f"🔍 输出一致: {'是' if mismatches == 0 else f'否（{mismatches} 份不一致）'}")
+
+
+if __name__ == "__main__":
+    main()
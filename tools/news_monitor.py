@@ -7,34 +7,206 @@
 
 import os
 import re
+import sys
 import time
 import glob
+import threading
 from datetime import datetime, timedelta
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from bs4 import BeautifulSoup
 import json
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.report_manifest import ReportManifest
+from src.core.report_metadata import load_report_metadata, report_date
+from src.utils.static_assets import publish_stylesheet
+from src.utils.template_engine import render_template
+
+# 快报元数据清单，提取逻辑变化时递增版本号
+MANIFEST_VERSION = '2'
+
+# 最后一个文件事件之后静默多久才重建索引（秒），以及事件持续不断时最长推迟多久
+DEBOUNCE_SECONDS = 1.0
+MAX_DELAY_SECONDS = 10.0
+
+class RebuildScheduler:
+    """
+    索引重建调度器
+    一次文件写入会触发多个事件，事件先在这里合并，静默期过后在后台线程执行一次重建，
+    并把这段时间内变化过的文件路径一并传给重建函数
+    """
+    
+    def __init__(self, rebuild, quiet_period=DEBOUNCE_SECONDS, max_delay=MAX_DELAY_SECONDS):
+        """
+        Args:
+            rebuild: 重建函数，参数为变化过的文件路径集合
+            quiet_period: 静默期（秒）
+            max_delay: 第一个事件之后最长推迟多久必须重建（秒）
+        """
+        self.rebuild = rebuild
+        self.quiet_period = quiet_period
+        self.max_delay = max_delay
+        self.rebuild_count = 0
+        self._pending = set()
+        self._first_event = None
+        self._last_event = None
+        self._running = False
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread = None
+    
+    def start(self):
+        """启动后台重建线程"""
+        with self._condition:
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name='index-rebuild', daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout=None):
+        """停止后台线程，尚未执行的重建会在退出前完成"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+    
+    def notify(self, path):
+        """
+        登记一个文件事件（在监控线程中调用，只记录不重建）
+        
+        Args:
+            path: 变化的文件路径
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._pending.add(path)
+            if self._first_event is None:
+                self._first_event = now
+            self._last_event = now
+            self._condition.notify_all()
+    
+    def wait_idle(self, timeout=None):
+        """
+        等待所有已登记的事件重建完成
+        
+        Returns:
+            bool: 是否在超时前完成
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+    
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if not self._pending:
+                        if not self._running:
+                            return
+                        self._condition.wait()
+                        continue
+                    now = time.monotonic()
+                    due = min(self._last_event + self.quiet_period, self._first_event + self.max_delay)
+                    if now >= due or not self._running:
+                        break
+                    self._condition.wait(due - now)
+                changed, self._pending = self._pending, set()
+                self._first_event = self._last_event = None
+                self._busy = True
+            
+            try:
+                self.rebuild(changed)
+                self.rebuild_count += 1
+            except Exception as e:
+                print(f"重建索引失败: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
 class NewsFileHandler(FileSystemEventHandler):
-    def __init__(self, generator):
-        self.generator = generator
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+    
+    @staticmethod
+    def _is_news_file(path):
+        return path.endswith('.html') and 'news' in os.path.basename(path)
     
     def on_modified(self, event):
-        if not event.is_directory and event.src_path.endswith('.html') and 'news' in os.path.basename(event.src_path):
+        if not event.is_directory and self._is_news_file(event.src_path):
             print(f"检测到文件变更: {event.src_path}")
-            self.generator.generate_index()
+            self.scheduler.notify(event.src_path)
     
     def on_created(self, event):
-        if not event.is_directory and event.src_path.endswith('.html') and 'news' in os.path.basename(event.src_path):
+        if not event.is_directory and self._is_news_file(event.src_path):
             print(f"检测到新文件: {event.src_path}")
-            self.generator.generate_index()
+            self.scheduler.notify(event.src_path)
+    
+    def on_deleted(self, event):
+        if not event.is_directory and self._is_news_file(event.src_path):
+            print(f"检测到文件删除: {event.src_path}")
+            self.scheduler.notify(event.src_path)
+    
+    def on_moved(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, event.dest_path):
+            if self._is_news_file(path):
+                print(f"检测到文件移动: {event.src_path} -> {event.dest_path}")
+                self.scheduler.notify(path)
+
+def news_info_from_metadata(filepath, metadata):
+    """从快报元数据JSON构建新闻信息，日期无效时返回None"""
+    date_obj = report_date(metadata)
+    if date_obj is None:
+        return None
+    summary = metadata.get('summary') or ''
+    return {
+        'filename': os.path.basename(filepath),
+        'title': metadata.get('title') or "海之安每日网络安全快报",
+        'date': date_obj.strftime('%Y年%m月%d日'),
+        'date_iso': date_obj.isoformat(),
+        'summary': summary[:200] + "..." if summary else metadata.get('headline', '')
+    }
 
 class NewsIndexGenerator:
-    def __init__(self, directory="."):
+    def __init__(self, directory=".", manifest_path=None):
         self.directory = directory
-        
+        # 已解析的快报记录在清单中，重建索引时只解析新增或修改过的文件
+        self.manifest = ReportManifest(
+            manifest_path or os.path.join(directory, 'output', 'cache', 'monitor_manifest.json'),
+            self.parse_news_file,
+            version=MANIFEST_VERSION
+        )
+    
     def extract_news_info(self, filepath):
-        """从新闻文件中提取信息"""
+        """从新闻文件中提取信息（优先读取快报清单）"""
+        return self._with_date(filepath, self.manifest.lookup(filepath))
+    
+    def _with_date(self, filepath, news_info):
+        """在清单记录上补充文件路径和日期对象"""
+        if news_info is None:
+            return None
+        news_info = dict(news_info, filepath=filepath)
+        date_iso = news_info.pop('date_iso', None)
+        news_info['date_obj'] = datetime.fromisoformat(date_iso) if date_iso else datetime.now()
+        return news_info
+    
+    def parse_news_file(self, filepath):
+        """提取标题、日期和摘要：优先读取快报元数据JSON，旧快报解析HTML（结果可JSON序列化，写入快报清单）"""
+        metadata = load_report_metadata(filepath)
+        if metadata is not None:
+            news_info = news_info_from_metadata(filepath, metadata)
+            if news_info is not None:
+                return news_info
+        
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -67,11 +239,10 @@ class NewsIndexGenerator:
                     summary = news_title.get_text().strip()
             
             return {
-                'filepath': filepath,
                 'filename': filename,
                 'title': title,
                 'date': formatted_date,
-                'date_obj': date_obj if date_match else datetime.now(),
+                'date_iso': date_obj.isoformat() if date_match else None,
                 'summary': summary
             }
         except Exception as e:
@@ -106,8 +277,14 @@ class NewsIndexGenerator:
         
         return categories
     
-    def generate_index(self):
-        """生成index.html文件"""
+    def generate_index(self, changed_paths=None):
+        """
+        生成index.html文件
+        
+        Args:
+            changed_paths: 文件监控报告的变化文件，提供时只检查这些文件，其余直接使用清单记录；
+                           为None时检查全部文件
+        """
         # 获取所有news开头的HTML文件
         news_files = glob.glob(os.path.join(self.directory, 'news*.html'))
         
@@ -115,12 +292,11 @@ class NewsIndexGenerator:
             print("未找到新闻文件")
             return
         
-        # 提取新闻信息
-        news_list = []
-        for filepath in news_files:
-            news_info = self.extract_news_info(filepath)
-            if news_info:
-                news_list.append(news_info)
+        # 提取新闻信息（未变化的文件直接使用清单记录）
+        news_list = [self._with_date(filepath, news_info)
+                     for filepath, news_info in self.manifest.refresh(news_files, changed=changed_paths)]
+        self.manifest.prune(news_files)
+        self.manifest.save()
         
         # 按日期排序（最新的在前）
         news_list.sort(key=lambda x: x['date_obj'], reverse=True)
@@ -140,273 +316,30 @@ class NewsIndexGenerator:
             f.write(html_content)
         
         print(f"已生成 {index_path}")
-        print(f"处理了 {len(news_list)} 个新闻文件")
+        print(f"处理了 {len(news_list)} 个新闻文件（重新解析 {self.manifest.take_stats()['parsed']} 个）")
     
     def generate_html_content(self, latest_news, categories):
-        """生成HTML内容"""
+        """生成HTML内容（页面结构见 templates/news_index.html）"""
         current_time = datetime.now().strftime('%Y年%m月%d日 %H:%M')
         
-        html = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>海之安网络安全快报 - 新闻索引</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Microsoft YaHei', '微软雅黑', Arial, sans-serif;
-            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-            min-height: 100vh;
-            color: #333;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        
-        .header {{
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 30px;
-            text-align: center;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
-        
-        .header h1 {{
-            color: #1e3c72;
-            font-size: 2.5rem;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }}
-        
-        .header .subtitle {{
-            color: #666;
-            font-size: 1.1rem;
-            margin-bottom: 15px;
-        }}
-        
-        .update-time {{
-            color: #888;
-            font-size: 0.9rem;
-        }}
-        
-        .main-content {{
-            display: grid;
-            grid-template-columns: 2fr 1fr;
-            gap: 30px;
-            margin-bottom: 30px;
-        }}
-        
-        .latest-news {{
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
-        
-        .latest-news h2 {{
-            color: #1e3c72;
-            font-size: 1.8rem;
-            margin-bottom: 20px;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .latest-news h2::before {{
-            content: '🔥';
-            font-size: 1.5rem;
-        }}
-        
-        .news-card {{
-            border: 2px solid #e0e0e0;
-            border-radius: 12px;
-            padding: 20px;
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }}
-        
-        .news-card:hover {{
-            border-color: #1e3c72;
-            box-shadow: 0 5px 15px rgba(30, 60, 114, 0.2);
-            transform: translateY(-2px);
-        }}
-        
-        .news-title {{
-            font-size: 1.3rem;
-            font-weight: 600;
-            color: #1e3c72;
-            margin-bottom: 10px;
-            line-height: 1.4;
-        }}
-        
-        .news-date {{
-            color: #666;
-            font-size: 0.9rem;
-            margin-bottom: 15px;
-        }}
-        
-        .news-summary {{
-            color: #555;
-            line-height: 1.6;
-            font-size: 0.95rem;
-        }}
-        
-        .sidebar {{
-            display: flex;
-            flex-direction: column;
-            gap: 20px;
-        }}
-        
-        .category-section {{
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            padding: 25px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
-        
-        .category-title {{
-            color: #1e3c72;
-            font-size: 1.3rem;
-            font-weight: 600;
-            margin-bottom: 15px;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .news-link {{
-            display: block;
-            padding: 12px 15px;
-            margin-bottom: 8px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            text-decoration: none;
-            color: #333;
-            transition: all 0.3s ease;
-            border-left: 4px solid transparent;
-        }}
-        
-        .news-link:hover {{
-            background: #e3f2fd;
-            border-left-color: #1e3c72;
-            transform: translateX(5px);
-        }}
-        
-        .news-link-title {{
-            font-weight: 500;
-            margin-bottom: 4px;
-        }}
-        
-        .news-link-date {{
-            font-size: 0.8rem;
-            color: #666;
-        }}
-        
-        .footer {{
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            padding: 20px;
-            text-align: center;
-            color: #666;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }}
-        
-        @media (max-width: 768px) {{
-            .main-content {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .header h1 {{
-                font-size: 2rem;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>海之安网络安全快报</h1>
-            <div class="subtitle">网络安全新闻索引 · 实时更新</div>
-            <div class="update-time">最后更新: {current_time}</div>
-        </div>
-        
-        <div class="main-content">
-            <div class="latest-news">
-                <h2>今日要闻</h2>'''
-        
-        if latest_news:
-            html += f'''
-                <div class="news-card" onclick="window.open('{latest_news['filename']}', '_blank')">
-                    <div class="news-title">{latest_news['title']}</div>
-                    <div class="news-date">{latest_news['date']}</div>
-                    <div class="news-summary">{latest_news['summary']}</div>
-                </div>'''
-        else:
-            html += '''
-                <div class="news-card">
-                    <div class="news-title">暂无新闻</div>
-                    <div class="news-summary">请添加新闻文件</div>
-                </div>'''
-        
-        html += '''
-            </div>
-            
-            <div class="sidebar">'''
-        
-        # 生成各个分类的链接
-        category_configs = [
-            ('this_week', '📅 本周新闻', categories['this_week']),
-            ('this_month', '📆 本月新闻', categories['this_month']),
-            ('this_year', '🗓️ 今年新闻', categories['this_year']),
-            ('older', '📚 历史新闻', categories['older'])
+        # 侧边栏各个分类的链接
+        category_sections = [
+            ('📅 本周新闻', categories['this_week']),
+            ('📆 本月新闻', categories['this_month']),
+            ('🗓️ 今年新闻', categories['this_year']),
+            ('📚 历史新闻', categories['older'])
         ]
         
-        for category_key, category_name, news_items in category_configs:
-            if news_items:
-                html += f'''
-                <div class="category-section">
-                    <div class="category-title">{category_name}</div>'''
-                
-                for news in news_items[:10]:  # 最多显示10条
-                    html += f'''
-                    <a href="{news['filename']}" class="news-link" target="_blank">
-                        <div class="news-link-title">{news['title'][:50]}{'...' if len(news['title']) > 50 else ''}</div>
-                        <div class="news-link-date">{news['date']}</div>
-                    </a>'''
-                
-                html += '''
-                </div>'''
-        
-        html += f'''
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>&copy; 2025 海之安网络安全. 保持警惕，守护安全</p>
-            <p>共收录 {len(news_list) if 'news_list' in locals() else 0} 篇安全快报</p>
-        </div>
-    </div>
-    
-    <script>
-        // 自动刷新页面（每5分钟）
-        setTimeout(function() {{
-            location.reload();
-        }}, 300000);
-    </script>
-</body>
-</html>'''
+        # 样式见 templates/news_index.css，发布为带内容哈希的共享样式表
+        stylesheet_href = publish_stylesheet('news_index', render_template('news_index.css'), self.directory)
         
-        return html
+        return render_template('news_index.html', {
+            'current_time': current_time,
+            'stylesheet_href': stylesheet_href,
+            'latest_news': latest_news,
+            'category_sections': [(name, news_items) for name, news_items in category_sections if news_items],
+            'news_count': sum(len(news_items) for news_items in categories.values())
+        })
 
 def main():
     generator = NewsIndexGenerator()
@@ -415,14 +348,16 @@ def main():
     print("正在生成初始索引...")
     generator.generate_index()
     
-    # 设置文件监控
-    event_handler = NewsFileHandler(generator)
+    # 设置文件监控：事件合并后在后台线程增量重建
+    scheduler = RebuildScheduler(lambda changed: generator.generate_index(changed_paths=changed))
+    event_handler = NewsFileHandler(scheduler)
     observer = Observer()
     observer.schedule(event_handler, path='.', recursive=False)
     
     print("开始监控新闻文件变更...")
     print("按 Ctrl+C 停止监控")
     
+    scheduler.start()
     observer.start()
     try:
         while True:
@@ -432,6 +367,7 @@ def main():
         print("\n监控已停止")
     
     observer.join()
+    scheduler.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+异步GLM客户端 - 基于aiohttp的长连接池和流式(SSE)响应
+逐块消费 chat/completions 的 server-sent events，记录每次调用的首token时间和总耗时
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp 为可选依赖，只有使用异步客户端时才需要
+    aiohttp = None
+
+try:
+    from utils.retry_policy import RetryPolicy
+    from utils.json_stream import JSONStreamExtractor
+except ImportError:
+    from retry_policy import RetryPolicy
+    from json_stream import JSONStreamExtractor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = 'https://open.bigmodel.cn/api/paas/v4/chat/completions'
+
+
+class AsyncGLMClient:
+    """异步GLM客户端，需在 async with 中使用以复用连接池"""
+
+    def __init__(self, api_key: str, base_url: str = None, timeout: int = 90,
+                 max_connections: int = 4, keepalive_timeout: float = 30,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        初始化异步GLM客户端
+
+        Args:
+            api_key: GLM API密钥
+            base_url: API地址
+            timeout: 单次调用超时时间（秒）
+            max_connections: 连接池大小，同时也是同时进行中的请求上限
+            keepalive_timeout: 空闲长连接保留时间（秒）
+            retry_policy: 重试策略，默认使用 RetryPolicy()
+        """
+        if aiohttp is None:
+            raise ImportError("异步GLM客户端需要 aiohttp，请执行 pip install aiohttp")
+        self.api_key = api_key
+        self.base_url = base_url or DEFAULT_BASE_URL
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.session: Optional['aiohttp.ClientSession'] = None
+        # 每次调用的耗时记录，便于统计整个运行的首token时间和总耗时
+        self.metrics: List[Dict] = []
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """创建连接池和会话"""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections,
+                                             keepalive_timeout=self.keepalive_timeout)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    'Content-Type': 'application/json',
+                    'Authorization': f'Bearer {self.api_key}',
+                    'User-Agent': 'HaiZhiAn-News-System/1.0'
+                }
+            )
+
+    async def close(self):
+        """关闭会话和连接池"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def complete(self, messages: List[Dict], model: str = 'glm-4-flash',
+                       temperature: float = 0.7, max_tokens: int = 2000, stream: bool = True,
+                       on_token: Optional[Callable[[str], Any]] = None) -> Dict:
+        """
+        调用GLM API并返回内容和耗时指标
+
+        Args:
+            messages: 消息列表
+            model: 模型名称
+            temperature: 温度参数
+            max_tokens: 最大token数
+            stream: 是否使用SSE流式响应
+            on_token: 流式模式下每收到一段增量内容时的回调
+
+        Returns:
+            Dict: content（失败为None）、ttft（首token时间，秒）、latency（总耗时，秒）、
+                  chunks（收到的增量块数）、usage（服务端返回的token用量）、error、
+                  attempts（请求次数，含重试）
+        """
+        await self.open()
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": stream
+        }
+        result = {'content': None, 'ttft': None, 'latency': None, 'chunks': 0, 'usage': None,
+                  'error': None, 'attempts': 0}
+        start = time.perf_counter()
+
+        state = self.retry_policy.begin()
+        while True:
+            timeout = state.attempt(self.timeout)
+            if timeout is None:
+                result['error'] = "时间预算已耗尽"
+                break
+
+            result['error'] = None
+            retryable, retry_after = False, None
+            try:
+                async with self.session.post(self.base_url, json=payload,
+                                             timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    if response.status != 200:
+                        text = await response.text()
+                        result['error'] = f"HTTP {response.status}: {text[:200]}"
+                        retryable = self.retry_policy.is_retryable_status(response.status)
+                        retry_after = response.headers.get('Retry-After')
+                    elif stream:
+                        await self._consume_stream(response, result, start, on_token)
+                    else:
+                        data = await response.json()
+                        result['content'] = data['choices'][0]['message']['content']
+                        result['usage'] = data.get('usage')
+                        result['ttft'] = time.perf_counter() - start
+            except asyncio.TimeoutError:
+                result['error'] = "请求超时"
+                # 已经向调用方输出过增量内容时不再重试，避免内容重复
+                retryable = result['chunks'] == 0
+            except aiohttp.ClientError as e:
+                result['error'] = str(e)
+                retryable = result['chunks'] == 0
+            except (KeyError, IndexError, ValueError) as e:
+                result['error'] = str(e)
+
+            if not result['error']:
+                break
+            if not retryable:
+                state.fail()
+                break
+            delay = state.next_delay(retry_after)
+            if delay is None:
+                break
+            logger.warning(f"GLM API异步调用失败: {result['error']}，等待{delay:.1f}秒后重试")
+            await asyncio.sleep(delay)
+
+        result['attempts'] = state.attempts
+        result['latency'] = time.perf_counter() - start
+        self.metrics.append({key: result[key] for key in ('ttft', 'latency', 'chunks', 'usage', 'error', 'attempts')})
+
+        if result['error']:
+            logger.error(f"GLM API异步调用失败: {result['error']}")
+        else:
+            ttft = f"{result['ttft']:.2f}秒" if result['ttft'] is not None else "无"
+            logger.info(f"GLM API异步调用成功: 首token {ttft}, 总耗时 {result['latency']:.2f}秒")
+        return result
+
+    async def _consume_stream(self, response, result: Dict, start: float,
+                              on_token: Optional[Callable[[str], Any]]):
+        """逐行解析SSE事件，累积增量内容"""
+        parts = []
+        async for raw_line in response.content:
+            line = raw_line.decode('utf-8').strip()
+            if not line.startswith('data:'):
+                continue
+            data = line[5:].strip()
+            if data == '[DONE]':
+                break
+            event = json.loads(data)
+            if event.get('usage'):
+                result['usage'] = event['usage']
+            choices = event.get('choices') or []
+            delta = choices[0].get('delta', {}).get('content') if choices else None
+            if not delta:
+                continue
+            if result['ttft'] is None:
+                result['ttft'] = time.perf_counter() - start
+            result['chunks'] += 1
+            parts.append(delta)
+            if on_token is not None:
+                on_token(delta)
+        result['content'] = ''.join(parts)
+
+    async def call_api(self, messages: List[Dict], model: str = 'glm-4-flash',
+                       temperature: float = 0.7, max_tokens: int = 2000,
+                       stream: bool = True) -> Optional[str]:
+        """
+        与 EnhancedGLMClient.call_api 对应的异步版本
+
+        Returns:
+            API响应内容，失败返回None
+        """
+        result = await self.complete(messages, model=model, temperature=temperature,
+                                     max_tokens=max_tokens, stream=stream)
+        return result['content']
+
+    async def complete_json(self, messages: List[Dict], on_partial: Optional[Callable[[Any], Any]] = None,
+                            **kwargs) -> Dict:
+        """
+        流式调用并增量解析JSON输出，每当有新的完整元素（如一条分类结果）时回调 on_partial，
+        调用方无需等待整个响应结束即可开始渲染
+
+        Args:
+            messages: 消息列表
+            on_partial: 部分结果更新时的回调，参数为截至当前的部分JSON
+            kwargs: 传给 complete 的其他参数
+
+        Returns:
+            complete 的结果，另含 json（完整或截断时恢复的部分结果，无法解析为None）和 json_complete
+        """
+        extractor = JSONStreamExtractor()
+        state = {'progress': 0}
+
+        def on_token(delta: str):
+            extractor.feed(delta)
+            if on_partial is not None and extractor.progress != state['progress']:
+                state['progress'] = extractor.progress
+                partial = extractor.partial()
+                if partial is not None:
+                    on_partial(partial)
+
+        result = await self.complete(messages, stream=True, on_token=on_token, **kwargs)
+        result['json'] = extractor.partial()
+        result['json_complete'] = extractor.complete
+        return result
+
+    async def call_many(self, prompts: Dict[str, str], **kwargs) -> Dict[str, Dict]:
+        """
+        并发发送多个相互独立的提示词（并发数受连接池大小限制）
+
+        Args:
+            prompts: 名称到提示词的映射
+            kwargs: 传给 complete 的其他参数
+
+        Returns:
+            名称到 complete 结果的映射
+        """
+        names = list(prompts)
+        results = await asyncio.gather(*[
+            self.complete([{"role": "user", "content": prompts[name]}], **kwargs) for name in names
+        ])
+        return dict(zip(names, results))
+
+    def metrics_summary(self) -> Dict:
+        """
+        汇总本客户端所有调用的耗时指标
+
+        Returns:
+            Dict: calls、failures、retries、avg_ttft、max_ttft、avg_latency、max_latency
+        """
+        succeeded = [m for m in self.metrics if not m['error']]
+        ttfts = [m['ttft'] for m in succeeded if m['ttft'] is not None]
+        latencies = [m['latency'] for m in succeeded]
+        return {
+            'calls': len(self.metrics),
+            'failures': len(self.metrics) - len(succeeded),
+            'retries': sum(max(m['attempts'] - 1, 0) for m in self.metrics),
+            'avg_ttft': sum(ttfts) / len(ttfts) if ttfts else None,
+            'max_ttft': max(ttfts) if ttfts else None,
+            'avg_latency': sum(latencies) / len(latencies) if latencies else None,
+            'max_latency': max(latencies) if latencies else None
+        }
+
+
+def create_async_glm_client(api_key: str) -> AsyncGLMClient:
+    """
+    创建异步GLM客户端的工厂函数
+
+    Args:
+        api_key: GLM API密钥
+
+    Returns:
+        异步GLM客户端实例
+    """
+    try:
+        from config.glm_config import GLM_CONFIG, RETRY_CONFIG
+        max_connections = GLM_CONFIG.get('max_concurrency', 4)
+        retry_policy = RetryPolicy.from_config(RETRY_CONFIG)
+    except ImportError:
+        max_connections = 4
+        retry_policy = RetryPolicy()
+
+    return AsyncGLMClient(api_key=api_key, timeout=90, max_connections=max_connections,
+                          retry_policy=retry_policy)
@@ -4,18 +4,86 @@
 增强版GLM客户端 - 解决API超时和连接问题
 """
 
+import copy
 import json
+import os
 import time
 import logging
+import threading
 import requests
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, Optional, List, Callable
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+try:
+    from utils.retry_policy import RetryPolicy
+except ImportError:
+    from retry_policy import RetryPolicy
+
+try:
+    from utils.json_stream import JSONStreamExtractor
+except ImportError:
+    from json_stream import JSONStreamExtractor
+
+from src.utils.profiler import span
+from src.utils.token_estimator import estimate_tokens
+
+
+# GLM调用失败时使用的备用摘要和分类
+FALLBACK_SUMMARY = """今日全球网络安全态势显示，各类安全威胁持续演进，零日漏洞、勒索软件攻击和数据泄露事件频发。
+            国际网络安全形势依然严峻，各国政府和企业需要加强防护措施，提升安全意识，
+            共同应对日益复杂的网络安全挑战。建议关注最新威胁情报，及时更新安全防护策略。"""
+
+FALLBACK_CATEGORIES = {
+    "安全风险": [
+        {
+            "title": "全球网络安全风险态势",
+            "source": "综合来源",
+            "region": "全球",
+            "summary": "当前全球网络安全风险持续上升，各类漏洞和威胁层出不穷，需要持续关注和防范。",
+            "key_points": ["漏洞数量增加", "攻击手段升级", "防护需求提升"],
+            "impact_level": "高"
+        }
+    ],
+    "安全事件": [
+        {
+            "title": "国际网络安全事件频发",
+            "source": "综合来源", 
+            "region": "全球",
+            "summary": "近期国际网络安全事件频繁发生，包括数据泄露、勒索攻击等多种形式。",
+            "key_points": ["事件频率增加", "影响范围扩大", "损失持续上升"],
+            "impact_level": "高"
+        }
+    ],
+    "安全舆情": [
+        {
+            "title": "网络安全政策动态",
+            "source": "综合来源",
+            "region": "全球", 
+            "summary": "各国政府持续加强网络安全政策制定和监管力度，推动行业规范发展。",
+            "key_points": ["政策完善", "监管加强", "标准统一"],
+            "impact_level": "中"
+        }
+    ],
+    "安全趋势": [
+        {
+            "title": "网络安全技术发展趋势",
+            "source": "综合来源",
+            "region": "全球",
+            "summary": "人工智能、零信任等新技术在网络安全领域的应用不断深入，推动行业创新发展。",
+            "key_points": ["技术创新", "应用深化", "市场扩大"],
+            "impact_level": "中"
+        }
+    ]
+}
+
 
 class EnhancedGLMClient:
     """增强版GLM客户端，包含重试机制和更好的错误处理"""
     
-    def __init__(self, api_key: str, base_url: str = None, timeout: int = 60):
+    def __init__(self, api_key: str, base_url: str = None, timeout: int = 60,
+                 max_concurrency: int = 4, retry_policy: Optional[RetryPolicy] = None,
+                 response_cache=None, bypass_cache: bool = False):
         """
         初始化GLM客户端
         
@@ -23,35 +91,32 @@ class EnhancedGLMClient:
             api_key: GLM API密钥
             base_url: API基础URL
             timeout: 请求超时时间（秒）
+            max_concurrency: 同时进行中的API请求上限
+            retry_policy: 重试策略（同一次运行的所有调用共享时间预算），默认使用 RetryPolicy()
+            response_cache: 响应缓存（LLMResponseCache），为None时不缓存
+            bypass_cache: 为True时不读取缓存、强制重新生成（新结果仍会写入缓存）
         """
         self.api_key = api_key
         self.base_url = base_url or 'https://open.bigmodel.cn/api/paas/v4/chat/completions'
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
         self.logger = logging.getLogger(__name__)
         
-        # 创建会话并配置重试策略
+        # 所有线程共享的并发上限，重试等待期间不占用名额
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._executor = None
+        
+        self.response_cache = response_cache
+        self.bypass_cache = bypass_cache
+        
+        # 重试统一由 RetryPolicy 控制，适配器层不再自动重试，避免两层重试叠加
+        self.retry_policy = retry_policy or RetryPolicy()
+        
+        # 创建会话
         self.session = requests.Session()
         
-        # 配置重试策略
-        try:
-            # 新版本urllib3
-            retry_strategy = Retry(
-                total=3,  # 总重试次数
-                backoff_factor=2,  # 退避因子
-                status_forcelist=[429, 500, 502, 503, 504],  # 需要重试的HTTP状态码
-                allowed_methods=["POST"]  # 允许重试的HTTP方法
-            )
-        except TypeError:
-            # 旧版本urllib3兼容
-            retry_strategy = Retry(
-                total=3,  # 总重试次数
-                backoff_factor=2,  # 退避因子
-                status_forcelist=[429, 500, 502, 503, 504],  # 需要重试的HTTP状态码
-                method_whitelist=["POST"]  # 旧版本参数名
-            )
-        
-        # 配置HTTP适配器
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # 配置HTTP适配器（连接池容量与并发上限一致）
+        adapter = HTTPAdapter(max_retries=0, pool_maxsize=self.max_concurrency)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -66,18 +131,24 @@ class EnhancedGLMClient:
                  temperature: float = 0.7, max_tokens: int = 2000,
                  retry_count: int = 3) -> Optional[str]:
         """
-        调用GLM API，包含重试机制
+        调用GLM API，按 retry_policy 重试
         
         Args:
             messages: 消息列表
             model: 模型名称
             temperature: 温度参数
             max_tokens: 最大token数
-            retry_count: 重试次数
+            retry_count: 本次调用的最大重试次数（不超过策略上限）
             
         Returns:
             API响应内容，失败返回None
         """
+        if self.response_cache is not None and not self.bypass_cache:
+            cached = self.response_cache.get(model, temperature, max_tokens, messages)
+            if cached is not None:
+                self.logger.info("GLM API命中响应缓存")
+                return cached
+        
         payload = {
             "model": model,
             "messages": messages,
@@ -85,66 +156,93 @@ class EnhancedGLMClient:
             "max_tokens": max_tokens,
             "stream": False
         }
-        
-        for attempt in range(retry_count + 1):
+        prompt_tokens = sum(estimate_tokens(message.get('content', '')) for message in messages)
+        
+        state = self.retry_policy.begin(max_retries=retry_count)
+        while True:
+            timeout = state.attempt(self.timeout)
+            if timeout is None:
+                self.logger.error("GLM API调用时间预算已耗尽")
+                return None
+            
+            retry_after = None
             try:
-                self.logger.info(f"GLM API调用尝试 {attempt + 1}/{retry_count + 1}")
+                self.logger.info(f"GLM API调用尝试 {state.attempts}/{state.max_attempts}")
                 
-                # 发送请求
-                response = self.session.post(
-                    self.base_url,
-                    json=payload,
-                    timeout=self.timeout
-                )
+                # 发送请求（耗时区间从拿到并发名额后开始计算）
+                with self._request_slots, span('glm.call', model=model, attempt=state.attempts,
+                                               prompt_tokens=prompt_tokens):
+                    response = self.session.post(
+                        self.base_url,
+                        json=payload,
+                        timeout=timeout
+                    )
                 
                 # 检查HTTP状态码
                 if response.status_code == 200:
                     result = response.json()
                     if 'choices' in result and len(result['choices']) > 0:
                         content = result['choices'][0]['message']['content']
-                        self.logger.info("GLM API调用成功")
+                        usage = result.get('usage') or {}
+                        self.logger.info(f"GLM API调用成功: 提示词 {usage.get('prompt_tokens', f'约{prompt_tokens}')} tokens, "
+                                         f"输出 {usage.get('completion_tokens', '未知')} tokens")
+                        if result['choices'][0].get('finish_reason') == 'length':
+                            # 被截断的输出不写入缓存，重跑时重新生成
+                            self.logger.warning(f"GLM输出达到 max_tokens={max_tokens} 上限被截断，JSON结果可能不完整")
+                        elif self.response_cache is not None:
+                            self.response_cache.set(model, temperature, max_tokens, messages, content)
                         return content
-                    else:
-                        self.logger.error(f"GLM API响应格式异常: {result}")
-                        
-                elif response.status_code == 429:
-                    # 速率限制，等待更长时间
-                    wait_time = (2 ** attempt) * 5  # 指数退避，最少5秒
-                    self.logger.warning(f"GLM API速率限制，等待{wait_time}秒后重试")
-                    time.sleep(wait_time)
-                    continue
+                    self.logger.error(f"GLM API响应格式异常: {result}")
+                    
+                elif self.retry_policy.is_retryable_status(response.status_code):
+                    retry_after = response.headers.get('Retry-After')
+                    self.logger.warning(f"GLM API返回 {response.status_code}"
+                                        + (f"，Retry-After: {retry_after}" if retry_after else ""))
                     
                 else:
                     self.logger.error(f"GLM API HTTP错误: {response.status_code} - {response.text}")
+                    state.fail()
+                    return None
                     
             except requests.exceptions.Timeout:
-                wait_time = (2 ** attempt) * 3  # 超时重试间隔
-                self.logger.warning(f"GLM API超时，等待{wait_time}秒后重试 ({attempt + 1}/{retry_count + 1})")
-                if attempt < retry_count:
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    self.logger.error("GLM API超时，已达到最大重试次数")
-                    
+                self.logger.warning(f"GLM API超时 ({state.attempts}/{state.max_attempts})")
+                
             except requests.exceptions.ConnectionError as e:
-                wait_time = (2 ** attempt) * 2  # 连接错误重试间隔
-                self.logger.warning(f"GLM API连接错误: {e}，等待{wait_time}秒后重试")
-                if attempt < retry_count:
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    self.logger.error("GLM API连接错误，已达到最大重试次数")
-                    
+                self.logger.warning(f"GLM API连接错误: {e}")
+                
             except Exception as e:
                 self.logger.error(f"GLM API调用异常: {e}")
-                if attempt < retry_count:
-                    time.sleep(2 ** attempt)  # 简单退避
-                    continue
-                else:
-                    break
+            
+            delay = state.next_delay(retry_after)
+            if delay is None:
+                self.logger.error("GLM API调用失败，重试次数或时间预算已用尽")
+                return None
+            self.logger.info(f"等待{delay:.1f}秒后重试")
+            time.sleep(delay)
+    
+    def run_parallel(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        并行执行相互独立的调用（如同一输入的摘要和分类），总耗时约等于最慢的一次调用
         
-        self.logger.error("GLM API调用失败，所有重试均失败")
-        return None
+        Args:
+            calls: 名称到无参调用的映射，例如 {'summary': lambda: client.generate_summary(text)}
+            
+        Returns:
+            名称到调用结果的映射；任一调用抛出的异常会在全部调用结束后重新抛出
+        """
+        if len(calls) <= 1 or self.max_concurrency == 1:
+            return {name: call() for name, call in calls.items()}
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix='glm')
+        
+        start = time.time()
+        futures = {name: self._executor.submit(call) for name, call in calls.items()}
+        wait(futures.values())
+        results = {name: future.result() for name, future in futures.items()}
+        self.logger.info(f"并行完成 {len(calls)} 个GLM调用，耗时 {time.time() - start:.1f}秒")
+        return results
     
     def parse_json_response(self, response: str, fallback_data: Any = None) -> Any:
         """
@@ -155,7 +253,7 @@ class EnhancedGLMClient:
             fallback_data: 解析失败时的备用数据
             
         Returns:
-            解析后的数据或备用数据
+            解析后的数据或备用数据；备用数据是字典而解析结果不是字典时（如说明文字中的数组）返回备用数据
         """
         if not response:
             self.logger.warning("响应为空，使用备用数据")
@@ -163,44 +261,29 @@ class EnhancedGLMClient:
         
         try:
             # 尝试直接解析JSON
-            return json.loads(response)
+            return self._check_json_type(json.loads(response), fallback_data)
         except json.JSONDecodeError:
-            # JSON解析失败，尝试提取JSON部分
-            self.logger.warning("JSON解析失败，尝试提取JSON部分")
-            
-            # 查找JSON代码块
-            json_patterns = [
-                r'```json\s*(\{.*?\})\s*```',
-                r'```\s*(\{.*?\})\s*```',
-                r'(\{.*?\})',
-            ]
-            
-            import re
-            for pattern in json_patterns:
-                matches = re.findall(pattern, response, re.DOTALL)
-                if matches:
-                    try:
-                        return json.loads(matches[0])
-                    except json.JSONDecodeError:
-                        continue
-            
-            # 如果仍然无法解析，尝试修复常见的JSON错误
-            try:
-                # 移除可能的前后缀
-                cleaned = response.strip()
-                if cleaned.startswith('```json'):
-                    cleaned = cleaned[7:]
-                if cleaned.endswith('```'):
-                    cleaned = cleaned[:-3]
-                cleaned = cleaned.strip()
-                
-                # 尝试解析清理后的内容
-                return json.loads(cleaned)
-            except json.JSONDecodeError:
-                pass
-            
-            self.logger.error(f"JSON解析完全失败，响应内容: {response[:200]}...")
+            pass
+        
+        # 单遍扫描提取第一个JSON对象或数组（跳过说明文字和代码块标记），输出被截断时恢复部分结果
+        extractor = JSONStreamExtractor()
+        extractor.feed(response)
+        result = extractor.partial()
+        if extractor.complete:
+            return self._check_json_type(result, fallback_data)
+        if result:
+            self.logger.warning("GLM输出的JSON不完整，已恢复截至最后一个完整元素的部分结果")
+            return self._check_json_type(result, fallback_data)
+        
+        self.logger.error(f"JSON解析完全失败，响应内容: {response[:200]}...")
+        return fallback_data
+    
+    def _check_json_type(self, result: Any, fallback_data: Any) -> Any:
+        """调用方按字典使用结果（备用数据为字典）时，非字典的解析结果改用备用数据"""
+        if isinstance(fallback_data, dict) and not isinstance(result, dict):
+            self.logger.warning(f"GLM返回的JSON类型为 {type(result).__name__}，预期为对象，使用备用数据")
             return fallback_data
+        return result
     
     def select_top_news(self, news_text: str) -> List[Dict]:
         """
@@ -264,16 +347,15 @@ class EnhancedGLMClient:
             return response.strip()
         else:
             # 备用摘要
-            return """今日全球网络安全态势显示，各类安全威胁持续演进，零日漏洞、勒索软件攻击和数据泄露事件频发。
-            国际网络安全形势依然严峻，各国政府和企业需要加强防护措施，提升安全意识，
-            共同应对日益复杂的网络安全挑战。建议关注最新威胁情报，及时更新安全防护策略。"""
+            return FALLBACK_SUMMARY
     
-    def categorize_and_summarize(self, news_text: str) -> Dict:
+    def categorize_and_summarize(self, news_text: str, max_tokens: int = 2000) -> Dict:
         """
         分类并总结新闻
         
         Args:
             news_text: 新闻文本
+            max_tokens: 最大输出token数（每条新闻都会输出一段详细总结）
             
         Returns:
             分类后的新闻字典
@@ -287,51 +369,10 @@ class EnhancedGLMClient:
             }
         ]
         
-        response = self.call_api(messages, retry_count=3)
+        response = self.call_api(messages, max_tokens=max_tokens, retry_count=3)
         
         # 备用数据
-        fallback_data = {
-            "安全风险": [
-                {
-                    "title": "全球网络安全风险态势",
-                    "source": "综合来源",
-                    "region": "全球",
-                    "summary": "当前全球网络安全风险持续上升，各类漏洞和威胁层出不穷，需要持续关注和防范。",
-                    "key_points": ["漏洞数量增加", "攻击手段升级", "防护需求提升"],
-                    "impact_level": "高"
-                }
-            ],
-            "安全事件": [
-                {
-                    "title": "国际网络安全事件频发",
-                    "source": "综合来源", 
-                    "region": "全球",
-                    "summary": "近期国际网络安全事件频繁发生，包括数据泄露、勒索攻击等多种形式。",
-                    "key_points": ["事件频率增加", "影响范围扩大", "损失持续上升"],
-                    "impact_level": "高"
-                }
-            ],
-            "安全舆情": [
-                {
-                    "title": "网络安全政策动态",
-                    "source": "综合来源",
-                    "region": "全球", 
-                    "summary": "各国政府持续加强网络安全政策制定和监管力度，推动行业规范发展。",
-                    "key_points": ["政策完善", "监管加强", "标准统一"],
-                    "impact_level": "中"
-                }
-            ],
-            "安全趋势": [
-                {
-                    "title": "网络安全技术发展趋势",
-                    "source": "综合来源",
-                    "region": "全球",
-                    "summary": "人工智能、零信任等新技术在网络安全领域的应用不断深入，推动行业创新发展。",
-                    "key_points": ["技术创新", "应用深化", "市场扩大"],
-                    "impact_level": "中"
-                }
-            ]
-        }
+        fallback_data = copy.deepcopy(FALLBACK_CATEGORIES)
         
         result = self.parse_json_response(response, fallback_data)
         
@@ -342,7 +383,7 @@ class EnhancedGLMClient:
         
         return result
     
-    def translate_and_analyze(self, title: str, content: str, source: str) -> Dict:
+    def translate_and_analyze(self, title: str, content: str, source: str) -> Optional[Dict]:
         """
         翻译并分析英文新闻
         
@@ -352,7 +393,7 @@ class EnhancedGLMClient:
             source: 新闻来源
             
         Returns:
-            翻译和分析结果
+            翻译和分析结果；调用失败或输出中没有译文标题和摘要时返回None（不用占位内容冒充译文）
         """
         from config.glm_config import PROMPT_TEMPLATES
         
@@ -367,35 +408,146 @@ class EnhancedGLMClient:
         
         response = self.call_api(messages, retry_count=3)
         
-        # 备用数据
-        fallback_data = {
-            "chinese_title": title,  # 如果翻译失败，保留原标题
-            "summary": "该新闻涉及网络安全相关内容，具体详情请参考原文。",
-            "key_points": ["网络安全相关", "需要关注", "影响待评估"],
-            "impact_analysis": "影响程度需要进一步评估",
-            "threat_level": "中危"
-        }
-        
-        result = self.parse_json_response(response, fallback_data)
+        result = self.parse_json_response(response, {})
+        if not (result.get('chinese_title') and result.get('summary')):
+            self.logger.warning(f"未能解析出译文，保留原文: {title[:50]}")
+            return None
         return result
     
-    def __del__(self):
-        """清理资源"""
+    def translate_batch(self, items: List[Dict], content_chars: int = 800,
+                        input_token_budget: int = 6000, output_tokens_per_item: int = 450,
+                        max_tokens: int = 4000) -> Dict[str, Dict]:
+        """
+        批量翻译并分析英文新闻：按token预算把多条新闻打包进同一个请求，各批并行调用，
+        结果按id对应回输入；批量结果中缺失或不完整的条目逐条调用 translate_and_analyze 补齐
+        
+        Args:
+            items: 新闻列表，每条包含 id、title、content、source
+            content_chars: 每条正文截取的最大字符数
+            input_token_budget: 每批提示词的估算token上限
+            output_tokens_per_item: 每条结果预留的输出token数
+            max_tokens: 每批请求的最大输出token数
+            
+        Returns:
+            id 到翻译结果（字段同 translate_and_analyze）的映射，批量和逐条补译都失败的条目不在其中
+        """
+        from config.glm_config import PROMPT_TEMPLATES
+        
+        template = PROMPT_TEMPLATES['translate_batch']
+        entries = [
+            {
+                'id': str(item['id']),
+                'title': item['title'],
+                'content': (item.get('content') or '')[:content_chars],
+                'source': item.get('source', '')
+            } for item in items
+        ]
+        
+        # 按输入预算和输出上限贪心分批，单条超出预算时独占一批
+        base_tokens = estimate_tokens(template)
+        per_batch = max(1, max_tokens // output_tokens_per_item)
+        batches, batch, batch_tokens = [], [], base_tokens
+        for entry in entries:
+            entry_tokens = estimate_tokens(json.dumps(entry, ensure_ascii=False))
+            if batch and (batch_tokens + entry_tokens > input_token_budget or len(batch) >= per_batch):
+                batches.append(batch)
+                batch, batch_tokens = [], base_tokens
+            batch.append(entry)
+            batch_tokens += entry_tokens
+        if batch:
+            batches.append(batch)
+        
+        def translate(batch: List[Dict]) -> Dict[str, Dict]:
+            prompt = template.format(items=json.dumps(batch, ensure_ascii=False, indent=1))
+            response = self.call_api([{"role": "user", "content": prompt}],
+                                     max_tokens=max_tokens, retry_count=3)
+            data = self.parse_json_response(response, {})
+            translations = data.get('translations', []) if isinstance(data, dict) else []
+            return {
+                str(result.get('id')): result for result in translations
+                if isinstance(result, dict) and result.get('chinese_title') and result.get('summary')
+            }
+        
+        results: Dict[str, Dict] = {}
+        batch_results = self.run_parallel({str(i): (lambda b=b: translate(b)) for i, b in enumerate(batches)})
+        for batch_result in batch_results.values():
+            results.update(batch_result)
+        
+        missing = [entry for entry in entries if entry['id'] not in results]
+        self.logger.info(f"批量翻译: {len(entries)} 条英文新闻分 {len(batches)} 批, "
+                         f"{len(entries) - len(missing)} 条成功, {len(missing)} 条逐条补译")
+        if missing:
+            retried = self.run_parallel({
+                entry['id']: (lambda e=entry: self.translate_and_analyze(e['title'], e['content'], e['source']))
+                for entry in missing
+            })
+            results.update({news_id: result for news_id, result in retried.items() if result is not None})
+        return results
+    
+    def close(self):
+        """关闭线程池、响应缓存和网络会话"""
+        if getattr(self, '_executor', None) is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if getattr(self, 'response_cache', None) is not None:
+            self.response_cache.log_stats()
+            self.response_cache.close()
+            self.response_cache = None
         if hasattr(self, 'session'):
             self.session.close()
+    
+    def __del__(self):
+        """清理资源"""
+        self.close()
 
 
-def create_enhanced_glm_client(api_key: str) -> EnhancedGLMClient:
+def create_response_cache():
+    """
+    根据 CACHE_CONFIG 创建GLM响应缓存，未配置或不可用时返回None
+    """
+    try:
+        from config.glm_config import CACHE_CONFIG
+        from utils.llm_cache import LLMResponseCache
+        if not CACHE_CONFIG.get('llm_cache_path'):
+            return None
+        return LLMResponseCache(
+            CACHE_CONFIG['llm_cache_path'],
+            ttl=CACHE_CONFIG.get('llm_ttl', 24 * 3600),
+            max_entries=CACHE_CONFIG.get('llm_max_entries', 2000),
+            max_bytes=CACHE_CONFIG.get('llm_max_bytes', 50 * 1024 * 1024)
+        )
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"GLM响应缓存初始化失败，将直接调用API: {e}")
+        return None
+
+
+def create_enhanced_glm_client(api_key: str, bypass_cache: bool = None) -> EnhancedGLMClient:
     """
     创建增强版GLM客户端的工厂函数
     
     Args:
         api_key: GLM API密钥
+        bypass_cache: 是否跳过响应缓存强制重新生成，为None时读取环境变量 GLM_CACHE_BYPASS
         
     Returns:
         增强版GLM客户端实例
     """
+    try:
+        from config.glm_config import GLM_CONFIG, RETRY_CONFIG
+        max_concurrency = GLM_CONFIG.get('max_concurrency', 4)
+        retry_policy = RetryPolicy.from_config(RETRY_CONFIG)
+    except ImportError:
+        max_concurrency = 4
+        retry_policy = RetryPolicy()
+    
+    if bypass_cache is None:
+        bypass_cache = os.getenv('GLM_CACHE_BYPASS', '').lower() in ('1', 'true', 'yes')
+    
     return EnhancedGLMClient(
         api_key=api_key,
-        timeout=90  # 增加超时时间到90秒
+        timeout=90,  # 增加超时时间到90秒
+        max_concurrency=max_concurrency,
+        retry_policy=retry_policy,
+        response_cache=create_response_cache(),
+        bypass_cache=bypass_cache
     )
\ No newline at end of file
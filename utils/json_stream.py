@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+增量式JSON提取器
+从GLM输出（可能夹杂说明文字、```json代码块，或因 max_tokens 截断）中提取第一个完整的JSON对象或数组。
+单遍扫描，识别字符串和转义，支持分块输入（流式响应），
+输出被截断时可恢复到最后一个完整元素为止的部分结果
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+# JSON内需要关注的字符；字符串内只需关注引号和转义
+_STRUCTURE_RE = re.compile(r'[{}\[\]",]')
+_STRING_RE = re.compile(r'["\\]')
+_OPEN_RE = re.compile(r'[{\[]')
+_CLOSERS = {'{': '}', '[': ']'}
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+
+class JSONStreamExtractor:
+    """增量JSON提取器，feed 分块输入，complete 后 value 为完整结果"""
+
+    def __init__(self):
+        self.buffer = ''
+        self.value: Any = None
+        self.complete = False
+        # 可截断位置前进的次数，用于判断部分结果是否有更新
+        self.progress = 0
+        self._reset(0)
+
+    def _reset(self, position: int):
+        self._pos = position        # 下一个待扫描的位置
+        self._start = -1            # JSON起始位置
+        self._stack: List[str] = []  # 尚未闭合的容器对应的闭合符
+        self._in_string = False
+        self._escaped = False
+        # 最近一个可截断的位置及当时需要补齐的闭合符
+        self._safe_end = -1
+        self._safe_closers = ''
+
+    def feed(self, chunk: str) -> Optional[Any]:
+        """
+        输入一段文本
+
+        Args:
+            chunk: 新收到的文本
+
+        Returns:
+            JSON完整结束时返回解析结果，否则返回None
+        """
+        if self.complete:
+            return None
+        self.buffer += chunk
+        self._scan()
+        return self.value if self.complete else None
+
+    def _scan(self):
+        buffer = self.buffer
+        while not self.complete:
+            if self._start < 0:
+                match = _OPEN_RE.search(buffer, self._pos)
+                if not match:
+                    self._pos = len(buffer)
+                    return
+                self._start = match.start()
+                self._open(match.group(0), match.end())
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    if self._pos >= len(buffer):
+                        return
+                    self._escaped = False
+                    self._pos += 1
+                    continue
+                match = _STRING_RE.search(buffer, self._pos)
+                if not match:
+                    self._pos = len(buffer)
+                    return
+                self._pos = match.end()
+                if match.group(0) == '\\':
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                continue
+
+            match = _STRUCTURE_RE.search(buffer, self._pos)
+            if not match:
+                self._pos = len(buffer)
+                return
+            char = match.group(0)
+            self._pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in _CLOSERS:
+                self._open(char, self._pos)
+            elif char == ',':
+                self._mark_safe(match.start())
+            elif self._stack and char == self._stack[-1]:
+                self._stack.pop()
+                if self._stack:
+                    self._mark_safe(self._pos)
+                else:
+                    self._finish()
+            else:
+                # 括号不匹配，说明起点不是JSON（例如说明文字中的括号），从下一个位置重新查找
+                self._reset(self._start + 1)
+
+    def _open(self, char: str, end: int):
+        self._stack.append(_CLOSERS[char])
+        self._pos = end
+        self._mark_safe(end)
+
+    def _mark_safe(self, end: int):
+        """
+        记录可截断位置。数组中的对象视为不可分割的元素：
+        位于数组元素对象内部时不记录，部分结果中只出现完整的数组元素
+        """
+        in_array = False
+        for closer in self._stack:
+            if closer == ']':
+                in_array = True
+            elif in_array:
+                return
+        self._safe_end = end
+        self._safe_closers = ''.join(reversed(self._stack))
+        self.progress += 1
+
+    def _finish(self):
+        text = self.buffer[self._start:self._pos]
+        try:
+            self.value = json.loads(text)
+        except ValueError:
+            try:
+                # 模型常见的尾随逗号
+                self.value = json.loads(_TRAILING_COMMA_RE.sub(r'\1', text))
+            except ValueError:
+                self._reset(self._start + 1)
+                return
+        self.complete = True
+
+    def partial(self) -> Optional[Any]:
+        """
+        获取当前可用的结果：已完整时返回完整结果，否则补齐闭合符，
+        返回截至最后一个完整元素的部分结果；尚无可用内容时返回None
+        """
+        if self.complete:
+            return self.value
+        if self._start < 0 or self._safe_end < 0:
+            return None
+        try:
+            return json.loads(self.buffer[self._start:self._safe_end] + self._safe_closers)
+        except ValueError:
+            return None
+
+
+def extract_json(text: str) -> Optional[Any]:
+    """
+    从文本中提取JSON，输出被截断时返回部分结果
+
+    Args:
+        text: 模型输出
+
+    Returns:
+        解析结果，找不到JSON时返回None
+    """
+    extractor = JSONStreamExtractor()
+    extractor.feed(text)
+    return extractor.partial()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GLM响应持久化缓存
+以 (模型, 温度, 最大token数, 提示词SHA-256) 为键把成功的响应保存到SQLite，
+同一天重跑报告时相同提示词直接复用上一次的结果
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+from src.utils.disk_cache import SQLiteCache
+
+
+class LLMResponseCache:
+    """GLM响应缓存"""
+
+    def __init__(self, db_path: str = 'output/cache/llm_responses.sqlite3', ttl: float = 24 * 3600,
+                 max_entries: int = 2000, max_bytes: int = 50 * 1024 * 1024):
+        """
+        初始化响应缓存
+
+        Args:
+            db_path: SQLite数据库文件路径
+            ttl: 响应有效期（秒）
+            max_entries: 最大条目数
+            max_bytes: 缓存响应总大小上限（字节）
+        """
+        self.cache = SQLiteCache(db_path, ttl=ttl, max_entries=max_entries,
+                                 name="GLM响应缓存", max_bytes=max_bytes)
+
+    @staticmethod
+    def key_for(model: str, temperature: float, max_tokens: int, messages: List[Dict]) -> str:
+        """
+        生成缓存键
+
+        Args:
+            model: 模型名称
+            temperature: 温度参数
+            max_tokens: 最大token数
+            messages: 消息列表（整体序列化后计算SHA-256）
+
+        Returns:
+            缓存键
+        """
+        prompt = json.dumps(messages, ensure_ascii=False, sort_keys=True)
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return f"{model}|{temperature}|{max_tokens}|{digest}"
+
+    def get(self, model: str, temperature: float, max_tokens: int, messages: List[Dict]) -> Optional[str]:
+        """读取缓存的响应内容，不存在或已过期时返回None"""
+        return self.cache.get(self.key_for(model, temperature, max_tokens, messages))
+
+    def set(self, model: str, temperature: float, max_tokens: int, messages: List[Dict], content: str):
+        """保存响应内容"""
+        if content:
+            self.cache.set(self.key_for(model, temperature, max_tokens, messages), content)
+
+    def stats(self) -> dict:
+        """获取命中统计"""
+        return self.cache.stats()
+
+    def log_stats(self):
+        """将命中统计写入运行日志"""
+        self.cache.log_stats()
+
+    def close(self):
+        """关闭数据库连接"""
+        self.cache.close()
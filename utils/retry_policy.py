@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+统一的重试与退避策略
+带随机抖动的指数退避，遵守服务端 Retry-After，并同时限制单次调用和整个运行的总耗时，
+所有重试次数和等待时间汇总到 metrics 中
+"""
+
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析 Retry-After 响应头（秒数或HTTP日期）
+
+    Args:
+        value: 响应头的值
+
+    Returns:
+        需要等待的秒数，无法解析时返回None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class RetryPolicy:
+    """重试策略，一个实例对应一次运行，可在多个线程间共享"""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 2.0, max_delay: float = 30.0,
+                 call_budget: float = 150.0, run_budget: float = 600.0,
+                 retry_statuses=RETRYABLE_STATUSES):
+        """
+        初始化重试策略
+
+        Args:
+            max_attempts: 单次调用的最大尝试次数（含首次）
+            base_delay: 退避基准时间（秒），第n次重试的等待上限为 base_delay * 2^(n-1)
+            max_delay: 单次退避等待上限（秒）
+            call_budget: 单次调用（含所有重试和等待）的总时间预算（秒）
+            run_budget: 整个运行中所有调用的总时间预算（秒），从第一次调用开始计时
+            retry_statuses: 需要重试的HTTP状态码
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.call_budget = call_budget
+        self.run_budget = run_budget
+        self.retry_statuses = frozenset(retry_statuses)
+        self._run_started: Optional[float] = None
+        self._lock = threading.Lock()
+        self.metrics = {
+            'calls': 0,
+            'attempts': 0,
+            'retries': 0,
+            'retry_after_honored': 0,
+            'budget_exhausted': 0,
+            'failures': 0,
+            'sleep_seconds': 0.0
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'RetryPolicy':
+        """
+        根据配置字典创建策略（键名与构造参数一致）
+
+        Args:
+            config: 如 config/glm_config.py 中的 RETRY_CONFIG
+
+        Returns:
+            RetryPolicy 实例
+        """
+        keys = ('max_attempts', 'base_delay', 'max_delay', 'call_budget', 'run_budget')
+        return cls(**{key: config[key] for key in keys if key in config})
+
+    def begin(self, max_retries: Optional[int] = None) -> 'RetryState':
+        """
+        开始一次调用
+
+        Args:
+            max_retries: 本次调用的重试次数上限（不超过策略的 max_attempts - 1）
+
+        Returns:
+            本次调用的重试状态
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._run_started is None:
+                self._run_started = now
+            self.metrics['calls'] += 1
+        attempts = self.max_attempts if max_retries is None else min(self.max_attempts, max_retries + 1)
+        return RetryState(self, now, attempts)
+
+    def run_deadline(self) -> float:
+        """整个运行的截止时间（monotonic时钟）"""
+        return (self._run_started or time.monotonic()) + self.run_budget
+
+    def is_retryable_status(self, status: int) -> bool:
+        return status in self.retry_statuses
+
+    def backoff(self, retry: int) -> float:
+        """第 retry 次重试的退避时间（完全随机抖动，避免并发调用同时重试）"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (retry - 1))))
+
+    def record(self, key: str, value=1):
+        with self._lock:
+            self.metrics[key] += value
+
+    def log_stats(self):
+        """输出重试统计"""
+        m = self.metrics
+        logger.info(f"🔁 GLM调用统计: {m['calls']} 次调用, {m['attempts']} 次请求, 重试 {m['retries']} 次 "
+                    f"(遵守Retry-After {m['retry_after_honored']} 次), 等待 {m['sleep_seconds']:.1f}秒, "
+                    f"预算耗尽 {m['budget_exhausted']} 次, 失败 {m['failures']} 次")
+
+
+class RetryState:
+    """单次调用的重试状态"""
+
+    def __init__(self, policy: RetryPolicy, started: float, max_attempts: int):
+        self.policy = policy
+        self.started = started
+        self.max_attempts = max_attempts
+        self.attempts = 0
+
+    def deadline(self) -> float:
+        return min(self.started + self.policy.call_budget, self.policy.run_deadline())
+
+    def remaining(self) -> float:
+        """本次调用剩余的时间预算（秒）"""
+        return max(self.deadline() - time.monotonic(), 0.0)
+
+    def attempt(self, timeout: float) -> Optional[float]:
+        """
+        登记一次请求尝试
+
+        Args:
+            timeout: 期望的请求超时时间（秒）
+
+        Returns:
+            不超过剩余预算的请求超时时间；预算已耗尽时返回None
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            self.policy.record('budget_exhausted')
+            self.policy.record('failures')
+            return None
+        self.attempts += 1
+        self.policy.record('attempts')
+        return min(timeout, remaining)
+
+    def next_delay(self, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        计算下一次重试前的等待时间
+
+        Args:
+            retry_after: 服务端返回的 Retry-After 响应头
+
+        Returns:
+            等待秒数；不应再重试（次数用尽或等待会超出预算）时返回None
+        """
+        if self.attempts >= self.max_attempts:
+            self.policy.record('failures')
+            return None
+
+        delay = parse_retry_after(retry_after)
+        honored = delay is not None
+        if not honored:
+            delay = self.policy.backoff(self.attempts)
+
+        if delay >= self.remaining():
+            self.policy.record('budget_exhausted')
+            self.policy.record('failures')
+            return None
+
+        self.policy.record('retries')
+        self.policy.record('sleep_seconds', delay)
+        if honored:
+            self.policy.record('retry_after_honored')
+        return delay
+
+    def fail(self):
+        """记录不可重试的失败"""
+        self.policy.record('failures')